@@ -1,4 +1,18 @@
-from .cli import main
+import sys
+
+from .daemon import forward
+
+
+def main() -> None:
+    # Forward to a running `python -m app daemon` when there is one; the
+    # full CLI (and the service behind it) is only imported otherwise.
+    code = forward(sys.argv[1:])
+    if code is None:
+        from .cli import main as cli_main
+
+        cli_main()
+    elif code:
+        sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+import bisect
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Ordinary samples closer than this (in block time) to an indexed one are
+# dropped: interpolation needs coverage, not density.
+SAMPLE_SPACING_SECONDS = 3600
+# Per-chain cap; past it the spacing doubles and the samples are re-thinned.
+MAX_SAMPLES_PER_CHAIN = 4096
+
+
+class BlockTimeIndex:
+    """Sparse per-chain (block_number, timestamp) samples used to seed and
+    short-circuit timestamp -> block lookups (`get_block_by_time`).
+
+    Only blocks at least `finality_depth` below the highest head seen for a
+    chain are indexed, so a sample never describes a block that could still
+    be reorged out. Timestamps are non-decreasing in block number, so one
+    block-sorted list per chain answers "nearest known blocks around time T"
+    by bisecting on timestamp.
+
+    The index stays sparse. A sample within `spacing_seconds` of an indexed
+    one is dropped, unless it is added `pinned`. Pinned samples are the
+    adjacent block pairs that answered a lookup, so repeating that lookup
+    needs no RPC. A chain over `max_samples` is re-thinned at double the
+    spacing. Pinned pairs survive re-thinning while they still fit.
+
+    Persistence follows `ContractCache`: best-effort load, atomic
+    tempfile + rename writes, disk errors swallowed. `flush()` writes only
+    when the kept samples changed since the last write.
+    """
+
+    def __init__(
+        self,
+        disk_path: Optional[Path] = None,
+        finality_depth: int = 64,
+        spacing_seconds: int = SAMPLE_SPACING_SECONDS,
+        max_samples: int = MAX_SAMPLES_PER_CHAIN,
+    ) -> None:
+        self._disk_path = Path(disk_path) if disk_path else None
+        self._finality_depth = max(0, int(finality_depth))
+        self._base_spacing = max(0, int(spacing_seconds))
+        self._max_samples = max(2, int(max_samples))
+        self._blocks: Dict[str, List[int]] = {}
+        self._timestamps: Dict[str, List[int]] = {}
+        self._spacing: Dict[str, int] = {}
+        self._heads: Dict[str, int] = {}
+        # Monotonic time each head was last confirmed in this process.
+        self._head_seen: Dict[str, float] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._load_from_disk()
+
+    def record_head(self, chain_id: str, block_number: int) -> None:
+        with self._lock:
+            # Not a reason to rewrite the file on its own; the head is
+            # persisted with the next sample change.
+            if block_number >= self._heads.get(chain_id, -1):
+                self._heads[chain_id] = block_number
+                self._head_seen[chain_id] = time.monotonic()
+
+    def head(self, chain_id: str, max_age: Optional[float] = None) -> Optional[int]:
+        """Highest head seen for the chain. With `max_age`, only a head
+        confirmed in this process within the last `max_age` seconds."""
+        with self._lock:
+            if max_age is not None:
+                seen = self._head_seen.get(chain_id)
+                if seen is None or time.monotonic() - seen > max_age:
+                    return None
+            return self._heads.get(chain_id)
+
+    def add_many(self, chain_id: str, samples: Iterable[Tuple[int, int]], pinned: bool = False) -> None:
+        """Index final `(block_number, timestamp)` samples; others are ignored.
+        Unpinned samples are thinned to the chain's spacing."""
+        with self._lock:
+            head = self._heads.get(chain_id)
+            if head is None:
+                return
+            limit = head - self._finality_depth
+            spacing = 0 if pinned else self._spacing.get(chain_id, self._base_spacing)
+            blocks = self._blocks.setdefault(chain_id, [])
+            timestamps = self._timestamps.setdefault(chain_id, [])
+            for block_number, timestamp in samples:
+                if block_number > limit:
+                    continue
+                idx = bisect.bisect_left(blocks, block_number)
+                if idx < len(blocks) and blocks[idx] == block_number:
+                    continue
+                if spacing and (
+                    (idx > 0 and timestamp - timestamps[idx - 1] < spacing)
+                    or (idx < len(blocks) and timestamps[idx] - timestamp < spacing)
+                ):
+                    continue
+                blocks.insert(idx, block_number)
+                timestamps.insert(idx, timestamp)
+                self._dirty = True
+            if len(blocks) > self._max_samples:
+                self._thin(chain_id)
+
+    def _thin(self, chain_id: str) -> None:
+        """Double the chain's spacing and re-filter until under the cap; keep
+        adjacent (pinned) pairs unless they alone exceed it."""
+        blocks, timestamps = self._blocks[chain_id], self._timestamps[chain_id]
+        spacing = max(1, self._spacing.get(chain_id, self._base_spacing))
+        keep_pairs = True
+        while len(blocks) > self._max_samples:
+            spacing *= 2
+            kept_blocks: List[int] = []
+            kept_timestamps: List[int] = []
+            for i, (block_number, timestamp) in enumerate(zip(blocks, timestamps)):
+                paired = keep_pairs and (
+                    (i > 0 and blocks[i - 1] == block_number - 1)
+                    or (i + 1 < len(blocks) and blocks[i + 1] == block_number + 1)
+                )
+                if paired or not kept_timestamps or timestamp - kept_timestamps[-1] >= spacing:
+                    kept_blocks.append(block_number)
+                    kept_timestamps.append(timestamp)
+            if len(kept_blocks) == len(blocks):
+                keep_pairs = False  # only pairs left to drop
+            blocks, timestamps = kept_blocks, kept_timestamps
+        self._blocks[chain_id], self._timestamps[chain_id] = blocks, timestamps
+        self._spacing[chain_id] = spacing
+        self._dirty = True
+
+    def bracket(
+        self, chain_id: str, target: int, inclusive: bool
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """Nearest indexed samples around `target`: `lo` is the last sample
+        with timestamp <= target (< target when not `inclusive`), `hi` the
+        sample right after it. Either side may be None."""
+        with self._lock:
+            blocks = self._blocks.get(chain_id) or []
+            timestamps = self._timestamps.get(chain_id) or []
+            if inclusive:
+                hi_idx = bisect.bisect_right(timestamps, target)
+            else:
+                hi_idx = bisect.bisect_left(timestamps, target)
+            lo = (blocks[hi_idx - 1], timestamps[hi_idx - 1]) if hi_idx > 0 else None
+            hi = (blocks[hi_idx], timestamps[hi_idx]) if hi_idx < len(blocks) else None
+            return lo, hi
+
+    def size(self, chain_id: str) -> int:
+        with self._lock:
+            return len(self._blocks.get(chain_id) or [])
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty or not self._disk_path:
+                return
+            payload = {
+                chain_id: {
+                    "head": self._heads.get(chain_id),
+                    "samples": [[b, t] for b, t in zip(self._blocks.get(chain_id) or [], self._timestamps.get(chain_id) or [])],
+                }
+                for chain_id in set(self._heads) | set(self._blocks)
+            }
+            try:
+                self._disk_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_fd, tmp_path = tempfile.mkstemp(
+                    prefix=self._disk_path.name + ".",
+                    suffix=".tmp",
+                    dir=str(self._disk_path.parent),
+                )
+                try:
+                    with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                        json.dump(payload, f, separators=(",", ":"))
+                    os.replace(tmp_path, self._disk_path)
+                except Exception:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+            except (OSError, TypeError):
+                return
+            self._dirty = False
+
+    def _load_from_disk(self) -> None:
+        if not self._disk_path:
+            return
+        try:
+            with open(self._disk_path, "r", encoding="utf-8") as f:
+                loaded: Any = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return
+        if not isinstance(loaded, dict):
+            return
+        for chain_id, entry in loaded.items():
+            if not isinstance(entry, dict):
+                continue
+            head = entry.get("head")
+            if isinstance(head, int):
+                self._heads[chain_id] = head
+            pairs = sorted(
+                (b, t)
+                for b, t in (s for s in entry.get("samples") or [] if isinstance(s, list) and len(s) == 2)
+                if isinstance(b, int) and isinstance(t, int)
+            )
+            self._blocks[chain_id] = [b for b, _ in pairs]
+            self._timestamps[chain_id] = [t for _, t in pairs]
+            if len(pairs) > self._max_samples:
+                self._thin(chain_id)  # e.g. a file written before the cap existed
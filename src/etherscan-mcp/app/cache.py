@@ -1,15 +1,20 @@
+import gzip
+import hashlib
 import json
 import os
 import tempfile
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .metrics import record_cache
+
 
 class ContractCache:
     """In-memory cache keyed by address+network, with optional JSON disk
     persistence so per-(chain, address) lookups (token symbol/decimals/name,
-    contract names) survive process restarts.
+    contract names, contract creation info) survive process restarts.
 
     Persistence is best-effort: load failures (corrupt JSON, missing dir)
     silently fall back to an empty cache; write failures are silently swallowed
@@ -21,8 +26,13 @@ class ContractCache:
     workers in `get_transaction_summary`) can safely share an instance.
     """
 
-    def __init__(self, disk_path: Optional[Path] = None) -> None:
+    def __init__(self, disk_path: Optional[Path] = None, name: str = "contract") -> None:
+        # Label for cache hit/miss metrics.
+        self.name = name
         self._memory: Dict[str, Dict[str, Any]] = {}
+        # Keys held in memory only (set with persist=False), e.g. data from
+        # blocks that could still be reorged out.
+        self._volatile: set = set()
         self._lock = threading.RLock()
         self._disk_path = Path(disk_path) if disk_path else None
         self._load_from_disk()
@@ -33,13 +43,35 @@ class ContractCache:
     def get(self, address: str, network: str) -> Optional[Dict[str, Any]]:
         key = self._key(address, network)
         with self._lock:
-            return self._memory.get(key)
+            value = self._memory.get(key)
+        record_cache(self.name, value is not None)
+        return value
 
-    def set(self, address: str, network: str, data: Dict[str, Any]) -> None:
+    def set(self, address: str, network: str, data: Dict[str, Any], persist: bool = True) -> None:
         key = self._key(address, network)
         with self._lock:
             self._memory[key] = data
-            self._flush_to_disk()
+            if persist:
+                self._volatile.discard(key)
+                self._flush_to_disk()
+            else:
+                self._volatile.add(key)
+
+    def set_many(self, entries: Dict[str, Dict[str, Any]], network: str, persist: bool = True) -> None:
+        """Store several `address -> data` entries with a single disk flush
+        (bulk lookups would otherwise rewrite the whole file once per entry)."""
+        if not entries:
+            return
+        with self._lock:
+            for address, data in entries.items():
+                key = self._key(address, network)
+                self._memory[key] = data
+                if persist:
+                    self._volatile.discard(key)
+                else:
+                    self._volatile.add(key)
+            if persist:
+                self._flush_to_disk()
 
     def _load_from_disk(self) -> None:
         if not self._disk_path:
@@ -72,7 +104,8 @@ class ContractCache:
             )
             try:
                 with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-                    json.dump(self._memory, f, separators=(",", ":"))
+                    persisted = {k: v for k, v in self._memory.items() if k not in self._volatile}
+                    json.dump(persisted, f, separators=(",", ":"))
                 os.replace(tmp_path, self._disk_path)
             except Exception:
                 # Cleanup the tempfile if rename failed.
@@ -85,3 +118,87 @@ class ContractCache:
             # Disk full / permission denied / non-JSON-serializable value.
             # Fall back to memory-only for this entry; don't break the request.
             return
+
+
+class BlobCache:
+    """Key -> JSON value store for immutable blobs (finalized tx + receipt,
+    computed tx summaries). Unlike `ContractCache`, which rewrites one JSON
+    file per flush, every entry is its own gzip-compressed file under `root`
+    (sharded by the first two hex chars of sha256(key)), so writes stay O(1)
+    as the store grows into the tens of thousands of entries.
+
+    A small in-memory LRU of serialized JSON sits in front of the disk; `get`
+    always returns a freshly decoded value, so callers may mutate it. Same
+    best-effort rules as `ContractCache`: unreadable files are misses, write
+    failures are swallowed, writes are atomic via tempfile + rename.
+    `root=None` keeps the store memory-only.
+    """
+
+    def __init__(self, root: Optional[Path] = None, memory_entries: int = 1024, name: str = "blob") -> None:
+        self.name = name
+        self._root = Path(root) if root else None
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_entries = max(0, int(memory_entries))
+        self._lock = threading.RLock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._root / digest[:2] / f"{digest}.json.gz"  # type: ignore[operator]
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._get(key)
+        record_cache(self.name, value is not None)
+        return value
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+        if text is None and self._root:
+            try:
+                with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                    text = f.read()
+            except (OSError, EOFError, UnicodeDecodeError):
+                return None
+            self._remember(key, text)
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            text = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        self._remember(key, text)
+        if not self._root:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+            try:
+                with os.fdopen(tmp_fd, "wb") as f:
+                    f.write(gzip.compress(text.encode("utf-8"), compresslevel=6))
+                os.replace(tmp_path, path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return
+
+    def _remember(self, key: str, text: str) -> None:
+        if not self._memory_entries:
+            return
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import json
+import os
 import re
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 _WORD_RE = re.compile(r"[a-z0-9]+")
 _SPACE_RE = re.compile(r"[\s_\-]+")
 
+SNAPSHOT_VERSION = 1
+# After a failed background refresh, keep serving the stale list and retry
+# no sooner than this.
+REFRESH_RETRY_SECONDS = 60.0
+# Distinct network strings whose resolution is memoized (per registry).
+RESOLVE_MEMO_ENTRIES = 256
+# Substring lookups use an index of every 1..NGRAM_SIZE-char substring of the
+# index keys; longer queries intersect the keys of their NGRAM_SIZE-grams.
+NGRAM_SIZE = 3
+
 
 def _norm(text: str) -> str:
     candidate = (text or "").strip().lower()
@@ -43,6 +59,11 @@ class ChainRegistry:
     """
     Dynamic chain registry backed by Etherscan V2 /v2/chainlist.
     - Caches list in-memory with TTL.
+    - Optionally persists the list and its name index to `snapshot_path`, so
+      a new process resolves chain names without a fetch (and with the
+      network down). Stale-while-revalidate: once a list is loaded, an
+      expired TTL triggers a background refresh and the stale list keeps
+      answering; only a registry with no list at all fetches synchronously.
     - Resolves network input by chainid or (fuzzy) chainname/slug/aliases.
     """
 
@@ -51,6 +72,7 @@ class ChainRegistry:
         client: Any,
         chainlist_url: str,
         ttl_seconds: int = 3600,
+        snapshot_path: Optional[Path] = None,
     ) -> None:
         self._client = client
         self._chainlist_url = (chainlist_url or "").rstrip("/")
@@ -58,6 +80,19 @@ class ChainRegistry:
         self._loaded_at: float = 0.0
         self._chains: Dict[str, ChainInfo] = {}
         self._index: Dict[str, List[str]] = {}  # key -> [chainid,...]
+        # Derived from `_index` by `_rebuild_index`: every prefix of every key
+        # -> chainids under it (a flattened prefix trie), and every n-gram ->
+        # keys containing it.
+        self._prefixes: Dict[str, Set[str]] = {}
+        self._ngrams: Dict[str, Set[str]] = {}
+        # raw network string -> resolve() result; cleared with the index.
+        self._memo: "OrderedDict[str, Tuple[str, str, Dict[str, Any]]]" = OrderedDict()
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        # Guards swapping `_chains` / `_index` against readers in `resolve`,
+        # and the single background-refresh slot.
+        self._lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._retry_at: float = 0.0
 
         self._alias: Dict[str, str] = {
             "eth": "ethereum mainnet",
@@ -76,13 +111,44 @@ class ChainRegistry:
             "arbitrum sepolia": "arbitrum sepolia",
         }
 
+        self._load_snapshot()
+
     def _expired(self) -> bool:
         return (time.time() - self._loaded_at) > self._ttl or not self._chains
 
     def refresh(self, force: bool = False) -> None:
         if not force and not self._expired():
             return
+        if not force and self._chains:
+            if time.time() >= self._retry_at:
+                self._refresh_in_background()
+            return
+        self._fetch()
 
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        """Block until an in-flight background refresh finishes (or `timeout`)."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            # Daemon thread: a one-shot CLI waits for it only briefly (see
+            # `wait_for_refresh`), it never holds the process open.
+            thread = threading.Thread(target=self._background_fetch, name="chainlist-refresh", daemon=True)
+            self._refresh_thread = thread
+        thread.start()
+
+    def _background_fetch(self) -> None:
+        try:
+            self._fetch()
+        except Exception:
+            # Keep serving the stale list; a later call retries.
+            self._retry_at = time.time() + REFRESH_RETRY_SECONDS
+
+    def _fetch(self) -> None:
         if not self._chainlist_url:
             raise ValueError("chainlist_url is empty.")
 
@@ -115,11 +181,88 @@ class ChainRegistry:
         if not chains:
             raise ValueError("chainlist returned empty or unparseable chain set.")
 
-        self._chains = chains
-        self._rebuild_index()
-        self._loaded_at = time.time()
+        with self._lock:
+            self._chains = chains
+            self._rebuild_index()
+            self._loaded_at = time.time()
+        self._save_snapshot()
+
+    def _load_snapshot(self) -> None:
+        """Best-effort: a missing, corrupt or foreign snapshot is ignored."""
+        if not self._snapshot_path:
+            return
+        try:
+            with open(self._snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if (
+                not isinstance(snapshot, dict)
+                or snapshot.get("version") != SNAPSHOT_VERSION
+                or snapshot.get("chainlist_url") != self._chainlist_url
+            ):
+                return
+            chains = {str(row["chainid"]): ChainInfo(**row) for row in snapshot["chains"]}
+            fetched_at = float(snapshot["fetched_at"])
+            index = snapshot.get("index")
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if not chains:
+            return
+        with self._lock:
+            self._chains = chains
+            if isinstance(index, dict) and all(isinstance(ids, list) for ids in index.values()):
+                self._rebuild_index(index)
+            else:
+                self._rebuild_index()
+            self._loaded_at = fetched_at
+
+    def _save_snapshot(self) -> None:
+        """Atomic (tempfile + rename) and best-effort, like `ContractCache`."""
+        if not self._snapshot_path:
+            return
+        with self._lock:
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "chainlist_url": self._chainlist_url,
+                "fetched_at": self._loaded_at,
+                "chains": [asdict(info) for info in self._chains.values()],
+                "index": self._index,
+            }
+        path = self._snapshot_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+            try:
+                with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return
+
+    def _rebuild_index(self, idx: Optional[Dict[str, List[str]]] = None) -> None:
+        """Build the name index from `_chains` (or take a persisted one), then
+        the prefix / n-gram tables `resolve` searches. Caller holds `_lock`."""
+        if idx is None:
+            idx = self._build_name_index()
+        prefixes: Dict[str, Set[str]] = {}
+        ngrams: Dict[str, Set[str]] = {}
+        for key, ids in idx.items():
+            for end in range(1, len(key) + 1):
+                prefixes.setdefault(key[:end], set()).update(ids)
+            for size in range(1, NGRAM_SIZE + 1):
+                for start in range(len(key) - size + 1):
+                    ngrams.setdefault(key[start : start + size], set()).add(key)
+        self._index = idx
+        self._prefixes = prefixes
+        self._ngrams = ngrams
+        self._memo.clear()
 
-    def _rebuild_index(self) -> None:
+    def _build_name_index(self) -> Dict[str, List[str]]:
         idx: Dict[str, List[str]] = {}
 
         def add(key: str, chainid: str) -> None:
@@ -141,7 +284,7 @@ class ChainRegistry:
                 add(" ".join(tokens2), cid)
                 add("-".join(tokens2), cid)
 
-        self._index = idx
+        return idx
 
     def list_chains(self, include_degraded: bool = True) -> List[Dict[str, Any]]:
         self.refresh()
@@ -185,37 +328,52 @@ class ChainRegistry:
 
         self.refresh()
 
-        q = _norm(raw)
-        q = _norm(self._alias.get(q, q))
-
+        with self._lock:
+            memo = self._memo.get(raw)
+            if memo is None:
+                q = _norm(raw)
+                q = _norm(self._alias.get(q, q))
+                memo = self._lookup(raw, q)
+                self._memo[raw] = memo
+                while len(self._memo) > RESOLVE_MEMO_ENTRIES:
+                    self._memo.popitem(last=False)
+            else:
+                self._memo.move_to_end(raw)
+        label, cid, meta = memo
+        return label, cid, dict(meta)
+
+    def _lookup(self, raw: str, q: str) -> Tuple[str, str, Dict[str, Any]]:
         exact = self._index.get(q)
         if exact:
             return self._pick_or_raise(q, exact, matched_by="exact")
 
-        candidates: List[Tuple[int, str]] = []
-        for key, ids in self._index.items():
-            if key.startswith(q):
-                for cid in ids:
-                    candidates.append((80, cid))
-                continue
-            if q in key:
-                for cid in ids:
-                    candidates.append((50, cid))
+        # Keys starting with q score 80, keys only containing it 50.
+        best: Dict[str, int] = {}
+        for key in self._keys_containing(q):
+            for cid in self._index[key]:
+                best[cid] = 50
+        for cid in self._prefixes.get(q, ()):
+            best[cid] = 80
 
-        if not candidates:
+        if not best:
             raise ValueError(
                 f"Unknown network '{raw}'. Try numeric chainid (e.g. 42161) or call list-chains/list_chains."
             )
 
-        best: Dict[str, int] = {}
-        for score, cid in candidates:
-            best[cid] = max(best.get(cid, 0), score)
-
         ranked = sorted(best.items(), key=lambda x: (-x[1], int(x[0])))
         top_score = ranked[0][1]
         top = [cid for cid, score in ranked if score == top_score]
         return self._pick_or_raise(q, top, matched_by="fuzzy")
 
+    def _keys_containing(self, q: str) -> Set[str]:
+        if len(q) <= NGRAM_SIZE:
+            return self._ngrams.get(q, set())
+        grams = sorted(
+            (self._ngrams.get(q[start : start + NGRAM_SIZE], set()) for start in range(len(q) - NGRAM_SIZE + 1)),
+            key=len,
+        )
+        return {key for key in grams[0].intersection(*grams[1:]) if q in key}
+
     def _pick_or_raise(
         self, q: str, chainids: List[str], matched_by: str
     ) -> Tuple[str, str, Dict[str, Any]]:
@@ -2,30 +2,44 @@ import argparse
 import json
 import re
 import sys
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
 
-from .config import load_config
-from .service import ContractService
+from . import daemon
+from .config import Config, load_config
+from .export import EXPORT_FORMATS, export_result
+from .jsoncodec import dumps
+from .records import jsonable
+
+if TYPE_CHECKING:
+    from .service import ContractService
 
 # RPC_URL_<chainid> 常内嵌 api-key(Alchemy / drpc 等)。错误信息原样打印完整
 # URL 会把 key 带进 stderr / 日志 / transcript,截到 scheme://host、其余换 /***。
 _URL_RE = re.compile(r"(https?://)(?:[^@/\s?#]+@)?([^/\s?#]+)[^\s]*")
 
+# How long a one-shot CLI run waits, after printing, for a background
+# chainlist refresh to finish and persist its snapshot.
+_BACKGROUND_GRACE_SECONDS = 5.0
+
 
 def _redact_secrets(text: str) -> str:
     return _URL_RE.sub(r"\1\2/***", text)
 
 _ENV_EPILOG = """\
 environment:
-  ETHERSCAN_API_KEY        required. Etherscan V2 API key.
+  ETHERSCAN_API_KEY        required (except for keccak / encode-function-data / convert / stats). Etherscan V2 API key.
   NETWORK                  default network name/alias or numeric chainid (default mainnet).
   CHAIN_ID                 explicit chainid override (beats NETWORK).
   RPC_URL                  default JSON-RPC endpoint for eth_call / storage / logs.
   RPC_URL_<chainid>        per-chain JSON-RPC endpoint, e.g. RPC_URL_1, RPC_URL_56.
   ETHERSCAN_MCP_CACHE_DIR  token/contract metadata cache dir (default ~/.cache/etherscan-mcp).
+  ETHERSCAN_MCP_JSON       set to "stdlib" to skip the optional orjson backend.
+  ETHERSCAN_MCP_SOCKET     daemon socket path; ETHERSCAN_MCP_NO_DAEMON=1 never forwards to a daemon.
 
 Full variable list and parameter semantics: README.md in the repo root.
-All commands print JSON to stdout; errors go to stderr with exit code 1.
+All commands print JSON to stdout (--stream commands print NDJSON, --compact-output prints
+single-line JSON); errors go to stderr with exit code 1;
+--output-format csv|parquet|arrow / --out write series, logs, transfers and transactions as typed files.
 """
 
 
@@ -67,6 +81,17 @@ def _add_paging(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--sort", choices=["asc", "desc"], help="Sort order by block number.")
 
 
+def _add_output_format(parser: argparse.ArgumentParser, kind: str) -> None:
+    parser.add_argument(
+        "--output-format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="json (default, stdout), csv, parquet, or arrow (Arrow IPC file). parquet/arrow need pyarrow and --out.",
+    )
+    parser.add_argument("--out", help="Write the result to this file instead of stdout; prints a summary.")
+    parser.set_defaults(export_kind=kind)
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="etherscan",
@@ -79,6 +104,11 @@ def _build_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         allow_abbrev=False,
     )
+    parser.add_argument(
+        "--compact-output",
+        action="store_true",
+        help="Print single-line JSON instead of indented JSON (smaller and faster for large results).",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     fetch_parser = subparsers.add_parser(
@@ -129,15 +159,53 @@ def _build_parser() -> argparse.ArgumentParser:
     _add_network(creation_parser)
     creation_parser.set_defaults(run=lambda svc, a: svc.get_contract_creation(a.address, a.network))
 
+    creations_parser = subparsers.add_parser(
+        "get-contract-creations",
+        help="Fetch creation info for many contracts (5 addresses per Etherscan request)",
+        description=(
+            "Bulk get-contract-creation: cached addresses served locally, the rest sent to Etherscan "
+            "getcontractcreation 5 per request; addresses Etherscan can't answer fall back to RPC one by one. "
+            "Per-address failures are reported under errors."
+        ),
+    )
+    creations_parser.add_argument(
+        "--addresses",
+        required=True,
+        type=lambda raw: _json_array(raw, "--addresses"),
+        help="JSON array of contract addresses, e.g. '[\"0x...\", \"0x...\"]'.",
+    )
+    _add_network(creations_parser)
+    creations_parser.set_defaults(run=lambda svc, a: svc.get_contract_creations(a.addresses, a.network))
+
     proxy_parser = subparsers.add_parser(
         "detect-proxy",
-        help="Detect proxy implementation/admin via EIP-1967 slots",
-        description="Detect proxy implementation/admin by reading EIP-1967 storage slots.",
+        help="Detect proxy implementation/admin/beacon (EIP-1967, EIP-1822, zos, EIP-1167)",
+        description=(
+            "Detect proxy implementation/admin by reading EIP-1967 implementation/admin/beacon, legacy "
+            "OpenZeppelin and EIP-1822 PROXIABLE storage slots, plus EIP-1167 minimal proxy bytecode."
+        ),
     )
     proxy_parser.add_argument("--address", required=True, help="Contract address (0x-prefixed).")
     _add_network(proxy_parser)
     proxy_parser.set_defaults(run=lambda svc, a: svc.detect_proxy(a.address, a.network))
 
+    proxies_parser = subparsers.add_parser(
+        "detect-proxies",
+        help="detect-proxy for many addresses in one batched round trip",
+        description=(
+            "Bulk detect-proxy: every slot + code read for every address in one JSON-RPC batch "
+            "(concurrent Etherscan proxy requests without RPC), beacons resolved in a second batch."
+        ),
+    )
+    proxies_parser.add_argument(
+        "--addresses",
+        required=True,
+        type=lambda raw: _json_array(raw, "--addresses"),
+        help="JSON array of contract addresses, e.g. '[\"0x...\", \"0x...\"]'.",
+    )
+    _add_network(proxies_parser)
+    proxies_parser.set_defaults(run=lambda svc, a: svc.detect_proxies(a.addresses, a.network))
+
     txs_parser = subparsers.add_parser(
         "list-transactions",
         help="List normal transactions for an address",
@@ -146,6 +214,7 @@ def _build_parser() -> argparse.ArgumentParser:
     txs_parser.add_argument("--address", required=True, help="Account or contract address (0x-prefixed).")
     _add_network(txs_parser)
     _add_paging(txs_parser)
+    _add_output_format(txs_parser, "transactions")
     txs_parser.set_defaults(
         run=lambda svc, a: svc.list_transactions(
             a.address, a.network, a.start_block, a.end_block, a.page, a.offset, a.sort
@@ -166,6 +235,7 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Token standard to list. Defaults to erc20.",
     )
     _add_paging(transfers_parser)
+    _add_output_format(transfers_parser, "transfers")
     transfers_parser.set_defaults(
         run=lambda svc, a: svc.list_token_transfers(
             a.address, a.network, a.token_type, a.start_block, a.end_block, a.page, a.offset, a.sort
@@ -192,11 +262,22 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     logs_parser.add_argument("--from-block", type=_block_value, help="Start block: decimal, 0x hex, or latest.")
     logs_parser.add_argument("--to-block", type=_block_value, help="End block: decimal, 0x hex, or latest.")
+    logs_parser.add_argument("--from-time", help="Start time instead of --from-block: unix seconds or ISO 8601.")
+    logs_parser.add_argument("--to-time", help="End time instead of --to-block: unix seconds or ISO 8601.")
     logs_parser.add_argument("--page", type=int, help="Page number (1-based).")
     logs_parser.add_argument("--offset", type=int, help="Rows per page.")
+    _add_output_format(logs_parser, "logs")
     logs_parser.set_defaults(
         run=lambda svc, a: svc.query_logs(
-            a.address, a.network, a.topics, a.from_block, a.to_block, a.page, a.offset
+            a.address,
+            a.network,
+            a.topics,
+            a.from_block,
+            a.to_block,
+            a.page,
+            a.offset,
+            a.from_time,
+            a.to_time,
         )
     )
 
@@ -258,14 +339,21 @@ def _build_parser() -> argparse.ArgumentParser:
             "Requires RPC_URL_<chainid> backed by an archive node.\n"
             "Example:\n"
             "  call-function-series --address 0xdAC1... --function 'totalSupply()' \\\n"
-            "      --from-block 20000000 --to-block 20001000 --stride 100 --decimals 6"
+            "      --from-block 20000000 --to-block 20001000 --stride 100 --decimals 6\n"
+            "  call-function-series --address 0xdAC1... --function 'totalSupply()' \\\n"
+            "      --from-time 2024-01-01 --to-time 2024-02-01 --interval daily --decimals 6"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     series_parser.add_argument("--address", required=True, help="Contract address (0x-prefixed).")
-    series_parser.add_argument("--from-block", required=True, type=_block_value, help="Start block: decimal, 0x hex, or latest.")
-    series_parser.add_argument("--to-block", required=True, type=_block_value, help="End block: decimal, 0x hex, or latest.")
+    series_parser.add_argument("--from-block", type=_block_value, help="Start block: decimal, 0x hex, or latest.")
+    series_parser.add_argument("--to-block", type=_block_value, help="End block: decimal, 0x hex, or latest.")
     series_parser.add_argument("--stride", type=int, default=1, help="Sample every N blocks. Defaults to 1.")
+    series_parser.add_argument("--from-time", help="Start time instead of --from-block: unix seconds or ISO 8601.")
+    series_parser.add_argument("--to-time", help="End time instead of --to-block: unix seconds or ISO 8601.")
+    series_parser.add_argument(
+        "--interval", help="Time sampling interval: hourly, daily (default), weekly, or seconds."
+    )
     series_parser.add_argument("--data", help="Raw 0x call data (alternative to --function/--args).")
     _add_network(series_parser)
     series_parser.add_argument("--function", help="Function name or signature, e.g. totalSupply().")
@@ -280,6 +368,12 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Decimals hint for numeric outputs: int, JSON array, or JSON object.",
     )
     series_parser.add_argument("--batch-size", type=int, help="JSON-RPC batch size per request.")
+    series_parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Return one array per output field (static integer outputs only) instead of per-point rows.",
+    )
+    _add_output_format(series_parser, "series")
     series_parser.set_defaults(
         run=lambda svc, a: svc.call_function_series(
             a.address,
@@ -292,6 +386,10 @@ def _build_parser() -> argparse.ArgumentParser:
             a.args,
             a.decimals,
             a.batch_size,
+            a.from_time,
+            a.to_time,
+            a.interval,
+            a.columnar,
         )
     )
 
@@ -311,7 +409,7 @@ def _build_parser() -> argparse.ArgumentParser:
         type=lambda raw: _json_array(raw, "--args"),
         help="JSON array of function arguments.",
     )
-    encode_parser.set_defaults(run=lambda svc, a: svc.encode_function_data(a.function, a.args))
+    encode_parser.set_defaults(run=lambda svc, a: svc.encode_function_data(a.function, a.args), offline=True)
 
     keccak_parser = subparsers.add_parser(
         "keccak",
@@ -331,7 +429,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     keccak_parser.add_argument("--input-type", choices=["text", "hex", "bytes"], help="How to interpret values. Defaults to text.")
     keccak_parser.set_defaults(
-        run=lambda svc, a: svc.keccak(a.value[0] if len(a.value) == 1 else a.value, a.input_type)
+        run=lambda svc, a: svc.keccak(a.value[0] if len(a.value) == 1 else a.value, a.input_type),
+        offline=True,
     )
 
     tx_parser = subparsers.add_parser(
@@ -383,6 +482,58 @@ def _build_parser() -> argparse.ArgumentParser:
         )
     )
 
+    summaries_parser = subparsers.add_parser(
+        "get-transaction-summaries",
+        help="get-transaction-summary for many tx hashes in batched round trips",
+        description=(
+            "Bulk get-transaction-summary: tx + receipt for each batch in one JSON-RPC batch, token "
+            "metadata in one Multicall3 call, lookups shared across the whole run. Same flags as "
+            "get-transaction-summary. --stream prints one JSON summary per line (NDJSON) as each "
+            "batch completes instead of a single JSON document."
+        ),
+    )
+    summaries_parser.add_argument(
+        "--tx-hashes",
+        required=True,
+        type=lambda raw: _json_array(raw, "--tx-hashes"),
+        help="JSON array of transaction hashes, e.g. '[\"0x...\", \"0x...\"]'.",
+    )
+    _add_network(summaries_parser)
+    summaries_parser.add_argument(
+        "--no-decode-transfers",
+        action="store_true",
+        help="Skip ERC20 Transfer decoding and token metadata lookups.",
+    )
+    summaries_parser.add_argument(
+        "--no-annotate-contracts",
+        action="store_true",
+        help="Skip ContractName annotation lookups.",
+    )
+    summaries_parser.add_argument("--compact", action="store_true", help="Arbitrage-oriented compact digest.")
+    summaries_parser.add_argument(
+        "--flow-scope",
+        default="user",
+        choices=["user", "user_router", "all"],
+        help="Compact mode only: user keeps tx.from rows, user_router adds tx.to, all keeps every row.",
+    )
+    summaries_parser.add_argument("--batch-size", type=int, help="Tx hashes per round trip (default 50).")
+    summaries_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print one summary per line (NDJSON) as batches complete.",
+    )
+    summaries_parser.set_defaults(
+        run=lambda svc, a: (svc.iter_transaction_summaries if a.stream else svc.get_transaction_summaries)(
+            a.tx_hashes,
+            a.network,
+            not a.no_decode_transfers,
+            not a.no_annotate_contracts,
+            a.compact,
+            a.flow_scope,
+            a.batch_size,
+        )
+    )
+
     block_parser = subparsers.add_parser(
         "get-block",
         help="Fetch a block by number or latest",
@@ -402,6 +553,71 @@ def _build_parser() -> argparse.ArgumentParser:
         )
     )
 
+    blocks_parser = subparsers.add_parser(
+        "get-blocks",
+        help="Fetch a range of blocks in pipelined batches",
+        description=(
+            "Fetch blocks from --from-block to --to-block (inclusive, max 10000) as pipelined JSON-RPC "
+            "batches (concurrent Etherscan proxy requests without RPC). --header-only drops the tx list "
+            "and adds transaction_count. --stream prints one block per line (NDJSON) as batches complete."
+        ),
+    )
+    blocks_parser.add_argument("--from-block", required=True, type=_block_value, help="Start block: decimal or 0x hex.")
+    blocks_parser.add_argument("--to-block", required=True, type=_block_value, help="End block: decimal, 0x hex, or latest.")
+    _add_network(blocks_parser)
+    blocks_parser.add_argument("--header-only", action="store_true", help="Drop transactions; report transaction_count.")
+    blocks_parser.add_argument("--full-transactions", action="store_true", help="Return full transaction objects (may be large).")
+    blocks_parser.add_argument("--batch-size", type=int, help="Blocks per JSON-RPC batch (default 50).")
+    blocks_parser.add_argument("--stream", action="store_true", help="Print one block per line (NDJSON) as batches complete.")
+    blocks_parser.set_defaults(
+        run=lambda svc, a: (svc.iter_blocks if a.stream else svc.get_blocks)(
+            a.from_block, a.to_block, a.network, a.header_only, a.full_transactions, a.batch_size
+        )
+    )
+
+    block_summary_parser = subparsers.add_parser(
+        "get-block-summary",
+        help="Whole-block digest: per-tx compact summaries, block-wide ERC20 net flow, fees",
+        description=(
+            "Summarize a block in a few round trips (RPC required): compact get-transaction-summary "
+            "per tx, ERC20 net flow aggregated across the block and fee totals. Receipts via "
+            "eth_getBlockReceipts, falling back to batched eth_getTransactionReceipt."
+        ),
+    )
+    block_summary_parser.add_argument("--block", required=True, help="Block identifier: latest, decimal number, or 0x-prefixed hex.")
+    _add_network(block_summary_parser)
+    block_summary_parser.add_argument(
+        "--no-decode-transfers",
+        action="store_true",
+        help="Skip ERC20 Transfer decoding and token metadata lookups.",
+    )
+    block_summary_parser.add_argument(
+        "--annotate-contracts",
+        action="store_true",
+        help="Annotate addresses with verified ContractName (one Etherscan lookup per new address).",
+    )
+    block_summary_parser.add_argument(
+        "--flow-scope",
+        default="user",
+        choices=["user", "user_router", "all"],
+        help="user keeps tx senders' rows, user_router adds tx.to, all keeps every row.",
+    )
+    block_summary_parser.add_argument(
+        "--no-transactions",
+        action="store_true",
+        help="Omit per-tx digests; return only block-wide totals and flows.",
+    )
+    block_summary_parser.set_defaults(
+        run=lambda svc, a: svc.get_block_summary(
+            a.block,
+            a.network,
+            not a.no_decode_transfers,
+            a.annotate_contracts,
+            a.flow_scope,
+            not a.no_transactions,
+        )
+    )
+
     block_time_parser = subparsers.add_parser(
         "get-block-time",
         help="Fetch block timestamp by number or latest",
@@ -411,6 +627,22 @@ def _build_parser() -> argparse.ArgumentParser:
     _add_network(block_time_parser)
     block_time_parser.set_defaults(run=lambda svc, a: svc.get_block_time_by_number(a.block, a.network))
 
+    block_by_time_parser = subparsers.add_parser(
+        "get-block-by-time",
+        help="Find the block number at a timestamp",
+        description="Find the last block at/before (or first block at/after) a timestamp. Uses a batched interpolation search over RPC seeded from a persisted block-time index; falls back to Etherscan getblocknobytime without RPC.",
+    )
+    block_by_time_parser.add_argument(
+        "--timestamp", required=True, help="Unix seconds or ISO 8601 (e.g. 2024-01-01T00:00:00Z; naive = UTC)."
+    )
+    block_by_time_parser.add_argument(
+        "--closest", choices=["before", "after"], default="before", help="Block at/before (default) or at/after the timestamp."
+    )
+    _add_network(block_by_time_parser)
+    block_by_time_parser.set_defaults(
+        run=lambda svc, a: svc.get_block_by_time(a.timestamp, a.network, a.closest)
+    )
+
     chains_parser = subparsers.add_parser(
         "list-chains",
         help="List supported chains from Etherscan chainlist",
@@ -445,24 +677,86 @@ def _build_parser() -> argparse.ArgumentParser:
     convert_parser.add_argument("--to", required=True, dest="to_unit", help="Target unit: hex|dec|human|wei|gwei|eth.")
     convert_parser.add_argument("--decimals", type=lambda raw: _json_value(raw, "--decimals"), help="Token decimals. Defaults to 18.")
     convert_parser.set_defaults(
-        run=lambda svc, a: svc.convert(a.value, a.from_unit, a.to_unit, a.decimals)
+        run=lambda svc, a: svc.convert(a.value, a.from_unit, a.to_unit, a.decimals),
+        offline=True,
     )
 
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Serve CLI commands from one warm process over a Unix socket",
+        description=(
+            "Keep a warm service (HTTP sessions, caches, chainlist) behind a Unix socket. While it runs, other\n"
+            "`python -m app <subcommand>` calls with the same environment are forwarded to it instead of\n"
+            "starting from scratch. Set ETHERSCAN_MCP_NO_DAEMON=1 to bypass it.\n"
+            "Socket: ETHERSCAN_MCP_SOCKET, else $XDG_RUNTIME_DIR (or the temp dir)/etherscan-mcp-<uid>.sock."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    daemon_parser.add_argument("--socket", help="Socket path (overrides ETHERSCAN_MCP_SOCKET).")
+    daemon_parser.add_argument("--stop", action="store_true", help="Stop the daemon listening on the socket.")
+    daemon_parser.set_defaults(
+        run=lambda svc, a: daemon.stop(a.socket) if a.stop else daemon.serve(svc, a.socket)
+    )
+
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Show latency / retry / cache metrics of the running daemon",
+        description=(
+            "Read the metrics of the running daemon: per-tool and per-upstream-method latency (count, sum,\n"
+            "p50/p95/p99 estimated from histogram buckets), retries by reason, rate-limit hits, bytes\n"
+            "transferred and cache hit/miss counts with hit ratios. The MCP server exposes the same\n"
+            "metrics in Prometheus format at /metrics (SSE / streamable-HTTP transports)."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    stats_parser.add_argument("--socket", help="Socket path (overrides ETHERSCAN_MCP_SOCKET).")
+    stats_parser.set_defaults(run=lambda svc, a: daemon.stats(a.socket), offline=True)
+
     return parser
 
 
-def main(argv: Optional[list[str]] = None) -> None:
+def run(argv: Optional[list[str]] = None, service: Optional["ContractService"] = None) -> int:
+    """Parse `argv`, run the command and print its output; returns the exit
+    code. `service` is a warm instance when called from the daemon."""
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    owned = service is None
     try:
-        config = load_config()
-        service = ContractService(config)
+        if service is None:
+            from .service import ContractService
+
+            # Offline commands (pure encoding / hashing / unit math) need no
+            # API key, disk caches or network clients.
+            config = Config(api_key="") if getattr(args, "offline", False) else load_config()
+            service = ContractService(config)
         result = args.run(service, args)
-        print(json.dumps(result, indent=2))
+        output_format = getattr(args, "output_format", "json")
+        if output_format != "json" or getattr(args, "out", None):
+            summary = export_result(result, args.export_kind, output_format, args.out)
+            if args.out:
+                print(dumps(summary, indent=not args.compact_output))
+        elif isinstance(result, Iterator):
+            for item in result:
+                print(dumps(item, default=jsonable), flush=True)
+        else:
+            print(dumps(result, indent=not args.compact_output, default=jsonable))
     except Exception as exc:  # pylint: disable=broad-except
         print(f"Error: {_redact_secrets(str(exc))}", file=sys.stderr)
-        sys.exit(1)
+        return 1
+    finally:
+        if owned and service is not None:
+            # Output first, then a short grace period for a background
+            # chainlist refresh to persist its snapshot.
+            sys.stdout.flush()
+            service.wait_for_background(_BACKGROUND_GRACE_SECONDS)
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    code = run(argv)
+    if code:
+        sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+NumPy views of `call_function_series(..., columnar=True)` results.
+
+NumPy is optional: nothing in the service imports it, and `to_numpy` raises
+ValueError when it is missing, like every other bad-input path.
+"""
+
+from typing import Any, Dict
+
+# Largest magnitude that fits an int64 column; wider values (uint256
+# balances, reserves) stay exact in an object array.
+_INT64_MAX = (1 << 63) - 1
+
+
+def to_numpy(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a columnar series into `{column: ndarray}`.
+
+    Integer columns become int64 when every value fits, otherwise object
+    arrays of Python ints. Scaled columns (those with a decimals hint) are
+    added as float64 arrays under `<column>_scaled`. Failed points (None)
+    become NaN in float columns and None in object columns; a column with a
+    failed point is never int64.
+    """
+    columns = result.get("columns") if isinstance(result, dict) else None
+    if not result.get("columnar") or not isinstance(columns, dict):
+        raise ValueError("to_numpy expects a call_function_series result with columnar=True.")
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ValueError("numpy is not installed; install numpy to use to_numpy.") from exc
+
+    arrays: Dict[str, Any] = {}
+    for name, values in columns.items():
+        if all(v is not None and -_INT64_MAX - 1 <= v <= _INT64_MAX for v in values):
+            arrays[name] = np.asarray(values, dtype=np.int64)
+        else:
+            arrays[name] = np.asarray(values, dtype=object)
+    for name, values in (result.get("scaled") or {}).items():
+        arrays[f"{name}_scaled"] = np.asarray(
+            [np.nan if v is None else float(v) for v in values], dtype=np.float64
+        )
+    return arrays
@@ -39,6 +39,9 @@ class Config:
     # entirely. Absent / None falls back to ~/.cache/etherscan-mcp.
     cache_dir: Optional[Path] = None
     metadata_fetch_concurrency: int = 5
+    # Blocks a tx must be buried under before its raw tx + receipt and its
+    # computed summaries are cached (memory + cache_dir/tx).
+    tx_finality_depth: int = 64
 
 
 def resolve_chain_id(network: str, override_chain_id: Optional[str] = None) -> str:
@@ -103,6 +106,10 @@ def load_config() -> Config:
     if metadata_concurrency < 1:
         metadata_concurrency = 1
 
+    tx_finality_depth = int(os.getenv("TX_FINALITY_DEPTH", "64"))
+    if tx_finality_depth < 0:
+        tx_finality_depth = 0
+
     chain_id_override = chain_id_env.strip() if chain_id_env else None
 
     # If NETWORK is unknown here, defer resolution to ChainRegistry at runtime.
@@ -129,4 +136,5 @@ def load_config() -> Config:
         rpc_url_default=rpc_url_default,
         cache_dir=cache_dir,
         metadata_fetch_concurrency=metadata_concurrency,
+        tx_finality_depth=tx_finality_depth,
     )
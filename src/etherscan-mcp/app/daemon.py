@@ -0,0 +1,292 @@
+"""
+Warm CLI daemon: `python -m app daemon` keeps one `ContractService` (HTTP
+sessions, disk caches, chainlist, decoder plans, block-time index) alive
+behind a Unix socket, and `python -m app <subcommand>` forwards to it when it
+is running, so a call costs roughly one upstream round trip instead of a
+full interpreter + import + service start.
+
+Protocol: one JSON line per connection from the client
+`{"argv", "cwd", "env"}`, then newline-delimited JSON frames back:
+`{"o": text}` (stdout), `{"e": text}` (stderr), and finally `{"exit": code}`
+or `{"fallback": reason}`. Control requests (`{"control": "stop" | "stats"}`)
+get a single reply frame and do not wait for a running command. Fallback
+tells the client to run the command locally. That happens when its config
+environment (API key, RPC URLs, network, ...) differs from the daemon's.
+Only a hash of that environment is sent, never the values.
+
+Commands run one at a time. The service mutates per-call client state (e.g.
+`client.chain_id`) and output is captured by swapping `sys.stdout` /
+`sys.stderr`, so both need the process to themselves. This module is
+imported by the thin client, so it must not import `service` / `requests` at
+module level.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV = "ETHERSCAN_MCP_SOCKET"
+NO_DAEMON_ENV = "ETHERSCAN_MCP_NO_DAEMON"
+
+# Environment that shapes `load_config()` / the service; a daemon only serves
+# clients whose values hash the same.
+_CONFIG_ENV_PREFIXES = ("ETHERSCAN_", "RPC_")
+_CONFIG_ENV_KEYS = {
+    "NETWORK",
+    "CHAIN_ID",
+    "REQUEST_TIMEOUT",
+    "REQUEST_RETRIES",
+    "REQUEST_BACKOFF_SECONDS",
+    "CHAINLIST_TTL_SECONDS",
+    "METADATA_FETCH_CONCURRENCY",
+    "TX_FINALITY_DEPTH",
+}
+_CLIENT_ONLY_ENV = {SOCKET_ENV, NO_DAEMON_ENV}
+
+
+def socket_path() -> str:
+    """`ETHERSCAN_MCP_SOCKET`, else a per-user socket in the runtime/temp dir."""
+    explicit = os.environ.get(SOCKET_ENV, "").strip()
+    if explicit:
+        return os.path.expanduser(explicit)
+    # TMPDIR rather than tempfile.gettempdir(): tempfile costs the client import time.
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(runtime_dir, f"etherscan-mcp-{os.getuid()}.sock")
+
+
+def env_fingerprint(environ: Optional[Dict[str, str]] = None) -> str:
+    env = os.environ if environ is None else environ
+    items = sorted(
+        (key, value)
+        for key, value in env.items()
+        if key not in _CLIENT_ONLY_ENV and (key in _CONFIG_ENV_KEYS or key.startswith(_CONFIG_ENV_PREFIXES))
+    )
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+def _owned_socket(path: str) -> bool:
+    """True when `path` is a Unix socket owned by this user. In a shared temp
+    dir another user could create the path first; never talk to theirs."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+# ---- client ----
+
+
+def forward(argv: List[str], path: Optional[str] = None) -> Optional[int]:
+    """Run `argv` on a running daemon, relaying its output. Returns the exit
+    code, or None when there is no daemon / it asked for a local run."""
+    if os.environ.get(NO_DAEMON_ENV, "").strip() in ("1", "true", "yes"):
+        return None
+    # Top-level options are flags, so the first non-option token is the
+    # subcommand; argument values such as `--function stats` are not.
+    # `stats` talks to the daemon itself, via a control request.
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command in (None, "daemon", "stats") or any(arg in ("-h", "--help") for arg in argv):
+        return None
+    target = path or socket_path()
+    if not _owned_socket(target):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        request = {"argv": argv, "cwd": os.getcwd(), "env": env_fingerprint()}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as frames:
+            for line in frames:
+                frame = json.loads(line)
+                if "o" in frame:
+                    sys.stdout.write(frame["o"])
+                    sys.stdout.flush()
+                elif "e" in frame:
+                    sys.stderr.write(frame["e"])
+                elif "exit" in frame:
+                    return int(frame["exit"])
+                elif "fallback" in frame:
+                    return None
+    print("Error: daemon closed the connection before the command finished.", file=sys.stderr)
+    return 1
+
+
+def stop(path: Optional[str] = None) -> Dict[str, Any]:
+    target = path or socket_path()
+    if not _owned_socket(target):
+        return {"socket": target, "stopped": False, "reason": "no daemon listening"}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(target)
+            sock.sendall(json.dumps({"control": "stop"}).encode("utf-8") + b"\n")
+            sock.recv(4096)
+    except OSError:
+        return {"socket": target, "stopped": False, "reason": "no daemon listening"}
+    return {"socket": target, "stopped": True}
+
+
+def stats(path: Optional[str] = None) -> Dict[str, Any]:
+    """Metrics snapshot (see `metrics.Registry.snapshot`) of the running daemon."""
+    target = path or socket_path()
+    try:
+        if not _owned_socket(target):
+            raise OSError(f"{target} is not a socket owned by this user")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(target)
+            sock.sendall(json.dumps({"control": "stats"}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                reply = json.loads(reader.readline())
+    except OSError as exc:
+        raise ValueError(f"No daemon listening on {target}; start one with `python -m app daemon`.") from exc
+    return {"socket": target, **reply["stats"]}
+
+
+# ---- server ----
+
+
+class _FrameWriter:
+    """File-like stdout/stderr replacement that relays writes as frames."""
+
+    def __init__(self, conn: socket.socket, key: str) -> None:
+        self._conn = conn
+        self._key = key
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._conn, {self._key: text})
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def _send(conn: socket.socket, frame: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(frame).encode("utf-8") + b"\n")
+
+
+def _read_request(conn: socket.socket) -> Optional[Dict[str, Any]]:
+    with conn.makefile("rb") as reader:
+        line = reader.readline()
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    return request if isinstance(request, dict) else None
+
+
+def serve(service: Any, path: Optional[str] = None, environ: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Serve CLI commands on `path` until stopped (`daemon --stop`, SIGTERM,
+    Ctrl-C). Only clients whose config environment matches `environ` (default:
+    this process's, which `service` was built from) are served; others run
+    locally. Returns a summary once the socket is removed."""
+    from . import cli  # the daemon side may import the full CLI
+    from .metrics import REGISTRY
+
+    target = path or socket_path()
+    fingerprint = env_fingerprint(environ)
+    run_lock = threading.Lock()
+    served = 0
+    stopping = threading.Event()
+
+    # A leftover socket file from a crashed daemon would make bind() fail;
+    # a live daemon on it means this one should not start. Anything at the
+    # path that is not our own socket is left alone.
+    if os.path.lexists(target):
+        if not _owned_socket(target):
+            raise ValueError(f"{target} exists and is not a socket owned by this user; refusing to start.")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(target)
+        except OSError:
+            try:
+                os.unlink(target)
+            except OSError as exc:
+                raise ValueError(f"Cannot remove stale socket {target}: {exc}.") from exc
+        else:
+            raise ValueError(f"A daemon is already listening on {target}.")
+        finally:
+            probe.close()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is 0600: same-user clients only
+    try:
+        listener.bind(target)
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+    listener.settimeout(0.5)  # lets the accept loop notice `stopping`
+    try:
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+    except ValueError:
+        pass  # not the main thread
+
+    def handle(conn: socket.socket) -> None:
+        nonlocal served
+        with conn:
+            request = _read_request(conn)
+            if request is None:
+                return
+            if request.get("control") == "stop":
+                stopping.set()
+                _send(conn, {"stopped": True})
+                return
+            if request.get("control") == "stats":
+                _send(conn, {"stats": {"commands_served": served, **REGISTRY.snapshot()}})
+                return
+            argv = request.get("argv")
+            if not isinstance(argv, list) or not argv or "daemon" in argv:
+                _send(conn, {"fallback": "unsupported command"})
+                return
+            if request.get("env") != fingerprint:
+                _send(conn, {"fallback": "environment differs from the daemon's"})
+                return
+            with run_lock:
+                saved = sys.stdout, sys.stderr, os.getcwd()
+                sys.stdout, sys.stderr = _FrameWriter(conn, "o"), _FrameWriter(conn, "e")
+                try:
+                    os.chdir(request.get("cwd") or saved[2])
+                    code = cli.run([str(arg) for arg in argv], service)
+                except SystemExit as exc:  # argparse usage errors
+                    code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 2)
+                except OSError:
+                    return  # client went away mid-command
+                finally:
+                    sys.stdout, sys.stderr = saved[0], saved[1]
+                    os.chdir(saved[2])
+                served += 1
+            try:
+                _send(conn, {"exit": code})
+            except OSError:
+                pass
+
+    try:
+        while not stopping.is_set():
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+    return {"socket": target, "stopped": True, "commands_served": served}
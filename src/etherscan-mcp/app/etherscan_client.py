@@ -1,8 +1,11 @@
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 
+from .jsoncodec import loads
+from .metrics import http_error_reason, record_bytes, record_rate_limited, record_retry, record_upstream
+
 
 class EtherscanClient:
     """Thin wrapper around Etherscan API with basic retry."""
@@ -35,10 +38,14 @@ class EtherscanClient:
         return self._request(params)
 
     def get_contract_creation(self, address: str) -> Dict[str, Any]:
+        return self.get_contract_creations([address])
+
+    def get_contract_creations(self, addresses: List[str]) -> Dict[str, Any]:
+        """`getcontractcreation` takes up to 5 comma-separated addresses."""
         params = {
             "module": "contract",
             "action": "getcontractcreation",
-            "contractaddresses": address,
+            "contractaddresses": ",".join(addresses),
             "chainid": self.chain_id,
         }
         return self._request(params)
@@ -137,6 +144,14 @@ class EtherscanClient:
         }
         return self._request(params)
 
+    def get_block_number(self) -> Dict[str, Any]:
+        params = {
+            "module": "proxy",
+            "action": "eth_blockNumber",
+            "chainid": self.chain_id,
+        }
+        return self._request(params)
+
     def get_block_by_number(self, tag: str, full_transactions: bool) -> Dict[str, Any]:
         params = {
             "module": "proxy",
@@ -147,6 +162,16 @@ class EtherscanClient:
         }
         return self._request(params)
 
+    def get_block_number_by_time(self, timestamp: int, closest: str) -> Dict[str, Any]:
+        params = {
+            "module": "block",
+            "action": "getblocknobytime",
+            "timestamp": timestamp,
+            "closest": closest,
+            "chainid": self.chain_id,
+        }
+        return self._request(params)
+
     def get_storage_at(self, address: str, slot: str, tag: str) -> Dict[str, Any]:
         params = {
             "module": "proxy",
@@ -158,6 +183,16 @@ class EtherscanClient:
         }
         return self._request(params)
 
+    def get_code(self, address: str, tag: str) -> Dict[str, Any]:
+        params = {
+            "module": "proxy",
+            "action": "eth_getCode",
+            "address": address,
+            "tag": tag,
+            "chainid": self.chain_id,
+        }
+        return self._request(params)
+
     def call(self, address: str, data: str, tag: str) -> Dict[str, Any]:
         params = {
             "module": "proxy",
@@ -201,77 +236,60 @@ class EtherscanClient:
         )
 
     def _request_url(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        merged = {**(params or {}), "apikey": self.api_key}
-        last_error: Optional[Exception] = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = self.session.get(
-                    url,
-                    params=merged,
-                    timeout=self.timeout,
-                )
-                if response.status_code >= 500 and attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-
-                response.raise_for_status()
-                payload = response.json()
-                if self._is_rate_limit_payload(payload) and attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                return payload
-            except requests.RequestException as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                else:
-                    raise
-            except ValueError as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                else:
-                    raise ValueError("Failed to parse response from Etherscan.") from exc
-
-        if last_error:
-            raise last_error
-
-        raise RuntimeError("Request failed without raising an exception.")
+        return self._get(url, params or {}, method=url.rsplit("/", 1)[-1] or "url")
 
     def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._get(self.base_url, params, method=str(params.get("action") or "unknown"))
+
+    def _get(self, url: str, params: Dict[str, Any], method: str) -> Dict[str, Any]:
         merged = {**params, "apikey": self.api_key}
         last_error: Optional[Exception] = None
+        started = time.perf_counter()
+        ok = False
+
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    response = self.session.get(
+                        url,
+                        params=merged,
+                        timeout=self.timeout,
+                    )
+                    record_bytes("etherscan", 0, len(response.content or b""))
+                    if response.status_code >= 500 and attempt < self.max_retries:
+                        record_retry("etherscan", method, "http_5xx")
+                        time.sleep(self.backoff_seconds * attempt)
+                        continue
 
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = self.session.get(
-                    self.base_url,
-                    params=merged,
-                    timeout=self.timeout,
-                )
-                if response.status_code >= 500 and attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-
-                response.raise_for_status()
-                payload = response.json()
-                if self._is_rate_limit_payload(payload) and attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                return payload
-            except requests.RequestException as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                else:
-                    raise
-            except ValueError as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                else:
-                    raise ValueError("Failed to parse response from Etherscan.") from exc
+                    response.raise_for_status()
+                    payload = loads(response.content)
+                    if self._is_rate_limit_payload(payload):
+                        record_rate_limited("etherscan", method)
+                        if attempt < self.max_retries:
+                            record_retry("etherscan", method, "rate_limited")
+                            time.sleep(self.backoff_seconds * attempt)
+                            continue
+                    ok = True
+                    return payload
+                except requests.RequestException as exc:
+                    last_error = exc
+                    reason = http_error_reason(exc)
+                    if reason == "rate_limited":
+                        record_rate_limited("etherscan", method)
+                    if attempt < self.max_retries:
+                        record_retry("etherscan", method, reason)
+                        time.sleep(self.backoff_seconds * attempt)
+                    else:
+                        raise
+                except ValueError as exc:
+                    last_error = exc
+                    if attempt < self.max_retries:
+                        record_retry("etherscan", method, "invalid_response")
+                        time.sleep(self.backoff_seconds * attempt)
+                    else:
+                        raise ValueError("Failed to parse response from Etherscan.") from exc
+        finally:
+            record_upstream("etherscan", method, started, ok)
 
         if last_error:
             raise last_error
@@ -0,0 +1,254 @@
+"""
+File export for row-shaped CLI results (`call-function-series`, `query-logs`,
+`list-token-transfers`, `list-transactions`).
+
+Formats:
+- json: the normal CLI document, written to a file.
+- csv: stdlib only; hex quantities become decimal, topics a JSON array.
+- parquet / arrow (Arrow IPC file): typed columns via pyarrow, which is
+  optional and imported only when one of these formats is requested.
+  Block numbers, timestamps and indexes are int64, amounts are exact
+  decimal strings (uint256 does not fit decimal128), addresses are
+  fixed_size_binary(20), hashes fixed_size_binary(32).
+
+Rows are converted and written `EXPORT_BATCH_ROWS` at a time (one Parquet
+row group / Arrow record batch each), so no second full-size copy of the
+result is built on the way to disk.
+"""
+
+import csv
+import sys
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .jsoncodec import dumps
+from .records import jsonable
+
+EXPORT_FORMATS = ("json", "csv", "parquet", "arrow")
+EXPORT_BATCH_ROWS = 8192
+
+# Column kinds: int (int64), amount (decimal string), address / hash (fixed
+# binary), hashes (list of hash), str, json (JSON text of any value).
+_Column = Tuple[str, str]
+
+_LOG_COLUMNS: List[_Column] = [
+    ("address", "address"),
+    ("topics", "hashes"),
+    ("data", "str"),
+    ("block_number", "int"),
+    ("tx_hash", "hash"),
+    ("log_index", "int"),
+    ("time_stamp", "int"),
+]
+_TRANSACTION_COLUMNS: List[_Column] = [
+    ("hash", "hash"),
+    ("from", "address"),
+    ("to", "address"),
+    ("value", "amount"),
+    ("gas", "int"),
+    ("gas_price", "amount"),
+    ("block_number", "int"),
+    ("timestamp", "int"),
+    ("input", "str"),
+]
+_TRANSFER_COLUMNS: List[_Column] = [
+    ("token_address", "address"),
+    ("token_symbol", "str"),
+    ("from", "address"),
+    ("to", "address"),
+    ("tx_hash", "hash"),
+    ("block_number", "int"),
+    ("timestamp", "int"),
+    ("token_type", "str"),
+    ("value", "amount"),
+    ("decimals", "int"),
+    ("token_id", "amount"),
+]
+_BINARY_WIDTHS = {"address": 20, "hash": 32}
+
+
+def export_result(result: Dict[str, Any], kind: str, fmt: str, out: Optional[str]) -> Dict[str, Any]:
+    """Write `result` (a service response of `kind`: series / logs /
+    transactions / transfers) to `out` in `fmt`. `out=None` is only allowed
+    for csv (written to stdout). Returns a small summary for the CLI."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"output format must be one of: {', '.join(EXPORT_FORMATS)}.")
+    if fmt == "json":
+        if not out:
+            raise ValueError("--out is required with --output-format json.")
+        with open(out, "w", encoding="utf-8") as f:
+            f.write(dumps(result, indent=True, default=jsonable))
+        return {"format": fmt, "out": out}
+    if not out and fmt != "csv":
+        raise ValueError(f"--out is required with --output-format {fmt}.")
+
+    columns, rows = _table(result, kind)
+    writer = _CsvWriter(columns, out) if fmt == "csv" else _ArrowWriter(columns, out, fmt)  # type: ignore[arg-type]
+    count = 0
+    try:
+        while True:
+            batch = list(islice(rows, EXPORT_BATCH_ROWS))
+            if not batch:
+                break
+            writer.write(batch)
+            count += len(batch)
+    finally:
+        writer.close()
+    return {"format": fmt, "out": out, "rows": count, "columns": [name for name, _ in columns]}
+
+
+def _table(result: Dict[str, Any], kind: str) -> Tuple[List[_Column], Iterator[Dict[str, Any]]]:
+    if kind == "series":
+        return _series_table(result)
+    if kind == "logs":
+        columns, key = _LOG_COLUMNS, "logs"
+    elif kind == "transactions":
+        columns, key = _TRANSACTION_COLUMNS, "transactions"
+    elif kind == "transfers":
+        columns, key = _TRANSFER_COLUMNS, "transfers"
+    else:
+        raise ValueError(f"Unsupported export kind: {kind}.")
+    rows = result.get(key) or []
+    return columns, (row.to_dict() if hasattr(row, "to_dict") else row for row in rows)
+
+
+def _series_table(result: Dict[str, Any]) -> Tuple[List[_Column], Iterator[Dict[str, Any]]]:
+    if result.get("columnar"):
+        data = dict(result.get("columns") or {})
+        for name, values in (result.get("scaled") or {}).items():
+            data[f"{name}_scaled"] = values
+        columns = [
+            (name, "int" if name in ("block_number", "timestamp", "block_timestamp") else "amount")
+            for name in result.get("columns") or {}
+        ]
+        columns += [(f"{name}_scaled", "str") for name in result.get("scaled") or {}]
+        names = list(data)
+        return columns, (dict(zip(names, values)) for values in zip(*data.values()))
+
+    series: List[Dict[str, Any]] = result.get("series") or []
+    columns = [("block_number", "int")]
+    if series and "timestamp" in series[0]:
+        columns += [("timestamp", "int"), ("block_timestamp", "int")]
+    columns.append(("data", "str"))
+    # Output columns follow the first successfully decoded point.
+    template = next((p["decoded"]["outputs"] for p in series if (p.get("decoded") or {}).get("ok")), [])
+    for item in template:
+        columns.append((item["name"], "amount" if isinstance(item.get("value"), int) else "json"))
+        if "value_scaled" in item:
+            columns.append((f"{item['name']}_scaled", "str"))
+
+    def rows() -> Iterator[Dict[str, Any]]:
+        for point in series:
+            row = {key: point.get(key) for key in ("block_number", "timestamp", "block_timestamp", "data")}
+            for item in (point.get("decoded") or {}).get("outputs") or []:
+                row[item["name"]] = item.get("value")
+                if "value_scaled" in item:
+                    row[f"{item['name']}_scaled"] = item["value_scaled"]
+            yield row
+
+    return columns, rows()
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Decimal or 0x-hex quantity (Etherscan mixes both) -> int; blanks -> None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    text = str(value).strip()
+    if text.lower().startswith("0x"):
+        return int(text, 16) if len(text) > 2 else None
+    return int(text) if text.lstrip("-").isdigit() else None
+
+
+def _to_binary(value: Any, width: int) -> Optional[bytes]:
+    if not isinstance(value, str) or len(value) != 2 + 2 * width:
+        return None
+    try:
+        return bytes.fromhex(value[2:])
+    except ValueError:
+        return None
+
+
+def _csv_value(value: Any, kind: str) -> Any:
+    if value is None:
+        return ""
+    if kind in ("int", "amount"):
+        number = _to_int(value)
+        return "" if number is None else number
+    if kind in ("hashes", "json"):
+        return dumps(value, default=jsonable)
+    return value
+
+
+class _CsvWriter:
+    def __init__(self, columns: List[_Column], out: Optional[str]) -> None:
+        self._columns = columns
+        self._file = open(out, "w", encoding="utf-8", newline="") if out else None
+        self._writer = csv.writer(self._file or sys.stdout)
+        self._writer.writerow([name for name, _ in columns])
+
+    def write(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._writer.writerows([_csv_value(row.get(name), kind) for name, kind in self._columns] for row in rows)
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+class _ArrowWriter:
+    def __init__(self, columns: List[_Column], out: str, fmt: str) -> None:
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ValueError(f"pyarrow is not installed; install pyarrow to use --output-format {fmt}.") from exc
+        self._pa = pa
+        self._columns = columns
+        self._schema = pa.schema([(name, self._arrow_type(kind)) for name, kind in columns])
+        self._parquet = fmt == "parquet"
+        if self._parquet:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(out, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(out, self._schema)
+
+    def _arrow_type(self, kind: str) -> Any:
+        pa = self._pa
+        if kind == "int":
+            return pa.int64()
+        if kind in _BINARY_WIDTHS:
+            return pa.binary(_BINARY_WIDTHS[kind])
+        if kind == "hashes":
+            return pa.list_(pa.binary(32))
+        return pa.string()
+
+    def _convert(self, value: Any, kind: str) -> Any:
+        if value is None:
+            return None
+        if kind == "int":
+            return _to_int(value)
+        if kind == "amount":
+            number = _to_int(value)
+            return None if number is None else str(number)
+        if kind in _BINARY_WIDTHS:
+            return _to_binary(value, _BINARY_WIDTHS[kind])
+        if kind == "hashes":
+            return [_to_binary(topic, 32) for topic in value]
+        if kind == "json":
+            return dumps(value, default=jsonable)
+        return str(value)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        arrays = [
+            self._pa.array([self._convert(row.get(name), kind) for row in rows], type=field.type)
+            for (name, kind), field in zip(self._columns, self._schema)
+        ]
+        batch = self._pa.record_batch(arrays, schema=self._schema)
+        if self._parquet:
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
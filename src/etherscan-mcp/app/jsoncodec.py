@@ -0,0 +1,65 @@
+"""
+JSON encode/decode for HTTP responses and CLI output, using orjson when it is
+installed and the stdlib `json` module otherwise.
+
+orjson parses multi-megabyte `eth_getLogs` / full-transaction block payloads
+several times faster than `json`. It is optional: nothing else changes when
+it is missing, and `ETHERSCAN_MCP_JSON=stdlib` forces the stdlib backend.
+
+Differences handled here:
+- orjson cannot encode integers wider than 64 bits (uint256 call outputs).
+  `dumps` falls back to `json` for such values, so output is always complete.
+- orjson would serialize dataclasses by attribute name. Records must go
+  through `default` (`records.jsonable`) to keep their public keys, so
+  dataclass passthrough is enabled.
+- orjson writes non-ASCII text as raw UTF-8; the fallback does the same
+  (`ensure_ascii=False`).
+- orjson reads JSON integers wider than 64 bits as floats. JSON-RPC
+  quantities and Etherscan values are strings, so responses are unaffected.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    if os.environ.get("ETHERSCAN_MCP_JSON", "").strip().lower() == "stdlib":
+        raise ImportError("stdlib JSON backend requested")
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document; errors are ValueError subclasses either way."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to text: compact (`,` / `:` separators) or 2-space indented."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. uint256 ints; the stdlib encoder handles them.
+    # Non-ASCII as raw UTF-8, like orjson, so output does not depend on the path taken.
+    if indent:
+        return json.dumps(value, indent=2, default=default, ensure_ascii=False)
+    return json.dumps(value, separators=(",", ":"), default=default, ensure_ascii=False)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Compact UTF-8 body for HTTP requests."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
@@ -7,8 +7,12 @@ from collections.abc import Mapping
 from typing import Any, Optional, Union
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
 from .config import load_config
+from .metrics import REGISTRY
+from .records import materialize
 from .service import ContractService
 
 server = FastMCP(
@@ -74,16 +78,49 @@ def get_contract_creation(address: str, network: Optional[str] = None) -> dict:
     return svc.get_contract_creation(address, network)
 
 
+@server.tool(
+    name="get_contract_creations",
+    title="Get Contract Creation Info (Bulk)",
+    description=(
+        "Bulk get_contract_creation for an array of addresses (max 500): cached entries served locally, "
+        "the rest batched 5 per Etherscan request, individual RPC fallback for addresses Etherscan "
+        "can't answer. Returns creations in input order plus per-address errors."
+    ),
+)
+def get_contract_creations(addresses: Any, network: Optional[str] = None) -> dict:
+    svc = _get_service()
+    normalized = _normalize_array_param(addresses, "addresses")
+    return svc.get_contract_creations(normalized or [], network)
+
+
 @server.tool(
     name="detect_proxy",
     title="Detect Proxy Implementation/Admin",
-    description="Detect proxy implementation/admin via EIP-1967 storage slots.",
+    description=(
+        "Detect proxy implementation/admin/beacon via EIP-1967 implementation/admin/beacon slots, "
+        "legacy OpenZeppelin (zos) and EIP-1822 PROXIABLE slots, and EIP-1167 minimal proxy bytecode. "
+        "proxy_type: eip1967 | eip1967_beacon | eip1822 | zeppelinos | eip1167."
+    ),
 )
 def detect_proxy(address: str, network: Optional[str] = None) -> dict:
     svc = _get_service()
     return svc.detect_proxy(address, network)
 
 
+@server.tool(
+    name="detect_proxies",
+    title="Detect Proxies (Bulk)",
+    description=(
+        "detect_proxy for an array of addresses (max 500): all slot + code reads in one JSON-RPC "
+        "batch, beacon implementation() calls in a second. Maps a protocol's proxy topology in one call."
+    ),
+)
+def detect_proxies(addresses: Any, network: Optional[str] = None) -> dict:
+    svc = _get_service()
+    normalized = _normalize_array_param(addresses, "addresses")
+    return svc.detect_proxies(normalized or [], network)
+
+
 @server.tool(
     name="list_transactions",
     title="List Transactions",
@@ -99,7 +136,7 @@ def list_transactions(
     sort: Optional[str] = None,
 ) -> dict:
     svc = _get_service()
-    return svc.list_transactions(address, network, start_block, end_block, page, offset, sort)
+    return materialize(svc.list_transactions(address, network, start_block, end_block, page, offset, sort))
 
 
 @server.tool(
@@ -118,15 +155,15 @@ def list_token_transfers(
     sort: Optional[str] = None,
 ) -> dict:
     svc = _get_service()
-    return svc.list_token_transfers(
-        address, network, token_type, start_block, end_block, page, offset, sort
+    return materialize(
+        svc.list_token_transfers(address, network, token_type, start_block, end_block, page, offset, sort)
     )
 
 
 @server.tool(
     name="query_logs",
     title="Query Logs",
-    description="Query contract logs by topics and block range. `topics` must be an array of topic filters (use None for empty).",
+    description="Query contract logs by topics and block range. `topics` must be an array of topic filters (use None for empty). `from_time`/`to_time` (unix seconds or ISO 8601) may replace `from_block`/`to_block`; they resolve to the first block at/after and last block at/before those times.",
 )
 def query_logs(
     address: str,
@@ -136,10 +173,14 @@ def query_logs(
     to_block: Optional[Union[int, str]] = None,
     page: Optional[int] = None,
     offset: Optional[int] = None,
+    from_time: Optional[Union[int, str]] = None,
+    to_time: Optional[Union[int, str]] = None,
 ) -> dict:
     svc = _get_service()
     normalized_topics = _normalize_array_param(topics, "topics")
-    return svc.query_logs(address, network, normalized_topics, from_block, to_block, page, offset)
+    return materialize(
+        svc.query_logs(address, network, normalized_topics, from_block, to_block, page, offset, from_time, to_time)
+    )
 
 
 @server.tool(
@@ -179,12 +220,12 @@ def call_function(
 @server.tool(
     name="call_function_series",
     title="Call Read-Only Function Series",
-    description="Call the same read-only contract function across a historical block range via JSON-RPC batch eth_call. Requires RPC_URL_<chainid> backed by an archive node. `args` must be an array.",
+    description="Call the same read-only contract function across a historical block range via JSON-RPC batch eth_call. Requires RPC_URL_<chainid> backed by an archive node. `args` must be an array. Either from_block/to_block/stride, or from_time/to_time (unix seconds or ISO 8601) with interval (hourly / daily / weekly / seconds; default daily) — each time point reads the last block at or before it, all points resolved in one batched pass. columnar=true (static integer outputs only, e.g. uint256 or getReserves) returns `columns`: one array per block field and output leaf instead of per-point `series` rows.",
 )
 def call_function_series(
     address: str,
-    from_block: Union[int, str],
-    to_block: Union[int, str],
+    from_block: Optional[Union[int, str]] = None,
+    to_block: Optional[Union[int, str]] = None,
     stride: int = 1,
     data: Optional[str] = None,
     network: Optional[str] = None,
@@ -192,6 +233,10 @@ def call_function_series(
     args: Optional[Any] = None,
     decimals: Optional[Any] = None,
     batch_size: Optional[int] = None,
+    from_time: Optional[Union[int, str]] = None,
+    to_time: Optional[Union[int, str]] = None,
+    interval: Optional[Union[int, str]] = None,
+    columnar: bool = False,
 ) -> dict:
     svc = _get_service()
     normalized_args = _normalize_array_param(args, "args")
@@ -206,6 +251,10 @@ def call_function_series(
         normalized_args,
         decimals,
         batch_size,
+        from_time,
+        to_time,
+        interval,
+        columnar,
     )
 
 
@@ -286,6 +335,33 @@ def get_transaction_summary(
     )
 
 
+@server.tool(
+    name="get_transaction_summaries",
+    title="Summarize Transactions (Bulk)",
+    description=(
+        "get_transaction_summary for many tx hashes (array, max 2000, duplicates dropped) in "
+        "batched round trips: tx + receipt per batch in one JSON-RPC batch, token metadata via "
+        "one Multicall3 call, token/contract lookups shared across the run. Same options as "
+        "get_transaction_summary; batch_size (default 50) sets hashes per round trip. Returns "
+        "summaries in input order."
+    ),
+)
+def get_transaction_summaries(
+    tx_hashes: Any,
+    network: Optional[str] = None,
+    decode_transfers: bool = True,
+    annotate_contracts: bool = True,
+    compact: bool = False,
+    flow_scope: str = "user",
+    batch_size: Optional[int] = None,
+) -> dict:
+    svc = _get_service()
+    hashes = _normalize_array_param(tx_hashes, "tx_hashes")
+    return svc.get_transaction_summaries(
+        hashes or [], network, decode_transfers, annotate_contracts, compact, flow_scope, batch_size
+    )
+
+
 @server.tool(
     name="get_block_by_number",
     title="Get Block By Number",
@@ -298,7 +374,50 @@ def get_block_by_number(
     tx_hashes_only: bool = False,
 ) -> dict:
     svc = _get_service()
-    return svc.get_block_by_number(block, network, full_transactions, tx_hashes_only)
+    return materialize(svc.get_block_by_number(block, network, full_transactions, tx_hashes_only))
+
+
+@server.tool(
+    name="get_blocks",
+    title="Get Block Range",
+    description="Fetch blocks from_block..to_block (inclusive, to_block may be latest; max 10000) via pipelined JSON-RPC batches (concurrent Etherscan proxy requests without RPC). header_only drops the transactions list and adds transaction_count — use it for gas / base fee / miner scans.",
+)
+def get_blocks(
+    from_block: Union[int, str],
+    to_block: Union[int, str],
+    network: Optional[str] = None,
+    header_only: bool = False,
+    full_transactions: bool = False,
+    batch_size: Optional[int] = None,
+) -> dict:
+    svc = _get_service()
+    return materialize(svc.get_blocks(from_block, to_block, network, header_only, full_transactions, batch_size))
+
+
+@server.tool(
+    name="get_block_summary",
+    title="Summarize Block",
+    description=(
+        "Whole-block digest (RPC required): compact get_transaction_summary per tx, ERC20 net flow "
+        "aggregated across the block (net_token_flow_by_address) and fee totals (execution / burnt / "
+        "priority / l1 / total). Receipts via eth_getBlockReceipts (batched eth_getTransactionReceipt "
+        "fallback), token metadata via one Multicall3 call. annotate_contracts defaults false (one "
+        "Etherscan lookup per address). flow_scope: 'user' keeps tx senders, 'user_router' adds tx.to, "
+        "'all' keeps every row. include_transactions=false returns only block-wide totals."
+    ),
+)
+def get_block_summary(
+    block: Any,
+    network: Optional[str] = None,
+    decode_transfers: bool = True,
+    annotate_contracts: bool = False,
+    flow_scope: str = "user",
+    include_transactions: bool = True,
+) -> dict:
+    svc = _get_service()
+    return svc.get_block_summary(
+        block, network, decode_transfers, annotate_contracts, flow_scope, include_transactions
+    )
 
 
 @server.tool(
@@ -311,6 +430,16 @@ def get_block_time_by_number(block: Any, network: Optional[str] = None) -> dict:
     return svc.get_block_time_by_number(block, network)
 
 
+@server.tool(
+    name="get_block_by_time",
+    title="Get Block By Time",
+    description="Find the last block at/before (closest=before) or the first block at/after (closest=after) a timestamp (unix seconds or ISO 8601, naive = UTC). With RPC: batched interpolation search seeded from a persisted block-time index (repeat lookups cost no requests); otherwise Etherscan getblocknobytime.",
+)
+def get_block_by_time(timestamp: Any, network: Optional[str] = None, closest: str = "before") -> dict:
+    svc = _get_service()
+    return svc.get_block_by_time(timestamp, network, closest)
+
+
 @server.tool(
     name="list_chains",
     title="List Supported Chains",
@@ -341,6 +470,12 @@ def convert(value: Any, from_unit: str, to_unit: str, decimals: Optional[Any] =
     return svc.convert(value, from_unit, to_unit, decimals)
 
 
+@server.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint (SSE / streamable-HTTP transports only)."""
+    return PlainTextResponse(REGISTRY.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run the Etherscan MCP server.")
     parser.add_argument(
@@ -0,0 +1,301 @@
+"""
+In-process metrics: latency histograms and counters for service tools,
+upstream calls (Etherscan, JSON-RPC) and caches.
+
+One process-wide `REGISTRY` is shared by `ContractService`, the HTTP clients
+and the caches. It is read two ways:
+- `render_prometheus()`: text exposition format, served at `/metrics` by
+  the SSE / streamable-HTTP MCP server.
+- `snapshot()`: a JSON-friendly summary with p50/p95/p99 estimates, returned
+  by the `stats` CLI command (from the running daemon).
+
+Series recorded:
+- `etherscan_mcp_tool_duration_seconds{tool,outcome}`: outermost
+  `ContractService` method calls. Nested service calls are not
+  double-counted. That includes calls made from an `iter_*` generator, and
+  calls made on pool workers, as long as the pool copies the caller's
+  context (see `service._thread_pool`).
+- `etherscan_mcp_upstream_request_duration_seconds{upstream,method,outcome}`:
+  one observation per logical request, retries included.
+- `etherscan_mcp_upstream_retries_total{upstream,method,reason}`
+- `etherscan_mcp_upstream_rate_limited_total{upstream,method}`
+- `etherscan_mcp_upstream_bytes_total{upstream,direction}`
+- `etherscan_mcp_cache_requests_total{cache,result}`
+
+Kept to the stdlib and cheap to import; the CLI entry point loads it.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+PREFIX = "etherscan_mcp_"
+# Upper bounds in seconds; +Inf is implicit.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_Labels = Tuple[Tuple[str, str], ...]
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Set while an instrumented tool runs; nested tool calls are not timed.
+# A ContextVar rather than a thread-local so it follows work submitted to
+# context-copying pools.
+_IN_TOOL: "contextvars.ContextVar[bool]" = contextvars.ContextVar("etherscan_mcp_in_tool", default=False)
+
+_HELP = {
+    "tool_duration_seconds": "ContractService tool call latency.",
+    "upstream_request_duration_seconds": "Upstream request latency, retries included.",
+    "upstream_retries_total": "Upstream request retries by reason.",
+    "upstream_rate_limited_total": "Upstream responses that signalled a rate limit.",
+    "upstream_bytes_total": "Upstream HTTP body bytes.",
+    "cache_requests_total": "Cache lookups by result.",
+}
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Linear interpolation inside the bucket, like PromQL `histogram_quantile`."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if i == len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[-1]
+                lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+                return lower + (LATENCY_BUCKETS[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return LATENCY_BUCKETS[-1]
+
+
+class Registry:
+    """Thread-safe store of labelled histograms and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[_Labels, _Histogram]] = {}
+        self._counters: Dict[str, Dict[_Labels, float]] = {}
+        self._started = time.time()
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    def timed_tool(self, func: _F) -> _F:
+        """Record `func` under `tool_duration_seconds` when it is the
+        outermost instrumented call in this context. Generator functions are
+        timed until the generator finishes or is closed, and count as "inside
+        a tool" only while their own code runs, not while the consumer holds
+        a yielded item."""
+        tool = func.__name__
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                inner = func(*args, **kwargs)
+                if _IN_TOOL.get():
+                    return (yield from inner)
+                outcome = "error"
+                started = time.perf_counter()
+                try:
+                    while True:
+                        token = _IN_TOOL.set(True)
+                        try:
+                            item = next(inner)
+                        except StopIteration as stop:
+                            outcome = "ok"
+                            return stop.value
+                        finally:
+                            _IN_TOOL.reset(token)
+                        yield item
+                except GeneratorExit:
+                    outcome = "ok"  # consumer stopped early
+                    inner.close()
+                    raise
+                finally:
+                    self.observe("tool_duration_seconds", time.perf_counter() - started, tool=tool, outcome=outcome)
+
+            return generator_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _IN_TOOL.get():
+                return func(*args, **kwargs)
+            token = _IN_TOOL.set(True)
+            outcome = "error"
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                _IN_TOOL.reset(token)
+                self.observe("tool_duration_seconds", time.perf_counter() - started, tool=tool, outcome=outcome)
+
+        return wrapper  # type: ignore[return-value]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": h.count,
+                        "sum_seconds": round(h.sum, 6),
+                        "p50_seconds": _round(h.quantile(0.5)),
+                        "p95_seconds": _round(h.quantile(0.95)),
+                        "p99_seconds": _round(h.quantile(0.99)),
+                    }
+                    for key, h in sorted(series.items())
+                ]
+                for name, series in sorted(self._histograms.items())
+            }
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                for name, series in sorted(self._counters.items())
+            }
+            lookups: Dict[str, Dict[str, float]] = {}
+            for key, value in self._counters.get("cache_requests_total", {}).items():
+                labels = dict(key)
+                lookups.setdefault(labels["cache"], {"hit": 0, "miss": 0})[labels["result"]] = value
+        hit_ratio = {
+            cache: round(counts["hit"] / (counts["hit"] + counts["miss"]), 4)
+            for cache, counts in sorted(lookups.items())
+            if counts["hit"] + counts["miss"]
+        }
+        return {
+            "uptime_seconds": round(time.time() - self._started, 3),
+            "histograms": histograms,
+            "counters": counters,
+            "cache_hit_ratio": hit_ratio,
+        }
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                lines += _header(name, "histogram")
+                for key, h in sorted(series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(LATENCY_BUCKETS + (float("inf"),), h.counts):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{PREFIX}{name}_bucket{_format_labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{PREFIX}{name}_sum{_format_labels(key)} {h.sum!r}")
+                    lines.append(f"{PREFIX}{name}_count{_format_labels(key)} {h.count}")
+            for name, counters in sorted(self._counters.items()):
+                lines += _header(name, "counter")
+                for key, value in sorted(counters.items()):
+                    lines.append(f"{PREFIX}{name}{_format_labels(key)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _header(name: str, kind: str) -> Iterator[str]:
+    yield f"# HELP {PREFIX}{name} {_HELP.get(name, name)}"
+    yield f"# TYPE {PREFIX}{name} {kind}"
+
+
+def _format_labels(key: _Labels) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{label}="{_escape(value)}"' for label, value in key) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 6)
+
+
+REGISTRY = Registry()
+
+
+def instrument_tools(exclude: Tuple[str, ...] = ()) -> Callable[[type], type]:
+    """Class decorator: time every public method defined on the class (minus
+    `exclude`) as a tool."""
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            # Plain functions only: properties / staticmethods are left alone.
+            if not attr.startswith("_") and attr not in exclude and inspect.isfunction(value):
+                setattr(cls, attr, REGISTRY.timed_tool(value))
+        return cls
+
+    return decorate
+
+
+def record_upstream(upstream: str, method: str, started: float, ok: bool) -> None:
+    REGISTRY.observe(
+        "upstream_request_duration_seconds",
+        time.perf_counter() - started,
+        upstream=upstream,
+        method=method,
+        outcome="ok" if ok else "error",
+    )
+
+
+def record_retry(upstream: str, method: str, reason: str) -> None:
+    REGISTRY.inc("upstream_retries_total", upstream=upstream, method=method, reason=reason)
+
+
+def record_rate_limited(upstream: str, method: str) -> None:
+    REGISTRY.inc("upstream_rate_limited_total", upstream=upstream, method=method)
+
+
+def record_bytes(upstream: str, sent: int, received: int) -> None:
+    if sent:
+        REGISTRY.inc("upstream_bytes_total", sent, upstream=upstream, direction="sent")
+    if received:
+        REGISTRY.inc("upstream_bytes_total", received, upstream=upstream, direction="received")
+
+
+def http_error_reason(exc: Exception) -> str:
+    """Retry reason for a `requests` exception; HTTP 429 counts as a rate limit."""
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return "rate_limited"
+    return "transport" if status is None else "http_error"
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    REGISTRY.inc("cache_requests_total", cache=cache, result="hit" if hit else "miss")
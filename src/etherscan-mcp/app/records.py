@@ -0,0 +1,259 @@
+"""
+Compact row types for list / scan results (logs, account transactions, token
+transfers, blocks).
+
+Rows stay slotted dataclasses inside the service: one object with fixed
+attribute slots instead of a dict carrying a dozen string keys per row, which
+is what dominates memory and GC time on 100k-row scans. The public JSON shape
+is produced only at the CLI / MCP boundary via `to_dict()` / `materialize()`
+(the CLI passes `jsonable` as `json.dumps(default=...)`, so rows are never
+copied into dicts at all).
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+
+class _Record:
+    __slots__ = ()
+    # (attribute, output key) in output order.
+    _KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, attr) for attr, key in self._KEYS}
+
+
+@dataclass(slots=True)
+class LogRecord(_Record):
+    address: Optional[str]
+    topics: Optional[List[str]]
+    data: Optional[str]
+    block_number: Optional[str]
+    tx_hash: Optional[str]
+    log_index: Optional[str]
+    time_stamp: Optional[str]
+
+    _KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("address", "address"),
+        ("topics", "topics"),
+        ("data", "data"),
+        ("block_number", "block_number"),
+        ("tx_hash", "tx_hash"),
+        ("log_index", "log_index"),
+        ("time_stamp", "time_stamp"),
+    )
+
+    @classmethod
+    def from_raw(cls, entry: Dict[str, Any]) -> "LogRecord":
+        """From an Etherscan `getLogs` row or a JSON-RPC log object."""
+        return cls(
+            entry.get("address"),
+            entry.get("topics"),
+            entry.get("data"),
+            entry.get("blockNumber"),
+            entry.get("transactionHash"),
+            entry.get("logIndex"),
+            entry.get("timeStamp"),
+        )
+
+
+@dataclass(slots=True)
+class TransactionRecord(_Record):
+    hash: Optional[str]
+    sender: Optional[str]
+    to: Optional[str]
+    value: Optional[str]
+    gas: Optional[str]
+    gas_price: Optional[str]
+    block_number: Optional[str]
+    timestamp: Optional[str]
+    input: Optional[str]
+
+    _KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("hash", "hash"),
+        ("sender", "from"),
+        ("to", "to"),
+        ("value", "value"),
+        ("gas", "gas"),
+        ("gas_price", "gas_price"),
+        ("block_number", "block_number"),
+        ("timestamp", "timestamp"),
+        ("input", "input"),
+    )
+
+    @classmethod
+    def from_raw(cls, tx: Dict[str, Any]) -> "TransactionRecord":
+        """From an Etherscan `txlist` row."""
+        return cls(
+            tx.get("hash"),
+            tx.get("from"),
+            tx.get("to"),
+            tx.get("value"),
+            tx.get("gas"),
+            tx.get("gasPrice"),
+            tx.get("blockNumber"),
+            tx.get("timeStamp"),
+            tx.get("input"),
+        )
+
+
+@dataclass(slots=True)
+class TokenTransferRecord(_Record):
+    token_address: Optional[str]
+    token_symbol: Optional[str]
+    sender: Optional[str]
+    to: Optional[str]
+    tx_hash: Optional[str]
+    block_number: Optional[str]
+    timestamp: Optional[str]
+    token_type: str
+    value: Optional[str] = None
+    decimals: Optional[str] = None
+    token_id: Optional[str] = None
+
+    _KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("token_address", "token_address"),
+        ("token_symbol", "token_symbol"),
+        ("sender", "from"),
+        ("to", "to"),
+        ("tx_hash", "tx_hash"),
+        ("block_number", "block_number"),
+        ("timestamp", "timestamp"),
+        ("token_type", "token_type"),
+    )
+    # Extra keys emitted per token type, in output order.
+    _TYPE_KEYS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "erc20": ("value", "decimals"),
+        "erc721": ("token_id",),
+        "erc1155": ("token_id", "value"),
+    }
+
+    @classmethod
+    def from_raw(cls, transfer: Dict[str, Any], token_type: str) -> "TokenTransferRecord":
+        """From an Etherscan `tokentx` / `tokennfttx` / `token1155tx` row."""
+        record = cls(
+            transfer.get("contractAddress") or transfer.get("tokenAddress"),
+            transfer.get("tokenSymbol"),
+            transfer.get("from"),
+            transfer.get("to"),
+            transfer.get("hash"),
+            transfer.get("blockNumber"),
+            transfer.get("timeStamp"),
+            token_type,
+        )
+        if token_type == "erc20":
+            record.value = transfer.get("value")
+            record.decimals = transfer.get("tokenDecimal")
+        elif token_type == "erc721":
+            record.token_id = transfer.get("tokenID") or transfer.get("tokenId")
+        elif token_type == "erc1155":
+            record.token_id = transfer.get("tokenID") or transfer.get("tokenId")
+            record.value = transfer.get("tokenValue") or transfer.get("value")
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {key: getattr(self, attr) for attr, key in self._KEYS}
+        for attr in self._TYPE_KEYS.get(self.token_type, ()):
+            out[attr] = getattr(self, attr)
+        return out
+
+
+@dataclass(slots=True)
+class BlockRecord(_Record):
+    number: Optional[str] = None
+    hash: Optional[str] = None
+    parent_hash: Optional[str] = None
+    nonce: Optional[str] = None
+    sha3_uncles: Optional[str] = None
+    logs_bloom: Optional[str] = None
+    transactions_root: Optional[str] = None
+    state_root: Optional[str] = None
+    receipts_root: Optional[str] = None
+    miner: Optional[str] = None
+    difficulty: Optional[str] = None
+    total_difficulty: Optional[str] = None
+    extra_data: Optional[str] = None
+    size: Optional[str] = None
+    gas_limit: Optional[str] = None
+    gas_used: Optional[str] = None
+    timestamp: Optional[str] = None
+    # Hashes or mapped tx dicts; None when dropped (header-only).
+    transactions: Any = None
+    uncles: Optional[List[str]] = None
+    base_fee_per_gas: Optional[str] = None
+    mix_hash: Optional[str] = None
+    blob_gas_used: Optional[str] = None
+    excess_blob_gas: Optional[str] = None
+    withdrawals: Optional[List[Dict[str, Any]]] = None
+    withdrawals_root: Optional[str] = None
+    parent_beacon_block_root: Optional[str] = None
+    blob_gas_price: Optional[str] = None
+    # Set in header-only mode, which replaces `transactions` in the output.
+    transaction_count: Optional[int] = None
+
+    _KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("number", "number"),
+        ("hash", "hash"),
+        ("parent_hash", "parentHash"),
+        ("nonce", "nonce"),
+        ("sha3_uncles", "sha3Uncles"),
+        ("logs_bloom", "logsBloom"),
+        ("transactions_root", "transactionsRoot"),
+        ("state_root", "stateRoot"),
+        ("receipts_root", "receiptsRoot"),
+        ("miner", "miner"),
+        ("difficulty", "difficulty"),
+        ("total_difficulty", "totalDifficulty"),
+        ("extra_data", "extraData"),
+        ("size", "size"),
+        ("gas_limit", "gasLimit"),
+        ("gas_used", "gasUsed"),
+        ("timestamp", "timestamp"),
+        ("transactions", "transactions"),
+        ("uncles", "uncles"),
+        ("base_fee_per_gas", "baseFeePerGas"),
+        ("mix_hash", "mixHash"),
+        ("blob_gas_used", "blobGasUsed"),
+        ("excess_blob_gas", "excessBlobGas"),
+        ("withdrawals", "withdrawals"),
+        ("withdrawals_root", "withdrawalsRoot"),
+        ("parent_beacon_block_root", "parentBeaconBlockRoot"),
+        ("blob_gas_price", "blobGasPrice"),
+    )
+
+    @classmethod
+    def from_raw(cls, block: Dict[str, Any]) -> "BlockRecord":
+        """Header fields of a JSON-RPC block; `transactions` is left for the
+        caller to project."""
+        record = cls()
+        for attr, key in cls._KEYS:
+            if key != "transactions":
+                setattr(record, attr, block.get(key))
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.transaction_count is None:
+            return {key: getattr(self, attr) for attr, key in self._KEYS}
+        out = {key: getattr(self, attr) for attr, key in self._KEYS if key != "transactions"}
+        out["transaction_count"] = self.transaction_count
+        return out
+
+
+def jsonable(value: Any) -> Any:
+    """`json.dumps(default=...)` hook: serialize records without first
+    converting whole result trees."""
+    if isinstance(value, _Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def materialize(value: Any) -> Any:
+    """Replace records anywhere inside a result with plain dicts (for
+    consumers that need pure JSON types, e.g. MCP tool results)."""
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: materialize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [materialize(v) for v in value]
+    return value
@@ -1,8 +1,11 @@
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .jsoncodec import dumps_bytes, loads
+from .metrics import http_error_reason, record_bytes, record_rate_limited, record_retry, record_upstream
+
 
 class RpcClient:
     """Minimal JSON-RPC 2.0 client for EVM nodes (HTTP POST)."""
@@ -45,54 +48,67 @@ class RpcClient:
         }
         self._next_id += 1
 
+        body = dumps_bytes(payload)
         last_error: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = self.session.post(
-                    self.rpc_url,
-                    json=payload,
-                    timeout=self.timeout,
-                )
-                if response.status_code in {429} or response.status_code >= 500:
+        started = time.perf_counter()
+        ok = False
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    response = self.session.post(
+                        self.rpc_url,
+                        data=body,
+                        timeout=self.timeout,
+                    )
+                    record_bytes("rpc", len(body), len(response.content or b""))
+                    if response.status_code in {429} or response.status_code >= 500:
+                        if response.status_code == 429:
+                            record_rate_limited("rpc", method)
+                        if attempt < self.max_retries:
+                            record_retry("rpc", method, "rate_limited" if response.status_code == 429 else "http_5xx")
+                            time.sleep(self.backoff_seconds * attempt)
+                            continue
+
+                    response.raise_for_status()
+                    data = loads(response.content)
+                    if not isinstance(data, dict):
+                        raise ValueError("Unexpected JSON-RPC response (non-object).")
+
+                    error_obj = data.get("error")
+                    if isinstance(error_obj, dict):
+                        code = error_obj.get("code")
+                        message = error_obj.get("message")
+                        err_data = error_obj.get("data")
+                        parts: list[str] = []
+                        if code is not None:
+                            parts.append(f"code {code}")
+                        if message:
+                            parts.append(str(message))
+                        if err_data:
+                            parts.append(str(err_data))
+                        detail = ": ".join(parts) if parts else "unknown error"
+                        raise ValueError(f"RPC error: {detail}.")
+
+                    if "result" not in data:
+                        raise ValueError("Unexpected JSON-RPC response (missing result).")
+                    ok = True
+                    return data.get("result")
+                except requests.RequestException as exc:
+                    last_error = exc
                     if attempt < self.max_retries:
+                        record_retry("rpc", method, http_error_reason(exc))
                         time.sleep(self.backoff_seconds * attempt)
                         continue
-
-                response.raise_for_status()
-                data = response.json()
-                if not isinstance(data, dict):
-                    raise ValueError("Unexpected JSON-RPC response (non-object).")
-
-                error_obj = data.get("error")
-                if isinstance(error_obj, dict):
-                    code = error_obj.get("code")
-                    message = error_obj.get("message")
-                    err_data = error_obj.get("data")
-                    parts: list[str] = []
-                    if code is not None:
-                        parts.append(f"code {code}")
-                    if message:
-                        parts.append(str(message))
-                    if err_data:
-                        parts.append(str(err_data))
-                    detail = ": ".join(parts) if parts else "unknown error"
-                    raise ValueError(f"RPC error: {detail}.")
-
-                if "result" not in data:
-                    raise ValueError("Unexpected JSON-RPC response (missing result).")
-                return data.get("result")
-            except requests.RequestException as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                raise
-            except ValueError as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                raise
+                    raise
+                except ValueError as exc:
+                    last_error = exc
+                    if attempt < self.max_retries:
+                        record_retry("rpc", method, "rpc_error" if str(exc).startswith("RPC error") else "invalid_response")
+                        time.sleep(self.backoff_seconds * attempt)
+                        continue
+                    raise
+        finally:
+            record_upstream("rpc", method, started, ok)
 
         if last_error:
             raise last_error
@@ -103,12 +119,21 @@ class RpcClient:
             raise ValueError("method must be a non-empty string.")
         if not isinstance(params_list, list):
             raise ValueError("params_list must be a list.")
-        if not params_list:
+        return self.batch_request([(method, params) for params in params_list])
+
+    def batch_request(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Send `(method, params)` calls (methods may differ) as one JSON-RPC
+        batch; results come back in call order. Any item error fails the batch."""
+        if not isinstance(calls, list):
+            raise ValueError("calls must be a list.")
+        if not calls:
             return []
 
         payload = []
         request_ids: List[int] = []
-        for params in params_list:
+        for method, params in calls:
+            if not isinstance(method, str) or not method.strip():
+                raise ValueError("method must be a non-empty string.")
             if not isinstance(params, list):
                 raise ValueError("each params entry must be a list.")
             request_id = self._next_id
@@ -123,68 +148,81 @@ class RpcClient:
                 }
             )
 
+        body = dumps_bytes(payload)
         last_error: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = self.session.post(
-                    self.rpc_url,
-                    json=payload,
-                    timeout=self.timeout,
-                )
-                if response.status_code in {429} or response.status_code >= 500:
+        started = time.perf_counter()
+        ok = False
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    response = self.session.post(
+                        self.rpc_url,
+                        data=body,
+                        timeout=self.timeout,
+                    )
+                    record_bytes("rpc", len(body), len(response.content or b""))
+                    if response.status_code in {429} or response.status_code >= 500:
+                        if response.status_code == 429:
+                            record_rate_limited("rpc", "batch")
+                        if attempt < self.max_retries:
+                            record_retry("rpc", "batch", "rate_limited" if response.status_code == 429 else "http_5xx")
+                            time.sleep(self.backoff_seconds * attempt)
+                            continue
+
+                    response.raise_for_status()
+                    data = loads(response.content)
+                    if not isinstance(data, list):
+                        raise ValueError("Unexpected JSON-RPC batch response (non-list).")
+
+                    by_id: Dict[int, Dict[str, Any]] = {}
+                    for item in data:
+                        if not isinstance(item, dict):
+                            raise ValueError("Unexpected JSON-RPC batch response item.")
+                        item_id = item.get("id")
+                        if not isinstance(item_id, int):
+                            raise ValueError("Unexpected JSON-RPC batch response item id.")
+                        by_id[item_id] = item
+
+                    results: List[Any] = []
+                    for request_id in request_ids:
+                        item = by_id.get(request_id)
+                        if item is None:
+                            raise ValueError(f"Unexpected JSON-RPC batch response (missing id {request_id}).")
+                        error_obj = item.get("error")
+                        if isinstance(error_obj, dict):
+                            code = error_obj.get("code")
+                            message = error_obj.get("message")
+                            err_data = error_obj.get("data")
+                            parts: list[str] = []
+                            if code is not None:
+                                parts.append(f"code {code}")
+                            if message:
+                                parts.append(str(message))
+                            if err_data:
+                                parts.append(str(err_data))
+                            detail = ": ".join(parts) if parts else "unknown error"
+                            raise ValueError(f"RPC error: batch item {request_id}: {detail}.")
+                        if "result" not in item:
+                            raise ValueError(f"Unexpected JSON-RPC batch response (missing result for id {request_id}).")
+                        results.append(item.get("result"))
+                    ok = True
+                    return results
+                except requests.RequestException as exc:
+                    last_error = exc
                     if attempt < self.max_retries:
+                        record_retry("rpc", "batch", http_error_reason(exc))
                         time.sleep(self.backoff_seconds * attempt)
                         continue
-
-                response.raise_for_status()
-                data = response.json()
-                if not isinstance(data, list):
-                    raise ValueError("Unexpected JSON-RPC batch response (non-list).")
-
-                by_id: Dict[int, Dict[str, Any]] = {}
-                for item in data:
-                    if not isinstance(item, dict):
-                        raise ValueError("Unexpected JSON-RPC batch response item.")
-                    item_id = item.get("id")
-                    if not isinstance(item_id, int):
-                        raise ValueError("Unexpected JSON-RPC batch response item id.")
-                    by_id[item_id] = item
-
-                results: List[Any] = []
-                for request_id in request_ids:
-                    item = by_id.get(request_id)
-                    if item is None:
-                        raise ValueError(f"Unexpected JSON-RPC batch response (missing id {request_id}).")
-                    error_obj = item.get("error")
-                    if isinstance(error_obj, dict):
-                        code = error_obj.get("code")
-                        message = error_obj.get("message")
-                        err_data = error_obj.get("data")
-                        parts: list[str] = []
-                        if code is not None:
-                            parts.append(f"code {code}")
-                        if message:
-                            parts.append(str(message))
-                        if err_data:
-                            parts.append(str(err_data))
-                        detail = ": ".join(parts) if parts else "unknown error"
-                        raise ValueError(f"RPC error: batch item {request_id}: {detail}.")
-                    if "result" not in item:
-                        raise ValueError(f"Unexpected JSON-RPC batch response (missing result for id {request_id}).")
-                    results.append(item.get("result"))
-                return results
-            except requests.RequestException as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                raise
-            except ValueError as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(self.backoff_seconds * attempt)
-                    continue
-                raise
+                    raise
+                except ValueError as exc:
+                    last_error = exc
+                    if attempt < self.max_retries:
+                        record_retry("rpc", "batch", "rpc_error" if str(exc).startswith("RPC error") else "invalid_response")
+                        time.sleep(self.backoff_seconds * attempt)
+                        continue
+                    raise
+        finally:
+            record_upstream("rpc", "batch", started, ok)
 
         if last_error:
             raise last_error
@@ -1,21 +1,67 @@
+from __future__ import annotations
+
+import bisect
 import copy
+import datetime
 import json
 import re
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import hashlib
-from decimal import Decimal, getcontext
 
-from .cache import ContractCache
+from .block_index import BlockTimeIndex
+from .cache import BlobCache, ContractCache
 from .capabilities import build_route_hints, caveats_for, has_caveats
 from .chains import ChainRegistry
 from .config import Config, resolve_chain_id
-from .etherscan_client import EtherscanClient
-from .rpc_client import RpcClient
+from .metrics import instrument_tools
+from .records import BlockRecord, LogRecord, TokenTransferRecord, TransactionRecord
+
+# requests (behind both clients) and concurrent.futures dominate import time
+# and offline commands (keccak / encode-function-data / convert) need neither:
+# they are imported where first used.
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .etherscan_client import EtherscanClient
+    from .rpc_client import RpcClient
 
 ADDRESS_PATTERN = re.compile(r"^0x[a-fA-F0-9]{40}$")
+HEX_BODY_PATTERN = re.compile(r"[0-9a-f]*")
 EIP1967_IMPLEMENTATION_SLOT = "0x360894A13BA1A3210667C828492DB98DCA3E2076CC3735A920A3CA505D382BBC"
 EIP1967_ADMIN_SLOT = "0xb53127684a568b3173ae13b9f8a6016e243e63b6e8ee1178d6a717850b5d6103"
+EIP1967_BEACON_SLOT = "0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50"
+# keccak256("org.zeppelinos.proxy.implementation"), pre-1967 OpenZeppelin proxies.
+ZEPPELINOS_IMPLEMENTATION_SLOT = "0x7050c9e0f4ca769c69bd3a8ef740bc37934f8e2c036e5a723fd8ee048ed3f8c3"
+# keccak256("PROXIABLE"), EIP-1822 UUPS.
+EIP1822_PROXIABLE_SLOT = "0xc5f16f0fcc639fa48a6947836d9850f504798523bf8c9a3a87d5876cf622bcf7"
+# (name, slot) read by detect_proxies, in request order.
+PROXY_STORAGE_SLOTS = (
+    ("implementation", EIP1967_IMPLEMENTATION_SLOT),
+    ("admin", EIP1967_ADMIN_SLOT),
+    ("beacon", EIP1967_BEACON_SLOT),
+    ("zeppelinos_implementation", ZEPPELINOS_IMPLEMENTATION_SLOT),
+    ("eip1822_proxiable", EIP1822_PROXIABLE_SLOT),
+)
+# implementation() on an EIP-1967 beacon.
+BEACON_IMPLEMENTATION_SELECTOR = "0x5c60da1b"
+# EIP-1167 minimal proxy runtime: prefix + 20-byte implementation + suffix.
+EIP1167_PREFIX = "363d3d373d3d3d363d73"
+EIP1167_SUFFIX = "5af43d82803e903d91602b57fd5bf3"
+EIP1167_RUNTIME_LENGTH = 45
+MAX_PROXY_DETECTIONS = 500
+# Upgraded(address) / BeaconUpgraded(address) / AdminChanged(address,address):
+# emitted by EIP-1967 proxies and beacons when a cached field changes; cached
+# proxy info is revalidated by looking for them.
+UPGRADED_TOPIC = "0xbc7cd75a20ee27fd9adebab32041f755214dbc6bffa90cc0225b39da2e5c2d3b"
+BEACON_UPGRADED_TOPIC = "0x1cf3b03a6cf19fa2baba4df148e9dcabedea7f8a5c07840e207e5c089be95d3e"
+ADMIN_CHANGED_TOPIC = "0x7e644d79422f17c01e4894b5f4f588d331ebfa28653d42ae832dc59e38c9798f"
+# Seconds a revalidated proxy entry is trusted before checking logs again.
+PROXY_REVALIDATE_INTERVAL = 300
+# Max calls per JSON-RPC batch for bulk state reads.
+RPC_BATCH_MAX_CALLS = 200
 MAX_BLOCK = 99999999
 DEFAULT_PAGE = 1
 DEFAULT_OFFSET = 100
@@ -23,6 +69,58 @@ DEFAULT_INLINE_SOURCE_LIMIT = 20000
 RPC_LOGS_BLOCK_STEP = 2000
 DEFAULT_CALL_SERIES_BATCH_SIZE = 25
 MAX_CALL_SERIES_POINTS = 10000
+# Compiled ABI output decoders kept per ContractService (see `_output_decoder`).
+MAX_DECODER_PLANS = 512
+# call_function_series(interval=...): named sampling intervals, in seconds.
+SERIES_INTERVALS = {"hourly": 3600, "daily": 86400, "weekly": 604800}
+# get_transaction_summaries: tx hashes per tx+receipt JSON-RPC batch, and cap
+# on hashes per call.
+DEFAULT_TX_SUMMARY_BATCH_SIZE = 50
+MAX_TX_SUMMARIES = 2000
+# get_block_summary fallback when the node lacks eth_getBlockReceipts.
+BLOCK_RECEIPT_BATCH_SIZE = 100
+# Error text meaning the node lacks a method (JSON-RPC -32601), as opposed to
+# a transient failure such as "header not found" from a node that lags.
+UNSUPPORTED_METHOD_MARKERS = ("-32601", "method not found", "does not exist", "not supported")
+# A head seen this recently stands in for eth_blockNumber in the tx finality
+# check. It can only lag the real head, which makes the check stricter.
+HEAD_REUSE_SECONDS = 15
+# get_blocks: blocks per JSON-RPC batch, batches in flight, cap per call.
+DEFAULT_BLOCK_RANGE_BATCH_SIZE = 50
+BLOCK_RANGE_PIPELINE_DEPTH = 3
+MAX_BLOCK_RANGE = 10000
+# Etherscan getcontractcreation accepts up to 5 addresses per request.
+CONTRACT_CREATION_BATCH_SIZE = 5
+MAX_CONTRACT_CREATIONS = 500
+# eth_getCode probes per round (one JSON-RPC batch) in the RPC creation search.
+CREATION_SEARCH_FANOUT = 8
+# get_block_by_time: interpolation probes sit at est +/- span // this divisor
+# (plus est-1/est/est+1 and the bracket midpoint).
+BLOCK_TIME_PROBE_SPREAD = 64
+BLOCK_TIME_CLOSEST = ("before", "after")
+# get_block_by_time: rounds allowed beyond log2(widest bracket) before the
+# search gives up (each round at least halves every open bracket).
+BLOCK_TIME_MAX_EXTRA_ROUNDS = 64
+
+# Multicall3 is deployed at the same address on (almost) every EVM chain; see
+# https://www.multicall3.com/deployments. Used to collapse many read-only calls
+# (token symbol/decimals/name) into a single `eth_call`. Chains where it isn't
+# deployed answer `0x` and we fall back to per-call `eth_call`s.
+MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+MULTICALL3_AGGREGATE3_SIGNATURE = "aggregate3((address,bool,bytes)[])"
+MULTICALL3_RESULT_OUTPUTS: List[Dict[str, Any]] = [
+    {
+        "name": "returnData",
+        "type": "tuple[]",
+        "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"},
+        ],
+    }
+]
+# Sub-calls per aggregate3 request. Keeps a single eth_call well under node
+# gas caps; several chunks still go out in one JSON-RPC batch on the RPC path.
+MULTICALL3_MAX_CALLS = 150
 
 # Allowed values for `get_transaction_summary(compact=True, flow_scope=...)`:
 # - "user":        keep only flow rows whose address == tx.from
@@ -35,8 +133,25 @@ FLOW_SCOPE_USER_ROUTER = "user_router"
 FLOW_SCOPE_ALL = "all"
 FLOW_SCOPES = (FLOW_SCOPE_USER, FLOW_SCOPE_USER_ROUTER, FLOW_SCOPE_ALL)
 
-# Increase precision for Decimal-based formatting
-getcontext().prec = 100
+
+_context_pool_class: Optional[type] = None
+
+
+def _thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """ThreadPoolExecutor whose tasks run in a copy of the submitter's
+    context, so a tool call's metrics scope (`metrics._IN_TOOL`) carries over
+    to its workers. `concurrent.futures` is imported on first use."""
+    global _context_pool_class
+    if _context_pool_class is None:
+        import contextvars
+        from concurrent.futures import ThreadPoolExecutor
+
+        class _ContextThreadPool(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def]
+                return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+        _context_pool_class = _ContextThreadPool
+    return _context_pool_class(max_workers=max_workers)
 
 
 class _TransientCallError(Exception):
@@ -46,39 +161,54 @@ class _TransientCallError(Exception):
     `None` for a field whose lookup just hit a flaky network condition."""
 
 
+@instrument_tools(exclude=("wait_for_background",))
 class ContractService:
     """Combine configuration, cache, and client to serve contract details."""
 
     def __init__(self, config: Config) -> None:
         self.config = config
         cache_dir = config.cache_dir
-        # Persist the two caches whose entries are small and stable per
-        # (chain, address): token metadata (symbol/decimals/name) and contract
-        # names. Skip full contract details (source code = huge) and proxy /
-        # creation info (proxies upgrade, creation lookups are cheap).
-        self.cache = ContractCache()
-        self.creation_cache = ContractCache()
-        self.proxy_cache = ContractCache()
+        # Persist the caches whose entries are small and stable per
+        # (chain, address): token metadata (symbol/decimals/name), contract
+        # names, creation info (immutable once final; the RPC fallback behind
+        # it is a search over chain history) and slot-verified proxy info
+        # (revalidated against upgrade events, see `_cached_proxy_info`).
+        # Skip full contract details (source code = huge).
+        self.cache = ContractCache(name="contract")
+        self.creation_cache = ContractCache(
+            disk_path=(cache_dir / "contract_creations.json") if cache_dir else None, name="contract_creation"
+        )
+        self.proxy_cache = ContractCache(disk_path=(cache_dir / "proxies.json") if cache_dir else None, name="proxy")
+        # "chain:address" -> monotonic time of the last upgrade-log check.
+        self._proxy_checked_at: Dict[str, float] = {}
         self.contract_name_cache = ContractCache(
-            disk_path=(cache_dir / "contract_names.json") if cache_dir else None
+            disk_path=(cache_dir / "contract_names.json") if cache_dir else None, name="contract_name"
         )
         self.token_metadata_cache = ContractCache(
-            disk_path=(cache_dir / "token_metadata.json") if cache_dir else None
-        )
-        self._rpc_clients: Dict[str, RpcClient] = {}
-        self.client = EtherscanClient(
-            api_key=config.api_key,
-            base_url=config.base_url,
-            chain_id=config.chain_id,
-            timeout=config.request_timeout,
-            max_retries=config.max_retries,
-            backoff_seconds=config.backoff_seconds,
+            disk_path=(cache_dir / "token_metadata.json") if cache_dir else None, name="token_metadata"
         )
-        self.chains = ChainRegistry(
-            client=self.client,
-            chainlist_url=config.chainlist_url,
-            ttl_seconds=config.chainlist_ttl_seconds,
+        # Finalized tx + receipt pairs and computed tx summaries: immutable
+        # once `tx_finality_depth` blocks deep, one gzip file per entry.
+        self.tx_cache = BlobCache((cache_dir / "tx") if cache_dir else None, name="tx")
+        # Sparse (block, timestamp) samples of final blocks; seeds get_block_by_time.
+        self.block_time_index = BlockTimeIndex(
+            disk_path=(cache_dir / "block_times.json") if cache_dir else None,
+            finality_depth=config.tx_finality_depth,
         )
+        self._rpc_clients: Dict[str, RpcClient] = {}
+        # Compiled ABI output decoders keyed by the JSON of the output spec,
+        # least recently used first. Shared by pool workers, hence the lock.
+        self._decoder_plans: "OrderedDict[str, Callable[[bytes], List[Any]]]" = OrderedDict()
+        self._decoder_plans_lock = threading.Lock()
+        # chain ids where Multicall3 answered `0x` (not deployed); skip it there.
+        self._multicall3_unavailable: set = set()
+        # Chains whose RPC rejected eth_getBlockReceipts (get_block_summary).
+        self._block_receipts_unsupported: set = set()
+        # Etherscan client and chain registry are built on first use (see the
+        # `client` / `chains` properties), so offline commands never create them.
+        self._client: Optional[EtherscanClient] = None
+        self._chains: Optional[ChainRegistry] = None
+        self._lazy_lock = threading.Lock()
 
         # Best-effort: if NETWORK is not in the static fallback map and CHAIN_ID is not set,
         # resolve the default chain via /v2/chainlist once at startup.
@@ -93,6 +223,54 @@ class ContractService:
                 except Exception:
                     pass
 
+    @property
+    def client(self) -> EtherscanClient:
+        if self._client is None:
+            with self._lazy_lock:
+                if self._client is None:
+                    from .etherscan_client import EtherscanClient
+
+                    config = self.config
+                    self._client = EtherscanClient(
+                        api_key=config.api_key,
+                        base_url=config.base_url,
+                        chain_id=config.chain_id,
+                        timeout=config.request_timeout,
+                        max_retries=config.max_retries,
+                        backoff_seconds=config.backoff_seconds,
+                    )
+        return self._client
+
+    @client.setter
+    def client(self, value: EtherscanClient) -> None:
+        self._client = value
+
+    @property
+    def chains(self) -> ChainRegistry:
+        if self._chains is None:
+            client = self.client
+            cache_dir = self.config.cache_dir
+            with self._lazy_lock:
+                if self._chains is None:
+                    self._chains = ChainRegistry(
+                        client=client,
+                        chainlist_url=self.config.chainlist_url,
+                        ttl_seconds=self.config.chainlist_ttl_seconds,
+                        snapshot_path=(cache_dir / "chainlist.json") if cache_dir else None,
+                    )
+        return self._chains
+
+    @chains.setter
+    def chains(self, value: ChainRegistry) -> None:
+        self._chains = value
+
+    def wait_for_background(self, timeout: float) -> None:
+        """Give background work (a stale chainlist being refreshed) up to
+        `timeout` seconds to finish; a one-shot CLI calls this before exit
+        so the refreshed snapshot reaches disk."""
+        if self._chains is not None:
+            self._chains.wait_for_refresh(timeout)
+
     def fetch_contract(
         self,
         address: str,
@@ -177,41 +355,164 @@ class ContractService:
         try:
             payload = self.client.get_contract_creation(normalized_address)
             result = self._extract_result_list(payload, require_non_empty=True)
-            entry = result[0]
-
-            creator = entry.get("contractCreator") or entry.get("ContractCreator") or ""
-            tx_hash = entry.get("txHash") or entry.get("TxHash") or ""
-            block_number = entry.get("blockNumber") or entry.get("BlockNumber") or ""
-            timestamp = entry.get("timeStamp") or entry.get("timestamp")
-
-            data = {
-                "address": normalized_address,
-                "network": network_label,
-                "chain_id": chain_id,
-                "creator": str(creator).lower() if creator else "",
-                "tx_hash": str(tx_hash).lower() if tx_hash else "",
-                "block_number": str(block_number) if block_number is not None else "",
-                "timestamp": str(timestamp) if timestamp is not None else None,
-                "source": "etherscan",
-                "complete": bool(creator and tx_hash),
-            }
+            data = self._map_contract_creation(result[0], normalized_address, network_label, chain_id)
             self.creation_cache.set(normalized_address, chain_id, data)
             return data
         except Exception as exc:
-            if not rpc:
-                raise ValueError(
-                    f"{exc} "
-                    f"(RPC fallback unavailable; set RPC_URL_{chain_id} or RPC_{chain_id} "
-                    "to enable best-effort creation lookup.)"
-                ) from exc
+            return self._get_contract_creation_fallback(exc, normalized_address, network_label, chain_id, rpc)
+
+    def get_contract_creations(
+        self, addresses: Sequence[str], network: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Bulk `get_contract_creation`. Cached addresses are served locally;
+        the rest go to Etherscan `getcontractcreation` in chunks of
+        `CONTRACT_CREATION_BATCH_SIZE` (requests run concurrently). A chunk
+        whose request fails is retried once per address, so one bad address
+        or a transient error does not send the whole chunk to the slow path.
+        Addresses still unanswered (failed request, EOA, not indexed) fall
+        back individually to the RPC search. Per-address failures land in `errors`
+        instead of failing the whole call."""
+        if isinstance(addresses, (str, bytes)) or not isinstance(addresses, Sequence):
+            raise ValueError("addresses must be an array of contract addresses.")
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        normalized: List[str] = []
+        for address in addresses:
+            addr = self._normalize_address(address)
+            if addr not in normalized:
+                normalized.append(addr)
+        if len(normalized) > MAX_CONTRACT_CREATIONS:
+            raise ValueError(
+                f"get_contract_creations accepts at most {MAX_CONTRACT_CREATIONS} addresses; got {len(normalized)}."
+            )
+
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for addr in normalized:
+            cached = self.creation_cache.get(addr, chain_id)
+            if cached:
+                found[addr] = cached
+            else:
+                missing.append(addr)
+
+        chunks = [
+            missing[i : i + CONTRACT_CREATION_BATCH_SIZE]
+            for i in range(0, len(missing), CONTRACT_CREATION_BATCH_SIZE)
+        ]
 
+        def fetch(chunk: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Optional[Exception]]:
             try:
-                data = self._get_contract_creation_via_rpc(normalized_address, network_label, chain_id, rpc)
-            except Exception as rpc_exc:
-                raise ValueError(f"{exc} (RPC fallback failed: {rpc_exc})") from rpc_exc
+                payload = self.client.get_contract_creations(chunk)
+                rows = self._extract_result_list(payload, require_non_empty=False)
+            except Exception as exc:  # pylint: disable=broad-except
+                return {}, exc
+            mapped: Dict[str, Dict[str, Any]] = {}
+            for entry in rows:
+                if not isinstance(entry, dict):
+                    continue
+                addr = str(entry.get("contractAddress") or entry.get("ContractAddress") or "").lower()
+                if addr in chunk:
+                    mapped[addr] = self._map_contract_creation(entry, addr, network_label, chain_id)
+            return mapped, None
+
+        def fetch_chunk(chunk: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+            mapped, exc = fetch(chunk)
+            if exc is None:
+                return mapped, {}
+            if len(chunk) == 1:
+                return mapped, {chunk[0]: exc}
+            errors: Dict[str, Exception] = {}
+            for addr in chunk:
+                single, single_exc = fetch([addr])
+                mapped.update(single)
+                if single_exc is not None:
+                    errors[addr] = single_exc
+            return mapped, errors
+
+        failures: Dict[str, Exception] = {}
+        if chunks:
+            with _thread_pool(min(self.config.metadata_fetch_concurrency, len(chunks))) as pool:
+                for chunk, (mapped, chunk_errors) in zip(chunks, pool.map(fetch_chunk, chunks)):
+                    self.creation_cache.set_many(mapped, chain_id)
+                    found.update(mapped)
+                    for addr in chunk:
+                        if addr not in mapped:
+                            failures[addr] = chunk_errors.get(addr) or ValueError(
+                                "Etherscan returned no creation info."
+                            )
+
+        errors: List[Dict[str, Any]] = []
+        if failures:
+            def fallback(addr: str) -> Tuple[str, Any]:
+                try:
+                    return addr, self._get_contract_creation_fallback(
+                        failures[addr], addr, network_label, chain_id, rpc
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    return addr, exc
 
-            self.creation_cache.set(normalized_address, chain_id, data)
-            return data
+            with _thread_pool(min(self.config.metadata_fetch_concurrency, len(failures))) as pool:
+                for addr, outcome in pool.map(fallback, list(failures)):
+                    if isinstance(outcome, Exception):
+                        errors.append({"address": addr, "error": str(outcome)})
+                    else:
+                        found[addr] = outcome
+
+        creations = [found[addr] for addr in normalized if addr in found]
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "count": len(creations),
+            "creations": creations,
+            "errors": errors,
+        }
+
+    def _map_contract_creation(
+        self, entry: Dict[str, Any], address: str, network_label: str, chain_id: str
+    ) -> Dict[str, Any]:
+        creator = entry.get("contractCreator") or entry.get("ContractCreator") or ""
+        tx_hash = entry.get("txHash") or entry.get("TxHash") or ""
+        block_number = entry.get("blockNumber") or entry.get("BlockNumber") or ""
+        timestamp = entry.get("timeStamp") or entry.get("timestamp")
+
+        return {
+            "address": address,
+            "network": network_label,
+            "chain_id": chain_id,
+            "creator": str(creator).lower() if creator else "",
+            "tx_hash": str(tx_hash).lower() if tx_hash else "",
+            "block_number": str(block_number) if block_number is not None else "",
+            "timestamp": str(timestamp) if timestamp is not None else None,
+            "source": "etherscan",
+            "complete": bool(creator and tx_hash),
+        }
+
+    def _get_contract_creation_fallback(
+        self,
+        exc: Exception,
+        address: str,
+        network_label: str,
+        chain_id: str,
+        rpc: Optional[RpcClient],
+    ) -> Dict[str, Any]:
+        if not rpc:
+            raise ValueError(
+                f"{exc} "
+                f"(RPC fallback unavailable; set RPC_URL_{chain_id} or RPC_{chain_id} "
+                "to enable best-effort creation lookup.)"
+            ) from exc
+
+        try:
+            data, finalized = self._get_contract_creation_via_rpc(address, network_label, chain_id, rpc)
+        except Exception as rpc_exc:
+            raise ValueError(f"{exc} (RPC fallback failed: {rpc_exc})") from rpc_exc
+
+        # A deployment block still within reorg range stays memory-only.
+        self.creation_cache.set(address, chain_id, data, persist=finalized)
+        return data
 
     def _get_contract_creation_via_rpc(
         self,
@@ -219,34 +520,49 @@ class ContractService:
         network_label: str,
         chain_id: str,
         rpc: RpcClient,
-    ) -> Dict[str, Any]:
-        code_latest = rpc.call("eth_getCode", [address, "latest"])
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Locate the deployment block by historical `eth_getCode` and the
+        creating tx within it. Returns `(data, finalized)`; `finalized` is
+        whether the deployment block is `tx_finality_depth` below head."""
+        code_latest, head = rpc.batch_request([("eth_getCode", [address, "latest"]), ("eth_blockNumber", [])])
         if not isinstance(code_latest, str):
             raise ValueError("RPC error: eth_getCode returned unexpected result.")
         if code_latest.lower() in {"0x", "0x0"}:
             raise ValueError("RPC error: address has no contract code at latest.")
+        if not isinstance(head, str) or not head.startswith("0x"):
+            raise ValueError("RPC error: eth_blockNumber returned unexpected result.")
+        latest_block = int(head, 16)
 
-        latest_block = rpc.get_block_number()
-
-        def has_code(block_number: int) -> bool:
+        def has_code(block_numbers: List[int]) -> List[bool]:
             try:
-                code = rpc.call("eth_getCode", [address, hex(block_number)])
+                codes = rpc.batch_call("eth_getCode", [[address, hex(n)] for n in block_numbers])
             except Exception as exc:
                 raise ValueError(
                     "RPC error: failed to query historical contract code; an archive/full-history node may be required."
                 ) from exc
-            if not isinstance(code, str):
+            if not all(isinstance(code, str) for code in codes):
                 raise ValueError("RPC error: eth_getCode returned unexpected result.")
-            return code.lower() not in {"0x", "0x0"}
+            return [code.lower() not in {"0x", "0x0"} for code in codes]
 
+        # k-ary search for the first block with code: each round probes
+        # CREATION_SEARCH_FANOUT evenly spaced blocks of [lo, hi) in one
+        # JSON-RPC batch, shrinking the range ~(fanout + 1)x per round trip.
         lo = 0
         hi = latest_block
         while lo < hi:
-            mid = (lo + hi) // 2
-            if has_code(mid):
-                hi = mid
-            else:
-                lo = mid + 1
+            span = hi - lo
+            probes = sorted(
+                {lo + (span * i) // (CREATION_SEARCH_FANOUT + 1) for i in range(1, CREATION_SEARCH_FANOUT + 1)}
+            )
+            if span <= CREATION_SEARCH_FANOUT:
+                probes = list(range(lo, hi))
+            new_lo, new_hi = lo, hi
+            for block_number, present in zip(probes, has_code(probes)):
+                if present:
+                    new_hi = block_number
+                    break
+                new_lo = block_number + 1
+            lo, hi = new_lo, new_hi
 
         deployment_block = lo
 
@@ -265,27 +581,31 @@ class ContractService:
         creator = ""
         tx_hash = ""
 
+        # Contract-creating txs (to == null) in the deployment block; all
+        # their receipts come back in one batch.
+        candidates: List[Dict[str, Any]] = []
         txs = block.get("transactions")
         if isinstance(txs, list):
             for tx in txs:
-                if not isinstance(tx, dict):
-                    continue
-                if tx.get("to") is not None:
+                if not isinstance(tx, dict) or tx.get("to") is not None:
                     continue
                 tx_hash_candidate = tx.get("hash")
-                if not isinstance(tx_hash_candidate, str) or not tx_hash_candidate:
-                    continue
-                receipt = rpc.call("eth_getTransactionReceipt", [tx_hash_candidate])
-                if not isinstance(receipt, dict):
-                    continue
-                created = receipt.get("contractAddress")
-                if isinstance(created, str) and created.lower() == address.lower():
-                    tx_hash = tx_hash_candidate.lower()
-                    creator_candidate = tx.get("from")
-                    creator = str(creator_candidate).lower() if creator_candidate else ""
-                    break
+                if isinstance(tx_hash_candidate, str) and tx_hash_candidate:
+                    candidates.append(tx)
+        receipts = (
+            rpc.batch_call("eth_getTransactionReceipt", [[tx["hash"]] for tx in candidates]) if candidates else []
+        )
+        for tx, receipt in zip(candidates, receipts):
+            if not isinstance(receipt, dict):
+                continue
+            created = receipt.get("contractAddress")
+            if isinstance(created, str) and created.lower() == address.lower():
+                tx_hash = tx["hash"].lower()
+                creator_candidate = tx.get("from")
+                creator = str(creator_candidate).lower() if creator_candidate else ""
+                break
 
-        return {
+        data = {
             "address": address,
             "network": network_label,
             "chain_id": chain_id,
@@ -296,48 +616,291 @@ class ContractService:
             "source": "rpc",
             "complete": bool(creator and tx_hash),
         }
+        return data, latest_block - deployment_block >= self.config.tx_finality_depth
 
     def detect_proxy(self, address: str, network: Optional[str] = None) -> Dict[str, Any]:
-        normalized_address, network_label, chain_id = self._prepare_context(address, network)
+        return self.detect_proxies([address], network)["proxies"][0]
+
+    def detect_proxies(self, addresses: Sequence[str], network: Optional[str] = None) -> Dict[str, Any]:
+        """Classify many addresses as proxies.
+
+        Slot reads: the EIP-1967 implementation / admin / beacon slots, the
+        legacy OpenZeppelin (zos) implementation slot, the EIP-1822
+        `PROXIABLE` slot and the runtime code (EIP-1167 minimal proxies embed
+        the implementation in their bytecode). Then each distinct beacon is
+        asked for `implementation()`.
+        - With RPC, all slot reads plus `eth_blockNumber` go out together as
+          JSON-RPC batches of up to `RPC_BATCH_MAX_CALLS` calls, 6 per
+          address: one batch for up to 33 addresses, about 15 for the
+          maximum of 500. Beacons take one more batch.
+        - Without RPC, every read is its own rate-limited Etherscan request,
+          run concurrently. Only the three EIP-1967 slots are read at first.
+          The zos / 1822 slots and the code are read only for addresses where
+          all three are empty. The head block comes from `block_time_index`
+          instead of an extra request.
+        Results are written to `proxy_cache` with the head block they were
+        read at (`verified_block`). Only proxies with a known `verified_block`
+        go to disk: non-proxies (code can still be deployed or replaced) and
+        unverified entries stay in memory (see `_cached_proxy_info`)."""
+        if isinstance(addresses, (str, bytes)) or not isinstance(addresses, Sequence):
+            raise ValueError("addresses must be an array of contract addresses.")
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        normalized: List[str] = []
+        for address in addresses:
+            addr = self._normalize_address(address)
+            if addr not in normalized:
+                normalized.append(addr)
+        if not normalized:
+            raise ValueError("addresses must contain at least one address.")
+        if len(normalized) > MAX_PROXY_DETECTIONS:
+            raise ValueError(
+                f"detect_proxies accepts at most {MAX_PROXY_DETECTIONS} addresses; got {len(normalized)}."
+            )
 
-        allow_default_rpc = network is None
-        impl_word = self._read_storage_word(
-            normalized_address,
-            EIP1967_IMPLEMENTATION_SLOT,
-            "latest",
-            chain_id=chain_id,
-            allow_default_rpc=allow_default_rpc,
-        )
-        admin_word = self._read_storage_word(
-            normalized_address,
-            EIP1967_ADMIN_SLOT,
-            "latest",
-            chain_id=chain_id,
-            allow_default_rpc=allow_default_rpc,
-        )
+        rpc = self._get_rpc_client(chain_id, network is None)
+
+        words_by_addr: Dict[str, Dict[str, Optional[str]]] = {addr: {} for addr in normalized}
+        code_by_addr: Dict[str, Any] = {}
+
+        def read(
+            targets: List[str], slot_specs: Sequence[Tuple[str, str]], with_code: bool, with_head: bool = False
+        ) -> Any:
+            """Read `slot_specs` (and the code) of `targets` into the maps
+            above; returns the trailing `eth_blockNumber` result when asked."""
+            calls: List[Tuple[str, List[Any]]] = []
+            for addr in targets:
+                calls.extend(("eth_getStorageAt", [addr, slot, "latest"]) for _, slot in slot_specs)
+                if with_code:
+                    calls.append(("eth_getCode", [addr, "latest"]))
+            if with_head:
+                calls.append(("eth_blockNumber", []))
+            results = self._read_chain_batch(calls, chain_id, rpc) if calls else []
+            head = results.pop() if with_head else None
+            per_address = len(slot_specs) + int(with_code)
+            for idx, addr in enumerate(targets):
+                row = results[idx * per_address : (idx + 1) * per_address]
+                for (name, _), word in zip(slot_specs, row):
+                    words_by_addr[addr][name] = (
+                        self._normalize_hex_string(word, "storage_word", pad_to=64) if isinstance(word, str) else None
+                    )
+                if with_code:
+                    code_by_addr[addr] = row[-1]
+            return head
+
+        if rpc:
+            head = read(normalized, PROXY_STORAGE_SLOTS, with_code=True, with_head=True)
+            verified_block = int(head, 16) if isinstance(head, str) and head.startswith("0x") else None
+        else:
+            # Each read is a separate Etherscan request: most proxies answer
+            # from the EIP-1967 slots, so the rest is read only when needed.
+            verified_block = self.block_time_index.head(chain_id)
+            primary, fallback = PROXY_STORAGE_SLOTS[:3], PROXY_STORAGE_SLOTS[3:]
+            read(normalized, primary, with_code=False)
+            unresolved = [
+                addr for addr in normalized if not any(word and int(word, 16) for word in words_by_addr[addr].values())
+            ]
+            read(unresolved, fallback, with_code=True)
 
-        implementation = self._storage_word_to_address(impl_word)
-        admin = self._storage_word_to_address(admin_word)
+        proxies: Dict[str, Dict[str, Any]] = {}
+        beacons: List[str] = []
+        for addr in normalized:
+            proxies[addr] = self._classify_proxy(
+                addr, network_label, chain_id, words_by_addr[addr], code_by_addr.get(addr)
+            )
+            proxies[addr]["verified_block"] = verified_block
+            beacon = proxies[addr]["beacon"]
+            if beacon and beacon not in beacons:
+                beacons.append(beacon)
+
+        if beacons:
+            beacon_calls: List[Tuple[str, List[Any]]] = [
+                ("eth_call", [{"to": beacon, "data": BEACON_IMPLEMENTATION_SELECTOR}, "latest"]) for beacon in beacons
+            ]
+            try:
+                beacon_results = self._read_chain_batch(beacon_calls, chain_id, rpc)
+            except ValueError:
+                # One reverting "beacon" fails the whole batch: ask each beacon
+                # on its own so only the failing ones stay unresolved.
+                beacon_results = []
+                for call in beacon_calls:
+                    try:
+                        beacon_results.extend(self._read_chain_batch([call], chain_id, rpc))
+                    except ValueError:
+                        beacon_results.append(None)
+            beacon_impls = {
+                beacon: self._storage_word_to_address(raw) if isinstance(raw, str) and len(raw) == 66 else None
+                for beacon, raw in zip(beacons, beacon_results)
+            }
+            for info in proxies.values():
+                beacon = info["beacon"]
+                if not beacon:
+                    continue
+                impl = beacon_impls.get(beacon)
+                if impl and not info["implementation"]:
+                    info["implementation"] = impl
+                    info["evidence"].append(f"beacon {beacon}.implementation() -> {impl}")
+
+        durable = {
+            addr: info
+            for addr, info in proxies.items()
+            if info["is_proxy"] and isinstance(info["verified_block"], int)
+        }
+        self.proxy_cache.set_many(durable, chain_id)
+        self.proxy_cache.set_many(
+            {addr: info for addr, info in proxies.items() if addr not in durable}, chain_id, persist=False
+        )
+        now = time.monotonic()
+        for addr in normalized:
+            self._proxy_checked_at[f"{chain_id}:{addr}"] = now
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "count": len(normalized),
+            "proxies": [proxies[addr] for addr in normalized],
+        }
 
+    def _classify_proxy(
+        self,
+        address: str,
+        network_label: str,
+        chain_id: str,
+        words: Dict[str, Optional[str]],
+        code: Any,
+    ) -> Dict[str, Any]:
+        slot_by_name = dict(PROXY_STORAGE_SLOTS)
         evidence: List[str] = []
-        if impl_word:
-            evidence.append(f"implementation slot {EIP1967_IMPLEMENTATION_SLOT} -> {impl_word}")
-        if admin_word:
-            evidence.append(f"admin slot {EIP1967_ADMIN_SLOT} -> {admin_word}")
-
-        is_proxy = bool(implementation or admin)
+        for name, word in words.items():
+            if word and int(word, 16):
+                evidence.append(f"{name} slot {slot_by_name[name]} -> {word}")
+
+        implementation: Optional[str] = None
+        proxy_type: Optional[str] = None
+        code_hex = code.lower() if isinstance(code, str) else ""
+        if (
+            len(code_hex) == 2 + 2 * EIP1167_RUNTIME_LENGTH
+            and code_hex[2:].startswith(EIP1167_PREFIX)
+            and code_hex.endswith(EIP1167_SUFFIX)
+        ):
+            implementation = "0x" + code_hex[2 + len(EIP1167_PREFIX) : 2 + len(EIP1167_PREFIX) + 40]
+            proxy_type = "eip1167"
+            evidence.append(f"EIP-1167 minimal proxy bytecode -> {implementation}")
+
+        admin = self._storage_word_to_address(words.get("admin"))
+        beacon = self._storage_word_to_address(words.get("beacon"))
+        for name, kind in (
+            ("implementation", "eip1967"),
+            ("beacon", "eip1967_beacon"),
+            ("eip1822_proxiable", "eip1822"),
+            ("zeppelinos_implementation", "zeppelinos"),
+        ):
+            if proxy_type:
+                break
+            target = self._storage_word_to_address(words.get(name))
+            if target:
+                proxy_type = kind
+                implementation = None if name == "beacon" else target
+        if not proxy_type and admin:
+            proxy_type = "eip1967"
 
         return {
-            "address": normalized_address,
+            "address": address,
             "network": network_label,
             "chain_id": chain_id,
-            "is_proxy": is_proxy,
+            "is_proxy": proxy_type is not None,
             "implementation": implementation,
             "admin": admin,
-            "proxy_type": "eip1967" if is_proxy else None,
+            "beacon": beacon,
+            "proxy_type": proxy_type,
             "evidence": evidence,
         }
 
+    def _read_chain_batch(
+        self, calls: List[Tuple[str, List[Any]]], chain_id: str, rpc: Optional[RpcClient]
+    ) -> List[Any]:
+        """Run latest-state reads (`eth_getStorageAt` / `eth_getCode` /
+        `eth_call` / `eth_blockNumber`) as JSON-RPC batches of up to `RPC_BATCH_MAX_CALLS`, or as
+        concurrent Etherscan proxy requests when no RPC is configured."""
+        if rpc:
+            results: List[Any] = []
+            for start in range(0, len(calls), RPC_BATCH_MAX_CALLS):
+                results.extend(rpc.batch_request(calls[start : start + RPC_BATCH_MAX_CALLS]))
+            return results
+
+        self.client.chain_id = chain_id
+
+        def run(call: Tuple[str, List[Any]]) -> Any:
+            method, params = call
+            if method == "eth_getStorageAt":
+                payload = self.client.get_storage_at(*params)
+            elif method == "eth_getCode":
+                payload = self.client.get_code(*params)
+            elif method == "eth_call":
+                payload = self.client.call(params[0]["to"], params[0]["data"], params[1])
+            elif method == "eth_blockNumber":
+                payload = self.client.get_block_number()
+            else:
+                raise ValueError(f"Unsupported proxy method {method}.")
+            return self._extract_proxy_result(payload)
+
+        with _thread_pool(max(1, min(self.config.metadata_fetch_concurrency, len(calls)))) as pool:
+            return list(pool.map(run, calls))
+
+    def _cached_proxy_info(
+        self, address: str, chain_id: str, network_label: Optional[str], allow_default_rpc: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """`proxy_cache` entry for `address`, revalidated when it may be stale.
+
+        Entries carry the block their slots were read at. Instead of
+        re-reading every slot, one JSON-RPC batch asks for `Upgraded` /
+        `BeaconUpgraded` / `AdminChanged` logs from the proxy (and its
+        beacon) since that block: none means the entry still holds and
+        `verified_block` moves to head; any hit, or a failed log query (e.g.
+        range limits), re-runs detection. EIP-1167 clones are immutable and never rechecked.
+        Non-proxies have no event to watch (code can be deployed, or
+        redeployed via CREATE2, at any time): past `PROXY_REVALIDATE_INTERVAL`
+        they read as a miss so the caller detects again. A proxy entry without
+        `verified_block` is trusted only while there is no RPC to verify it."""
+        info = self.proxy_cache.get(address, chain_id)
+        if not info or info.get("proxy_type") == "eip1167":
+            return info
+        key = f"{chain_id}:{address}"
+        now = time.monotonic()
+        checked_at = self._proxy_checked_at.get(key)
+        fresh = checked_at is not None and now - checked_at < PROXY_REVALIDATE_INTERVAL
+        if not info.get("is_proxy"):
+            return info if fresh else None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        if not rpc:
+            return info
+        verified_block = info.get("verified_block")
+        if not isinstance(verified_block, int):
+            return None
+        if fresh:
+            return info
+
+        watched = [address] + ([info["beacon"]] if info.get("beacon") else [])
+        log_filter = {
+            "address": watched,
+            "topics": [[UPGRADED_TOPIC, BEACON_UPGRADED_TOPIC, ADMIN_CHANGED_TOPIC]],
+            "fromBlock": hex(verified_block + 1),
+            "toBlock": "latest",
+        }
+        try:
+            head, logs = rpc.batch_request([("eth_blockNumber", []), ("eth_getLogs", [log_filter])])
+        except Exception:
+            head, logs = None, None
+        if isinstance(logs, list) and not logs and isinstance(head, str) and head.startswith("0x"):
+            info = dict(info, verified_block=max(verified_block, int(head, 16)))
+            self.proxy_cache.set(address, chain_id, info)
+        else:
+            try:
+                info = self.detect_proxies([address], None if allow_default_rpc else network_label)["proxies"][0]
+            except Exception:
+                return None
+        self._proxy_checked_at[key] = now
+        return info
+
     def list_transactions(
         self,
         address: str,
@@ -424,13 +987,32 @@ class ContractService:
         to_block: Optional[Union[int, str]] = None,
         page: Optional[int] = None,
         offset: Optional[int] = None,
+        from_time: Optional[Union[int, str]] = None,
+        to_time: Optional[Union[int, str]] = None,
     ) -> Dict[str, Any]:
         normalized_address, network_label, chain_id = self._prepare_context(address, network)
         page_num = self._normalize_positive_int(page, DEFAULT_PAGE, "page")
         page_size = self._normalize_positive_int(offset, DEFAULT_OFFSET, "offset")
+        if from_time is not None and from_block is not None:
+            raise ValueError("Pass either from_block or from_time, not both.")
+        if to_time is not None and to_block is not None:
+            raise ValueError("Pass either to_block or to_time, not both.")
 
         allow_default_rpc = network is None
         rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        time_range: Dict[str, Any] = {}
+        if from_time is not None or to_time is not None:
+            start_time = self._parse_timestamp(from_time, "from_time") if from_time is not None else None
+            end_time = self._parse_timestamp(to_time, "to_time") if to_time is not None else None
+            if start_time is not None and end_time is not None and start_time > end_time:
+                raise ValueError("from_time cannot be greater than to_time.")
+            time_from_block, time_to_block = self._time_range_to_blocks(start_time, end_time, chain_id, rpc)
+            if start_time is not None:
+                from_block = time_from_block
+                time_range.update(from_time=start_time, from_block=time_from_block)
+            if end_time is not None:
+                to_block = time_to_block
+                time_range.update(to_time=end_time, to_block=time_to_block)
         if rpc:
             start_block = self._parse_block_number(from_block, 0, "from_block")
             if to_block is None:
@@ -442,10 +1024,12 @@ class ContractService:
 
             topics_list = self._normalize_topics_list(topics)
             needed = page_num * page_size
-            raw_logs: List[Dict[str, Any]] = []
+            # Mapped on arrival: raw RPC log dicts (blockHash, removed, ...)
+            # are dropped as soon as their chunk is consumed.
+            matched: List[LogRecord] = []
 
             current = start_block
-            while current <= end_block and len(raw_logs) < needed:
+            while current <= end_block and len(matched) < needed:
                 seg_end = min(end_block, current + RPC_LOGS_BLOCK_STEP - 1)
                 filt: Dict[str, Any] = {
                     "address": normalized_address,
@@ -460,14 +1044,14 @@ class ContractService:
                     raise ValueError("RPC error: eth_getLogs returned unexpected result.")
                 for entry in chunk:
                     if isinstance(entry, dict):
-                        raw_logs.append(entry)
-                        if len(raw_logs) >= needed:
+                        matched.append(self._map_log(entry))
+                        if len(matched) >= needed:
                             break
                 current = seg_end + 1
 
             start_idx = (page_num - 1) * page_size
             end_idx = start_idx + page_size
-            logs = [self._map_log(entry) for entry in raw_logs[start_idx:end_idx] if isinstance(entry, dict)]
+            logs = matched[start_idx:end_idx]
         else:
             start, end = self._normalize_block_range(from_block, to_block)
             topic_params = self._normalize_topics(topics)
@@ -478,7 +1062,7 @@ class ContractService:
             result = self._extract_result_list(payload, require_non_empty=False)
             logs = [self._map_log(entry) for entry in result if isinstance(entry, dict)]
 
-        return {
+        response: Dict[str, Any] = {
             "address": normalized_address,
             "network": network_label,
             "chain_id": chain_id,
@@ -486,6 +1070,50 @@ class ContractService:
             "page": page_num,
             "offset": page_size,
         }
+        response.update(time_range)
+        return response
+
+    def _time_range_to_blocks(
+        self,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        chain_id: str,
+        rpc: Optional[RpcClient],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Inclusive block range covering [start_time, end_time]: the first
+        block at/after `start_time` and the last block at/before `end_time`.
+
+        With RPC both bounds go through one `_resolve_blocks_by_time` pass in
+        "before" mode (first block >= T is the block after the last one
+        <= T - 1), so they share probe batches and the index."""
+        if not rpc:
+            self.client.chain_id = chain_id
+            bounds: List[Optional[int]] = []
+            for value, closest in ((start_time, "after"), (end_time, "before")):
+                if value is None:
+                    bounds.append(None)
+                    continue
+                result = self._extract_proxy_result(self.client.get_block_number_by_time(value, closest))
+                try:
+                    bounds.append(int(str(result).strip()))
+                except (TypeError, ValueError):
+                    raise ValueError(f"Etherscan error: {result}.")
+            return bounds[0], bounds[1]
+
+        targets = [t for t in (None if start_time is None else start_time - 1, end_time) if t is not None]
+        resolved, _ = self._resolve_blocks_by_time(targets, chain_id, rpc, "before")
+        hits = iter(resolved)
+        start_block: Optional[int] = None
+        end_block: Optional[int] = None
+        if start_time is not None:
+            before_start = next(hits)
+            start_block = 0 if before_start is None else before_start[0] + 1
+        if end_time is not None:
+            before_end = next(hits)
+            if before_end is None:
+                raise ValueError(f"to_time {end_time} is before the chain's genesis block.")
+            end_block = before_end[0]
+        return start_block, end_block
 
     def get_storage_at(
         self,
@@ -523,31 +1151,140 @@ class ContractService:
 
         allow_default_rpc = network is None
         rpc = self._get_rpc_client(chain_id, allow_default_rpc)
-        if rpc:
-            tx_result = rpc.call("eth_getTransactionByHash", [normalized_hash])
-            if tx_result is not None and not isinstance(tx_result, dict):
-                raise ValueError("RPC error: eth_getTransactionByHash returned unexpected result.")
+        tx_result, receipt_result, _ = self._fetch_transactions_with_receipts(
+            [normalized_hash], chain_id, rpc
+        )[0]
 
-            receipt_result = rpc.call("eth_getTransactionReceipt", [normalized_hash])
-            if receipt_result is not None and not isinstance(receipt_result, dict):
-                raise ValueError("RPC error: eth_getTransactionReceipt returned unexpected result.")
+        return self._tx_data(normalized_hash, network_label, chain_id, tx_result, receipt_result)
+
+    def _fetch_transactions_with_receipts(
+        self,
+        tx_hashes: List[str],
+        chain_id: str,
+        rpc: Optional[RpcClient],
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], bool]]:
+        """Raw `(transaction, receipt, finalized)` per hash, in input order.
+
+        Finalized pairs (receipt at least `tx_finality_depth` blocks below
+        head) are served from / written to `tx_cache`. The rest go out with
+        an `eth_blockNumber` for the finality check: on the RPC path every
+        request shares one JSON-RPC batch; the Etherscan proxy path has no
+        batching, so the requests run concurrently instead. On both paths a
+        head recorded in `block_time_index` within `HEAD_REUSE_SECONDS`
+        replaces the extra request, and a failed head read only means nothing
+        is marked finalized."""
+        results: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], bool]] = {}
+        missing: List[str] = []
+        for tx_hash in tx_hashes:
+            cached = self.tx_cache.get(self._tx_cache_key("raw", chain_id, tx_hash))
+            if isinstance(cached, dict):
+                results[tx_hash] = (cached.get("transaction"), cached.get("receipt"), True)
+            elif tx_hash not in missing:
+                missing.append(tx_hash)
+        if not missing:
+            return [results[tx_hash] for tx_hash in tx_hashes]
+
+        recent_head = self.block_time_index.head(chain_id, max_age=HEAD_REUSE_SECONDS)
+        if rpc:
+            calls: List[Tuple[str, List[Any]]] = []
+            for tx_hash in missing:
+                calls.append(("eth_getTransactionByHash", [tx_hash]))
+                calls.append(("eth_getTransactionReceipt", [tx_hash]))
+            if recent_head is not None:
+                head_result: Any = hex(recent_head)
+                raw = rpc.batch_request(calls)
+            else:
+                try:
+                    head_result, *raw = rpc.batch_request([("eth_blockNumber", [])] + calls)
+                except ValueError:
+                    # Any failed item fails the batch: refetch without the
+                    # head so a head-read failure cannot lose the tx data.
+                    raw = rpc.batch_request(calls)
+                    try:
+                        head_result = rpc.call("eth_blockNumber", [])
+                    except ValueError:
+                        head_result = None
+            if len(raw) != len(calls):
+                raise ValueError("RPC error: transaction batch returned unexpected result count.")
+            for idx in range(0, len(raw), 2):
+                if raw[idx] is not None and not isinstance(raw[idx], dict):
+                    raise ValueError("RPC error: eth_getTransactionByHash returned unexpected result.")
+                if raw[idx + 1] is not None and not isinstance(raw[idx + 1], dict):
+                    raise ValueError("RPC error: eth_getTransactionReceipt returned unexpected result.")
         else:
-            tx_payload = self.client.get_transaction(normalized_hash)
-            tx_result = self._extract_proxy_result(tx_payload, allow_none=True)
+            self.client.chain_id = chain_id
 
-            receipt_payload = self.client.get_transaction_receipt(normalized_hash)
-            receipt_result = self._extract_proxy_result(receipt_payload, allow_none=True)
+            def fetch_head() -> Any:
+                if recent_head is not None:
+                    return hex(recent_head)
+                try:
+                    return self._extract_proxy_result(self.client.get_block_number())
+                except Exception:  # pylint: disable=broad-except
+                    # Without a head nothing is finalized; the receipts still stand.
+                    return None
+
+            fetchers: List[Callable[[], Any]] = [fetch_head]
+            for tx_hash in missing:
+                fetchers.append(lambda h=tx_hash: self.client.get_transaction(h))
+                fetchers.append(lambda h=tx_hash: self.client.get_transaction_receipt(h))
+            with _thread_pool(max(2, min(self.config.metadata_fetch_concurrency, len(fetchers)))) as pool:
+                payloads = list(pool.map(lambda fetch: fetch(), fetchers))
+            head_result = payloads[0]
+            raw = [self._extract_proxy_result(payload, allow_none=True) for payload in payloads[1:]]
+
+        head = head_result if isinstance(head_result, str) and head_result.startswith("0x") else None
+        head_int = int(head, 16) if head else None
+        if head_int is not None:
+            self.block_time_index.record_head(chain_id, head_int)
+        for idx, tx_hash in enumerate(missing):
+            tx_result, receipt_result = raw[2 * idx], raw[2 * idx + 1]
+            finalized = False
+            if isinstance(tx_result, dict) and isinstance(receipt_result, dict) and head_int is not None:
+                block_number = receipt_result.get("blockNumber")
+                if isinstance(block_number, str) and block_number.startswith("0x"):
+                    finalized = head_int - int(block_number, 16) >= self.config.tx_finality_depth
+            if finalized:
+                self.tx_cache.set(
+                    self._tx_cache_key("raw", chain_id, tx_hash),
+                    {"transaction": tx_result, "receipt": receipt_result},
+                )
+            results[tx_hash] = (tx_result, receipt_result, finalized)
+        return [results[tx_hash] for tx_hash in tx_hashes]
 
-        tx_obj = self._map_transaction_detail(tx_result) if tx_result else None
-        receipt_obj = self._map_receipt(receipt_result) if receipt_result else None
+    def _tx_cache_key(self, kind: str, chain_id: str, tx_hash: str, *variant: Any) -> str:
+        return ":".join([kind, str(chain_id), tx_hash.lower(), *(str(v) for v in variant)])
 
-        return {
-            "tx_hash": normalized_hash,
-            "network": network_label,
-            "chain_id": chain_id,
-            "transaction": tx_obj,
-            "receipt": receipt_obj,
-        }
+    def _tx_summary_cache_key(
+        self,
+        chain_id: str,
+        tx_hash: str,
+        decode_transfers: bool,
+        annotate_contracts: bool,
+        compact: bool,
+        flow_scope: str,
+    ) -> str:
+        return self._tx_cache_key(
+            "summary",
+            chain_id,
+            tx_hash,
+            int(bool(compact)),
+            # flow_scope only shapes compact output.
+            flow_scope if compact else "-",
+            int(bool(decode_transfers)),
+            int(bool(annotate_contracts)),
+        )
+
+    def _tx_summary_cacheable(
+        self, prepared: Dict[str, Any], token_metadata: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        """A finalized summary is only worth caching when every token it
+        shows resolved symbol + decimals; fields missing after a transient
+        lookup failure must be retried, not frozen into the cache."""
+        for addr in prepared["token_addresses"]:
+            meta = token_metadata.get(addr) or {}
+            if meta.get("symbol") is None or meta.get("decimals") is None:
+                return False
+        return True
 
     def get_transaction_summary(
         self,
@@ -576,14 +1313,227 @@ class ContractService:
         (address, token) row including pools / zero address mints+burns /
         aggregator middlemen. Ignored when compact=False.
         """
+        self._validate_flow_scope(flow_scope)
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        normalized_hash = self._normalize_tx_hash(tx_hash)
+        cache_key = self._tx_summary_cache_key(
+            chain_id, normalized_hash, decode_transfers, annotate_contracts, compact, flow_scope
+        )
+        cached = self.tx_cache.get(cache_key)
+        if isinstance(cached, dict):
+            cached["network"] = network_label
+            return cached
+
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        tx_result, receipt_result, finalized = self._fetch_transactions_with_receipts(
+            [normalized_hash], chain_id, rpc
+        )[0]
+        tx_data = self._tx_data(normalized_hash, network_label, chain_id, tx_result, receipt_result)
+        prepared = self._prepare_tx_summary(tx_data, decode_transfers)
+
+        token_metadata: Dict[str, Dict[str, Any]] = {}
+        if prepared["token_addresses"]:
+            token_metadata = self._get_token_metadata_many(
+                prepared["token_addresses"], network_label, chain_id, allow_default_rpc
+            )
+
+        contract_names: Dict[str, Optional[str]] = {}
+        if annotate_contracts and prepared["addresses_to_annotate"]:
+            contract_names = self._get_contract_names_many(
+                sorted(prepared["addresses_to_annotate"]), network_label, chain_id
+            )
+
+        summary = self._build_tx_summary(
+            prepared,
+            token_metadata,
+            contract_names,
+            decode_transfers=decode_transfers,
+            annotate_contracts=annotate_contracts,
+            compact=compact,
+            flow_scope=flow_scope,
+        )
+        if finalized and self._tx_summary_cacheable(prepared, token_metadata):
+            self.tx_cache.set(cache_key, summary)
+        return summary
+
+    def get_transaction_summaries(
+        self,
+        tx_hashes: Sequence[str],
+        network: Optional[str] = None,
+        decode_transfers: bool = True,
+        annotate_contracts: bool = True,
+        compact: bool = False,
+        flow_scope: str = FLOW_SCOPE_USER,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Bulk `get_transaction_summary`; see `iter_transaction_summaries`."""
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        summaries = list(
+            self.iter_transaction_summaries(
+                tx_hashes,
+                network,
+                decode_transfers,
+                annotate_contracts,
+                compact,
+                flow_scope,
+                batch_size,
+            )
+        )
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "count": len(summaries),
+            "summaries": summaries,
+        }
+
+    def iter_transaction_summaries(
+        self,
+        tx_hashes: Sequence[str],
+        network: Optional[str] = None,
+        decode_transfers: bool = True,
+        annotate_contracts: bool = True,
+        compact: bool = False,
+        flow_scope: str = FLOW_SCOPE_USER,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield `get_transaction_summary` results for many hashes, in input
+        order (duplicates dropped), one batch at a time as each completes.
+
+        Per batch: every tx + receipt in one JSON-RPC batch (concurrent
+        requests on the Etherscan proxy path), then token metadata for all
+        tokens not seen earlier in the run in one Multicall3 call, then
+        contract names for new addresses. Lookups are shared across the whole
+        run. The next batch's tx/receipt fetch overlaps the current batch's
+        metadata resolution. Finalized summaries come from / go to `tx_cache`
+        exactly as in `get_transaction_summary`."""
+        self._validate_flow_scope(flow_scope)
+        if isinstance(tx_hashes, (str, bytes)) or not isinstance(tx_hashes, Sequence):
+            raise ValueError("tx_hashes must be an array of transaction hashes.")
+        hashes: List[str] = []
+        seen_hashes: set = set()
+        for tx_hash in tx_hashes:
+            normalized = self._normalize_tx_hash(tx_hash)
+            if normalized not in seen_hashes:
+                seen_hashes.add(normalized)
+                hashes.append(normalized)
+        if len(hashes) > MAX_TX_SUMMARIES:
+            raise ValueError(
+                f"get_transaction_summaries accepts at most {MAX_TX_SUMMARIES} tx hashes; got {len(hashes)}."
+            )
+        batch_size_val = self._normalize_positive_int(
+            batch_size, DEFAULT_TX_SUMMARY_BATCH_SIZE, "batch_size"
+        )
+        if batch_size_val <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+
+        chunks = [hashes[i : i + batch_size_val] for i in range(0, len(hashes), batch_size_val)]
+        token_metadata: Dict[str, Dict[str, Any]] = {}
+        contract_names: Dict[str, Optional[str]] = {}
+
+        def cache_key(tx_hash: str) -> str:
+            return self._tx_summary_cache_key(
+                chain_id, tx_hash, decode_transfers, annotate_contracts, compact, flow_scope
+            )
+
+        def fetch(chunk: List[str]) -> Tuple[Dict[str, Any], List[Any]]:
+            # Summaries already cached for finalized txs skip the fetch.
+            cached: Dict[str, Any] = {}
+            for tx_hash in chunk:
+                hit = self.tx_cache.get(cache_key(tx_hash))
+                if isinstance(hit, dict):
+                    hit["network"] = network_label
+                    cached[tx_hash] = hit
+            to_fetch = [tx_hash for tx_hash in chunk if tx_hash not in cached]
+            fetched = self._fetch_transactions_with_receipts(to_fetch, chain_id, rpc) if to_fetch else []
+            return cached, list(zip(to_fetch, fetched))
+
+        with _thread_pool(1) as prefetcher:
+            pending = prefetcher.submit(fetch, chunks[0]) if chunks else None
+            for idx, chunk in enumerate(chunks):
+                cached, fetched = pending.result()
+                pending = prefetcher.submit(fetch, chunks[idx + 1]) if idx + 1 < len(chunks) else None
+
+                prepared_by_hash: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+                for tx_hash, (tx_result, receipt_result, finalized) in fetched:
+                    prepared_by_hash[tx_hash] = (
+                        self._prepare_tx_summary(
+                            self._tx_data(tx_hash, network_label, chain_id, tx_result, receipt_result),
+                            decode_transfers,
+                        ),
+                        finalized,
+                    )
+
+                new_tokens: List[str] = []
+                new_addresses: List[str] = []
+                for prepared, _ in prepared_by_hash.values():
+                    for addr in prepared["token_addresses"]:
+                        if addr not in token_metadata and addr not in new_tokens:
+                            new_tokens.append(addr)
+                    if annotate_contracts:
+                        for addr in sorted(prepared["addresses_to_annotate"]):
+                            if addr not in contract_names and addr not in new_addresses:
+                                new_addresses.append(addr)
+                if new_tokens:
+                    token_metadata.update(
+                        self._get_token_metadata_many(new_tokens, network_label, chain_id, allow_default_rpc)
+                    )
+                if new_addresses:
+                    contract_names.update(
+                        self._get_contract_names_many(new_addresses, network_label, chain_id)
+                    )
+
+                for tx_hash in chunk:
+                    if tx_hash in cached:
+                        yield cached[tx_hash]
+                        continue
+                    prepared, finalized = prepared_by_hash[tx_hash]
+                    summary = self._build_tx_summary(
+                        prepared,
+                        token_metadata,
+                        contract_names,
+                        decode_transfers=decode_transfers,
+                        annotate_contracts=annotate_contracts,
+                        compact=compact,
+                        flow_scope=flow_scope,
+                    )
+                    if finalized and self._tx_summary_cacheable(prepared, token_metadata):
+                        self.tx_cache.set(cache_key(tx_hash), summary)
+                    yield summary
+
+    def _validate_flow_scope(self, flow_scope: str) -> None:
         if flow_scope not in FLOW_SCOPES:
             raise ValueError(
                 f"flow_scope must be one of {'/'.join(FLOW_SCOPES)}; got {flow_scope!r}."
             )
-        tx_data = self.get_transaction(tx_hash, network)
-        normalized_hash = tx_data.get("tx_hash")
-        network_label = tx_data.get("network")
-        chain_id = tx_data.get("chain_id")
+
+    def _tx_data(
+        self,
+        normalized_hash: str,
+        network_label: str,
+        chain_id: str,
+        tx_result: Optional[Dict[str, Any]],
+        receipt_result: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """`get_transaction` response shape from raw RPC / proxy objects."""
+        return {
+            "tx_hash": normalized_hash,
+            "network": network_label,
+            "chain_id": chain_id,
+            "transaction": self._map_transaction_detail(tx_result) if tx_result else None,
+            "receipt": self._map_receipt(receipt_result) if receipt_result else None,
+        }
+
+    def _prepare_tx_summary(self, tx_data: Dict[str, Any], decode_transfers: bool) -> Dict[str, Any]:
+        """Network-free part of a tx summary: unique log addresses, decoded
+        ERC20 transfers (no metadata yet) and the token / contract addresses
+        the summary still needs lookups for."""
         tx = tx_data.get("transaction") or {}
         receipt = tx_data.get("receipt") or {}
         logs = receipt.get("logs") or []
@@ -623,25 +1573,68 @@ class ContractService:
             seen_token.add(low)
             token_addresses.append(low)
 
-        token_metadata: Dict[str, Dict[str, Any]] = {}
-        if token_addresses:
-            allow_default = network is None
-            with ThreadPoolExecutor(
-                max_workers=min(self.config.metadata_fetch_concurrency, len(token_addresses))
-            ) as pool:
-                results = pool.map(
-                    lambda a: (
-                        a,
-                        self._get_token_metadata(a, network_label, chain_id, allow_default_rpc=allow_default),
-                    ),
-                    token_addresses,
-                )
-                for addr, meta in results:
-                    token_metadata[addr] = meta
+        addresses_to_annotate = set(log_addresses)
+        tx_to = tx.get("to")
+        if isinstance(tx_to, str) and tx_to:
+            addresses_to_annotate.add(tx_to.lower())
 
-        for transfer in erc20_transfers:
-            meta = token_metadata.get(transfer["token_address"], {}) or {}
-            transfer["token_symbol"] = meta.get("symbol")
+        return {
+            "tx_hash": tx_data.get("tx_hash"),
+            "network": tx_data.get("network"),
+            "chain_id": tx_data.get("chain_id"),
+            "tx": tx,
+            "receipt": receipt,
+            "logs": logs,
+            "log_addresses": log_addresses,
+            "erc20_transfers": erc20_transfers,
+            "token_addresses": token_addresses,
+            "seen_token": seen_token,
+            "addresses_to_annotate": addresses_to_annotate,
+        }
+
+    def _get_contract_names_many(
+        self, addresses: List[str], network_label: Optional[str], chain_id: str
+    ) -> Dict[str, Optional[str]]:
+        contract_names: Dict[str, Optional[str]] = {}
+        if not addresses:
+            return contract_names
+        with _thread_pool(min(self.config.metadata_fetch_concurrency, len(addresses))) as pool:
+            results = pool.map(
+                lambda a: (a, self._get_contract_name_safe(a, network_label, chain_id)),
+                addresses,
+            )
+            for addr, name in results:
+                contract_names[addr] = name
+        return contract_names
+
+    def _build_tx_summary(
+        self,
+        prepared: Dict[str, Any],
+        token_metadata: Dict[str, Dict[str, Any]],
+        contract_names: Dict[str, Optional[str]],
+        *,
+        decode_transfers: bool,
+        annotate_contracts: bool,
+        compact: bool,
+        flow_scope: str,
+    ) -> Dict[str, Any]:
+        normalized_hash = prepared["tx_hash"]
+        network_label = prepared["network"]
+        chain_id = prepared["chain_id"]
+        tx = prepared["tx"]
+        receipt = prepared["receipt"]
+        logs = prepared["logs"]
+        log_addresses = prepared["log_addresses"]
+        seen_token = prepared["seen_token"]
+        addresses_to_annotate = prepared["addresses_to_annotate"]
+        tx_to = tx.get("to")
+
+        # Fresh copies: the prepared transfers may be shared (bulk runs) and
+        # the legacy schema annotates them in place.
+        erc20_transfers = [dict(transfer) for transfer in prepared["erc20_transfers"]]
+        for transfer in erc20_transfers:
+            meta = token_metadata.get(transfer["token_address"], {}) or {}
+            transfer["token_symbol"] = meta.get("symbol")
             transfer["token_decimals"] = meta.get("decimals")
             decimals = meta.get("decimals")
             amount_int = transfer.get("amount_int")
@@ -650,24 +1643,6 @@ class ContractService:
             else:
                 transfer["amount_scaled"] = None
 
-        addresses_to_annotate = set(log_addresses)
-        tx_to = tx.get("to")
-        if isinstance(tx_to, str) and tx_to:
-            addresses_to_annotate.add(tx_to.lower())
-
-        contract_names: Dict[str, Optional[str]] = {}
-        if annotate_contracts and addresses_to_annotate:
-            addrs_list = list(addresses_to_annotate)
-            with ThreadPoolExecutor(
-                max_workers=min(self.config.metadata_fetch_concurrency, len(addrs_list))
-            ) as pool:
-                results = pool.map(
-                    lambda a: (a, self._get_contract_name_safe(a, network_label, chain_id)),
-                    addrs_list,
-                )
-                for addr, name in results:
-                    contract_names[addr] = name
-
         addresses_summary: List[Dict[str, Any]] = []
         for addr in sorted(addresses_to_annotate):
             meta = token_metadata.get(addr, {}) or {}
@@ -806,46 +1781,7 @@ class ContractService:
             seen_proto.add(n)
             protocols.append(n)
 
-        # Net ERC20 flow per (address, token): sum of signed amounts. ERC20
-        # Transfer mints/burns show up as flows from/to 0x000...0; we keep them
-        # so callers see wrap/unwrap explicitly.
-        flow_int: Dict[Tuple[str, str], int] = {}
-        for tr in erc20_transfers:
-            token_addr = tr.get("token_address")
-            amount = tr.get("amount_int")
-            from_addr = tr.get("from")
-            to_addr = tr.get("to")
-            if not isinstance(token_addr, str) or not isinstance(amount, int):
-                continue
-            if isinstance(from_addr, str):
-                key = (from_addr, token_addr)
-                flow_int[key] = flow_int.get(key, 0) - amount
-            if isinstance(to_addr, str):
-                key = (to_addr, token_addr)
-                flow_int[key] = flow_int.get(key, 0) + amount
-
-        net_flow: List[Dict[str, Any]] = []
-        for (addr, token_addr), signed_amount in flow_int.items():
-            if signed_amount == 0:
-                continue
-            meta = token_metadata.get(token_addr) or {}
-            decimals = meta.get("decimals")
-            if isinstance(decimals, int) and decimals >= 0:
-                magnitude = self._format_scaled_int(abs(signed_amount), decimals)
-                amount_str = ("-" if signed_amount < 0 else "+") + (magnitude or "0")
-            else:
-                amount_str = ("-" if signed_amount < 0 else "+") + str(abs(signed_amount))
-            net_flow.append(
-                {
-                    "address": addr,
-                    "token_address": token_addr,
-                    "token_symbol": meta.get("symbol"),
-                    "amount": amount_str,
-                    "amount_int": signed_amount,
-                }
-            )
-        # Stable order: by address, then token, with larger |amount| first.
-        net_flow.sort(key=lambda r: (r["address"], -abs(r["amount_int"]), r["token_address"]))
+        net_flow = self._aggregate_net_token_flow(erc20_transfers, token_metadata)
 
         # flow_scope filter: drop pool / aggregator / zero-address rows when the
         # caller only cares about the signer's net position. tokens / contracts
@@ -907,6 +1843,51 @@ class ContractService:
             "compact": True,
         }
 
+    def _aggregate_net_token_flow(
+        self, erc20_transfers: List[Dict[str, Any]], token_metadata: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Net ERC20 flow per (address, token): sum of signed amounts. ERC20
+        # Transfer mints/burns show up as flows from/to 0x000...0; we keep them
+        # so callers see wrap/unwrap explicitly.
+        flow_int: Dict[Tuple[str, str], int] = {}
+        for tr in erc20_transfers:
+            token_addr = tr.get("token_address")
+            amount = tr.get("amount_int")
+            from_addr = tr.get("from")
+            to_addr = tr.get("to")
+            if not isinstance(token_addr, str) or not isinstance(amount, int):
+                continue
+            if isinstance(from_addr, str):
+                key = (from_addr, token_addr)
+                flow_int[key] = flow_int.get(key, 0) - amount
+            if isinstance(to_addr, str):
+                key = (to_addr, token_addr)
+                flow_int[key] = flow_int.get(key, 0) + amount
+
+        net_flow: List[Dict[str, Any]] = []
+        for (addr, token_addr), signed_amount in flow_int.items():
+            if signed_amount == 0:
+                continue
+            meta = token_metadata.get(token_addr) or {}
+            decimals = meta.get("decimals")
+            if isinstance(decimals, int) and decimals >= 0:
+                magnitude = self._format_scaled_int(abs(signed_amount), decimals)
+                amount_str = ("-" if signed_amount < 0 else "+") + (magnitude or "0")
+            else:
+                amount_str = ("-" if signed_amount < 0 else "+") + str(abs(signed_amount))
+            net_flow.append(
+                {
+                    "address": addr,
+                    "token_address": token_addr,
+                    "token_symbol": meta.get("symbol"),
+                    "amount": amount_str,
+                    "amount_int": signed_amount,
+                }
+            )
+        # Stable order: by address, then token, with larger |amount| first.
+        net_flow.sort(key=lambda r: (r["address"], -abs(r["amount_int"]), r["token_address"]))
+        return net_flow
+
     def get_block_by_number(
         self,
         block: Union[int, str],
@@ -922,53 +1903,750 @@ class ContractService:
         if tx_hashes_only:
             include_full_txs = False
 
-        allow_default_rpc = network is None
-        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
-        if rpc:
-            result = rpc.call("eth_getBlockByNumber", [tag, include_full_txs])
-        else:
-            payload = self.client.get_block_by_number(tag, include_full_txs)
-            result = self._extract_proxy_result(payload)
-        if not isinstance(result, dict):
-            raise ValueError("Unexpected block response.")
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        if rpc:
+            result = rpc.call("eth_getBlockByNumber", [tag, include_full_txs])
+        else:
+            payload = self.client.get_block_by_number(tag, include_full_txs)
+            result = self._extract_proxy_result(payload)
+        if not isinstance(result, dict):
+            raise ValueError("Unexpected block response.")
+        self._index_block_times(chain_id, [result], head_tag=tag == "latest")
+
+        block_obj = self._map_block(result, force_hashes_only=tx_hashes_only)
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "block": block_obj,
+            "full_transactions": include_full_txs,
+            "tx_hashes_only": bool(tx_hashes_only),
+        }
+
+    def get_blocks(
+        self,
+        from_block: Union[int, str],
+        to_block: Union[int, str],
+        network: Optional[str] = None,
+        header_only: bool = False,
+        full_transactions: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Range version of `get_block_by_number`; see `iter_blocks`."""
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        blocks = list(
+            self.iter_blocks(from_block, to_block, network, header_only, full_transactions, batch_size)
+        )
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "from_block": self._hex_to_int(blocks[0].number, "block_number") if blocks else None,
+            "to_block": self._hex_to_int(blocks[-1].number, "block_number") if blocks else None,
+            "header_only": bool(header_only),
+            "full_transactions": bool(full_transactions) and not header_only,
+            "count": len(blocks),
+            "blocks": blocks,
+        }
+
+    def iter_blocks(
+        self,
+        from_block: Union[int, str],
+        to_block: Union[int, str],
+        network: Optional[str] = None,
+        header_only: bool = False,
+        full_transactions: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[BlockRecord]:
+        """Yield blocks `from_block..to_block` (inclusive, `to_block` may be
+        "latest") in order, one batch at a time.
+
+        With RPC each batch of `batch_size` blocks is one JSON-RPC batch and
+        up to `BLOCK_RANGE_PIPELINE_DEPTH` batches are in flight at once, so a
+        10k-block scan is ~200 round trips mostly overlapped rather than 10k
+        sequential calls; without RPC every block is its own Etherscan proxy
+        request, issued concurrently. `header_only` requests hash-only
+        blocks and drops `transactions` in favour of `transaction_count` (the
+        JSON-RPC API has no header-only call, so this trims output rather
+        than transfer). The first and last block of each batch are offered to
+        `block_time_index`."""
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        batch_size_val = self._normalize_positive_int(
+            batch_size, DEFAULT_BLOCK_RANGE_BATCH_SIZE, "batch_size"
+        )
+        if batch_size_val <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        include_full_txs = bool(full_transactions) and not header_only
+
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        if rpc:
+            head = rpc.get_block_number()
+        else:
+            head = self._hex_to_int(self._extract_proxy_result(self.client.get_block_number()), "block_number")
+        self.block_time_index.record_head(chain_id, head)
+        start_block = self._parse_block_number(from_block, 0, "from_block")
+        if isinstance(to_block, str) and to_block.strip().lower() == "latest":
+            end_block = head
+        else:
+            end_block = min(self._parse_block_number(to_block, 0, "to_block"), head)
+        if start_block > end_block:
+            raise ValueError("from_block cannot be greater than to_block (or the latest block).")
+        if end_block - start_block + 1 > MAX_BLOCK_RANGE:
+            raise ValueError(
+                f"get_blocks would fetch {end_block - start_block + 1} blocks; maximum is {MAX_BLOCK_RANGE}. "
+                "Narrow the block range."
+            )
+
+        def fetch(numbers: List[int]) -> List[Any]:
+            calls = [("eth_getBlockByNumber", [hex(n), include_full_txs]) for n in numbers]
+            if rpc:
+                return rpc.batch_request(calls)
+            with _thread_pool(max(1, min(self.config.metadata_fetch_concurrency, len(numbers)))) as pool:
+                return list(
+                    pool.map(
+                        lambda n: self._extract_proxy_result(
+                            self.client.get_block_by_number(hex(n), include_full_txs)
+                        ),
+                        numbers,
+                    )
+                )
+
+        chunks = [
+            list(range(n, min(n + batch_size_val, end_block + 1)))
+            for n in range(start_block, end_block + 1, batch_size_val)
+        ]
+        depth = BLOCK_RANGE_PIPELINE_DEPTH if rpc else 1
+        try:
+            with _thread_pool(depth) as pipeline:
+                pending = [pipeline.submit(fetch, chunk) for chunk in chunks[:depth]]
+                for idx, chunk in enumerate(chunks):
+                    raw_blocks = pending.pop(0).result()
+                    if idx + depth < len(chunks):
+                        pending.append(pipeline.submit(fetch, chunks[idx + depth]))
+                    if len(raw_blocks) != len(chunk) or not all(isinstance(b, dict) for b in raw_blocks):
+                        raise ValueError("Unexpected block response.")
+                    # Only the batch's endpoints: the index wants coverage, not
+                    # every block of a (up to MAX_BLOCK_RANGE) range.
+                    self._index_block_times(chain_id, [raw_blocks[0], raw_blocks[-1]], flush=False)
+                    for raw in raw_blocks:
+                        mapped = self._map_block(raw, force_hashes_only=not include_full_txs)
+                        if header_only:
+                            txs, mapped.transactions = mapped.transactions, None
+                            mapped.transaction_count = len(txs) if isinstance(txs, list) else 0
+                        yield mapped
+        finally:
+            self.block_time_index.flush()
+
+    def get_block_time_by_number(
+        self, block: Union[int, str], network: Optional[str] = None
+    ) -> Dict[str, Any]:
+        block_data = self.get_block_by_number(block, network, full_transactions=False, tx_hashes_only=True)
+        blk = block_data["block"]
+        number_hex = blk.number
+        timestamp_hex = blk.timestamp
+
+        number_int = self._hex_to_int(number_hex, "block_number") if number_hex else None
+        timestamp_int = self._hex_to_int(timestamp_hex, "timestamp") if timestamp_hex else None
+        iso_time: Optional[str] = None
+        if timestamp_int is not None:
+            try:
+                import datetime
+
+                iso_time = datetime.datetime.utcfromtimestamp(timestamp_int).isoformat() + "Z"
+            except Exception:
+                iso_time = None
+
+        return {
+            "network": block_data.get("network"),
+            "chain_id": block_data.get("chain_id"),
+            "block_number": number_int,
+            "block_number_hex": number_hex,
+            "timestamp": timestamp_int,
+            "timestamp_hex": timestamp_hex,
+            "timestamp_iso": iso_time,
+        }
+
+    def get_block_by_time(
+        self,
+        timestamp: Union[int, str],
+        network: Optional[str] = None,
+        closest: str = "before",
+    ) -> Dict[str, Any]:
+        """
+        Reverse of `get_block_time_by_number`: the last block with timestamp
+        <= `timestamp` (closest="before") or the first block with timestamp
+        >= it (closest="after"). `timestamp` is unix seconds or ISO 8601
+        ("2024-01-01", "2024-01-01T12:00:00Z"; naive times are UTC).
+
+        With RPC this is a batched interpolation search (see
+        `_resolve_blocks_by_time`) seeded from `block_time_index`, a persisted
+        sparse set of final (block, timestamp) samples fed by every block
+        fetched: fresh lookups typically take 2-4 JSON-RPC batches, and a
+        timestamp whose neighbouring blocks are both indexed takes none.
+        Without RPC it falls back to Etherscan `getblocknobytime`.
+        """
+        closest = self._validate_closest(closest)
+        target = self._parse_timestamp(timestamp, "timestamp")
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        block_timestamp: Optional[int] = None
+        rpc_batches = 0
+        if rpc:
+            resolved, rpc_batches = self._resolve_blocks_by_time([target], chain_id, rpc, closest)
+            if resolved[0] is None:
+                edge = "before genesis" if closest == "before" else "after the latest block"
+                raise ValueError(f"No block {closest} timestamp {target}: it is {edge}.")
+            block_number, block_timestamp = resolved[0]
+            source = "rpc" if rpc_batches else "index"
+        else:
+            payload = self.client.get_block_number_by_time(target, closest)
+            result = self._extract_proxy_result(payload)
+            try:
+                block_number = int(str(result).strip())
+            except (TypeError, ValueError):
+                raise ValueError(f"Etherscan error: {result}.")
+            source = "etherscan"
+
+        return {
+            "network": network_label,
+            "chain_id": chain_id,
+            "timestamp": target,
+            "timestamp_iso": self._timestamp_iso(target),
+            "closest": closest,
+            "block_number": block_number,
+            "block_timestamp": block_timestamp,
+            "block_timestamp_iso": self._timestamp_iso(block_timestamp),
+            "source": source,
+            "rpc_batches": rpc_batches,
+        }
+
+    def _resolve_blocks_by_time(
+        self, targets: Sequence[int], chain_id: str, rpc: RpcClient, closest: str
+    ) -> Tuple[List[Optional[Tuple[int, int]]], int]:
+        """Resolve unix `targets` to `(block_number, block_timestamp)` (aligned
+        with `targets`) plus the number of JSON-RPC batches sent (a round
+        with more than `RPC_BATCH_MAX_CALLS` probes is several). A target
+        with no such block (before genesis for "before", after the latest
+        block for "after") resolves to None.
+
+        Each target keeps a bracket `lo`/`hi`: `lo` satisfies the predicate
+        (timestamp <= target for "before", < target for "after"), `hi` does
+        not; the answer is `lo` ("before") or `hi` ("after") once they are
+        adjacent. Brackets start from `block_time_index`; missing sides are
+        filled from the latest and genesis blocks. Every round interpolates
+        an estimate per open target and probes est-1/est/est+1, est +/- a
+        window and the midpoint (which guarantees halving), for all targets
+        in one deduplicated batch. Every fetched block narrows every
+        bracket and is offered to the index, so later lookups start tighter.
+
+        A round that narrows no bracket (e.g. a lagging or pruned node
+        answering probes with null), or a search running past
+        `BLOCK_TIME_MAX_EXTRA_ROUNDS` plus log2 of the widest span, raises
+        instead of re-sending the same batch.
+        """
+        inclusive = closest == "before"
+        index = self.block_time_index
+
+        def holds(ts: int, target: int) -> bool:
+            return ts <= target if inclusive else ts < target
+
+        brackets: Dict[int, List[Optional[Tuple[int, int]]]] = {}
+        for target in set(targets):
+            lo, hi = index.bracket(chain_id, target, inclusive)
+            brackets[target] = [lo, hi]
+        answers: Dict[int, Optional[Tuple[int, int]]] = {}
+        head_fetched = genesis_fetched = False
+        rounds = batches = 0
+        max_rounds: Optional[int] = None
+
+        while True:
+            open_targets = []
+            for target, (lo, hi) in brackets.items():
+                if target in answers:
+                    continue
+                if lo is not None and hi is not None and hi[0] - lo[0] <= 1:
+                    answers[target] = lo if inclusive else hi
+                else:
+                    open_targets.append(target)
+            if not open_targets:
+                break
+            if max_rounds is None and all(None not in brackets[t] for t in open_targets):
+                widest = max(brackets[t][1][0] - brackets[t][0][0] for t in open_targets)  # type: ignore[index]
+                max_rounds = rounds + BLOCK_TIME_MAX_EXTRA_ROUNDS + widest.bit_length()
+            if max_rounds is not None and rounds >= max_rounds:
+                raise ValueError("Block-by-time search made no progress.")
+            before = {t: tuple(brackets[t]) for t in open_targets}
+
+            tags: List[str] = []
+            need_head = not head_fetched and any(brackets[t][1] is None for t in open_targets)
+            need_genesis = not genesis_fetched and any(brackets[t][0] is None for t in open_targets)
+            if need_head:
+                tags.append("latest")
+            if need_genesis:
+                tags.append("0x0")
+            probes: set = set()
+            for target in open_targets:
+                lo, hi = brackets[target]
+                if lo is None or hi is None:
+                    continue
+                (lo_block, lo_ts), (hi_block, hi_ts) = lo, hi
+                span = hi_block - lo_block
+                if hi_ts > lo_ts:
+                    est = lo_block + (max(target, lo_ts) - lo_ts) * span // (hi_ts - lo_ts)
+                else:
+                    est = lo_block + span // 2
+                window = max(2, span // BLOCK_TIME_PROBE_SPREAD)
+                for candidate in (est - 1, est, est + 1, est - window, est + window, lo_block + span // 2):
+                    if lo_block < candidate < hi_block:
+                        probes.add(candidate)
+            tags.extend(hex(n) for n in sorted(probes))
+            if not tags:
+                raise ValueError("Block-by-time search made no progress.")
+
+            blocks = self._read_chain_batch(
+                [("eth_getBlockByNumber", [tag, False]) for tag in tags], chain_id, rpc
+            )
+            rounds += 1
+            batches += -(-len(tags) // RPC_BATCH_MAX_CALLS)
+            samples: List[Tuple[int, int]] = []
+            for tag, block in zip(tags, blocks):
+                if not isinstance(block, dict):
+                    if tag in ("latest", "0x0"):
+                        continue  # reported below
+                    raise ValueError("Block-by-time search made no progress.")
+                number = self._hex_to_int(block.get("number"), "block_number")
+                ts = self._hex_to_int(block.get("timestamp"), "timestamp")
+                if number is None or ts is None:
+                    continue
+                samples.append((number, ts))
+                if tag == "latest":
+                    head_fetched = True
+                    index.record_head(chain_id, number)
+                    for target in open_targets:
+                        lo, hi = brackets[target]
+                        if hi is not None:
+                            continue
+                        if holds(ts, target):
+                            answers[target] = (number, ts) if inclusive else None
+                        else:
+                            brackets[target][1] = (number, ts)
+                elif tag == "0x0":
+                    genesis_fetched = True
+                    for target in open_targets:
+                        lo, hi = brackets[target]
+                        if lo is not None:
+                            continue
+                        if not holds(ts, target):
+                            answers[target] = None if inclusive else (number, ts)
+                        else:
+                            brackets[target][0] = (number, ts)
+            if need_head and not head_fetched:
+                raise ValueError("RPC returned no latest block.")
+            if need_genesis and not genesis_fetched:
+                raise ValueError("RPC returned no genesis block.")
+
+            samples.sort()
+            sample_ts = [ts for _, ts in samples]
+            for target in open_targets:
+                if target in answers:
+                    continue
+                split = bisect.bisect_right(sample_ts, target) if inclusive else bisect.bisect_left(sample_ts, target)
+                lo, hi = brackets[target]
+                if split > 0 and (lo is None or samples[split - 1][0] > lo[0]):
+                    brackets[target][0] = samples[split - 1]
+                if split < len(samples) and (hi is None or samples[split][0] < hi[0]):
+                    brackets[target][1] = samples[split]
+            index.add_many(chain_id, samples)
+            if all(t not in answers and tuple(brackets[t]) == before[t] for t in open_targets):
+                raise ValueError("Block-by-time search made no progress.")
+
+        # Keep the adjacent pairs that answered each target, so the same
+        # lookup is answered from the index next time.
+        index.add_many(
+            chain_id,
+            [side for lo, hi in brackets.values() if lo and hi and hi[0] - lo[0] == 1 for side in (lo, hi)],
+            pinned=True,
+        )
+        index.flush()
+        return [answers[target] for target in targets], batches
+
+    def _index_block_times(
+        self, chain_id: str, blocks: Sequence[Any], head_tag: bool = False, flush: bool = True
+    ) -> None:
+        """Offer fetched raw blocks to `block_time_index`; a block fetched as
+        "latest" also advances the chain head the finality check uses."""
+        samples: List[Tuple[int, int]] = []
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            try:
+                number = self._hex_to_int(block.get("number"), "block_number")
+                ts = self._hex_to_int(block.get("timestamp"), "timestamp")
+            except ValueError:
+                continue
+            if number is None or ts is None:
+                continue
+            if head_tag:
+                self.block_time_index.record_head(chain_id, number)
+            samples.append((number, ts))
+        if samples:
+            self.block_time_index.add_many(chain_id, samples)
+            if flush:
+                self.block_time_index.flush()
+
+    def _validate_closest(self, closest: Optional[str]) -> str:
+        candidate = (closest or "before").strip().lower()
+        if candidate not in BLOCK_TIME_CLOSEST:
+            raise ValueError(f"closest must be one of: {', '.join(BLOCK_TIME_CLOSEST)}.")
+        return candidate
+
+    def _parse_timestamp(self, value: Union[int, float, str, None], field: str) -> int:
+        """Unix seconds from an int/float/digit string or an ISO 8601 string."""
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"{field} must be unix seconds or an ISO 8601 string.")
+        if isinstance(value, (int, float)):
+            if value < 0:
+                raise ValueError(f"{field} must be non-negative.")
+            return int(value)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{field} must be unix seconds or an ISO 8601 string.")
+        candidate = value.strip()
+        if candidate.isdigit():
+            return int(candidate)
+        if candidate.endswith(("Z", "z")):
+            candidate = candidate[:-1] + "+00:00"
+        try:
+            parsed = datetime.datetime.fromisoformat(candidate)
+        except ValueError:
+            raise ValueError(f"{field} must be unix seconds or an ISO 8601 string.")
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+        seconds = int(parsed.timestamp())
+        if seconds < 0:
+            raise ValueError(f"{field} must not be before 1970-01-01.")
+        return seconds
+
+    def _series_column_layout(self, func_meta: Dict[str, Any]) -> List[Tuple[str, int, bool, str, int]]:
+        """Flatten the call's outputs into fixed-offset integer leaves:
+        `(column, byte_offset, signed, output_name, output_index)`.
+        Tuples become `out.field`, static arrays `out[i]`; anything dynamic or
+        non-integer is rejected."""
+        entry = func_meta.get("entry")
+        outputs = entry.get("outputs") if isinstance(entry, dict) else None
+        if not outputs:
+            raise ValueError("columnar mode needs the function's ABI outputs; pass function= or use a verified contract.")
+        leaves: List[Tuple[str, int, bool, str, int]] = []
+
+        def flatten(typ: str, components: List[Dict[str, Any]], column: str, cursor: int, name: str, idx: int) -> int:
+            base_type, dims = self._split_array_dimensions(typ)
+            if dims:
+                if dims[0] is None:
+                    raise ValueError(f"columnar mode needs static outputs; {column} is {typ}.")
+                inner = base_type + "".join(f"[{d}]" for d in dims[1:])
+                for k in range(dims[0]):
+                    cursor = flatten(inner, components, f"{column}[{k}]", cursor, name, idx)
+                return cursor
+            if base_type == "tuple":
+                for comp_idx, comp in enumerate(components):
+                    comp_name = comp.get("name") or f"field{comp_idx}"
+                    cursor = flatten(
+                        comp.get("type", ""), comp.get("components") or [], f"{column}.{comp_name}", cursor, name, idx
+                    )
+                return cursor
+            if base_type.startswith("uint"):
+                leaves.append((column, cursor, False, name, idx))
+            elif base_type.startswith("int"):
+                leaves.append((column, cursor, True, name, idx))
+            else:
+                raise ValueError(f"columnar mode needs integer outputs; {column} is {typ}.")
+            return cursor + 32
+
+        cursor = 0
+        for idx, out in enumerate(outputs):
+            name = out.get("name") or f"output{idx}"
+            cursor = flatten(out.get("type", ""), out.get("components") or [], name, cursor, name, idx)
+        return leaves
+
+    def _decode_series_columns(
+        self,
+        layout: List[Tuple[str, int, bool, str, int]],
+        points: List[Tuple[int, Dict[str, Any]]],
+        results: List[str],
+        decimals_hint: Optional[Any],
+    ) -> Dict[str, Any]:
+        """Columns for a columnar series. Well-formed results (exactly the
+        static head size) are joined into one buffer and every leaf is read at
+        `row * width + offset`; other results (reverts, `0x`) yield None in
+        every column and are listed in `invalid_points`."""
+        width = (layout[-1][1] + 32) if layout else 0
+        valid_rows = [row for row, result in enumerate(results) if len(result) == 2 + 2 * width]
+        buffer = memoryview(bytes.fromhex("".join(results[row][2:] for row in valid_rows)))
+
+        columns: Dict[str, List[Any]] = {"block_number": [block_number for block_number, _ in points]}
+        for key in ("timestamp", "block_timestamp"):
+            if points and key in points[0][1]:
+                columns[key] = [extra[key] for _, extra in points]
+        decimals_cfg = self._parse_decimals_hint(decimals_hint)
+        scaled: Dict[str, List[Optional[str]]] = {}
+        column_decimals: Dict[str, int] = {}
+        for column, offset, signed, name, idx in layout:
+            values: List[Optional[int]] = [None] * len(results)
+            for pos, row in enumerate(valid_rows):
+                start = pos * width + offset
+                # intN words are sign-extended to 256 bits.
+                values[row] = int.from_bytes(buffer[start : start + 32], "big", signed=signed)
+            columns[column] = values
+            dec = self._select_decimals(decimals_cfg, name, idx)
+            if dec is not None:
+                column_decimals[column] = dec
+                scaled[column] = [None if v is None else self._format_scaled_int(v, dec) for v in values]
+
+        out: Dict[str, Any] = {"columnar": True, "columns": columns}
+        if scaled:
+            out["decimals"] = column_decimals
+            out["scaled"] = scaled
+        valid = set(valid_rows)
+        out["invalid_points"] = [
+            {"block_number": points[row][0], "data": result}
+            for row, result in enumerate(results)
+            if row not in valid
+        ]
+        return out
+
+    def _normalize_series_interval(self, interval: Optional[Union[int, str]]) -> int:
+        """Seconds between time-series samples: hourly / daily / weekly or a
+        positive number of seconds; defaults to daily."""
+        if interval is None:
+            return SERIES_INTERVALS["daily"]
+        if isinstance(interval, str) and interval.strip().lower() in SERIES_INTERVALS:
+            return SERIES_INTERVALS[interval.strip().lower()]
+        try:
+            seconds = self._normalize_positive_int(interval, 0, "interval")
+        except ValueError:
+            seconds = 0
+        if seconds <= 0:
+            raise ValueError(f"interval must be one of {', '.join(SERIES_INTERVALS)} or a positive number of seconds.")
+        return seconds
+
+    def _timestamp_iso(self, timestamp: Optional[int]) -> Optional[str]:
+        if timestamp is None:
+            return None
+        try:
+            moment = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+        return moment.replace(tzinfo=None).isoformat() + "Z"
+
+    def get_block_summary(
+        self,
+        block: Union[int, str],
+        network: Optional[str] = None,
+        decode_transfers: bool = True,
+        annotate_contracts: bool = False,
+        flow_scope: str = FLOW_SCOPE_USER,
+        include_transactions: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Whole-block digest: compact `get_transaction_summary` per tx, ERC20 net
+        flow aggregated across the block, and block-wide fee totals.
+
+        Round trips: the block with full tx objects, then every receipt via
+        `eth_getBlockReceipts` (falls back to batched `eth_getTransactionReceipt`
+        on nodes without it), then one Multicall3 call for the metadata of every
+        token touched in the block. Contract-name annotation is off by default:
+        a mainnet block touches hundreds of addresses and each is one Etherscan
+        request.
+
+        flow_scope applies to both the per-tx rows and the block-wide
+        `net_token_flow_by_address`: "user" keeps tx senders, "user_router" adds
+        tx.to addresses, "all" keeps every row.
+
+        RPC only: Etherscan `module=proxy` has no block-receipts endpoint and a
+        per-tx fallback would be hundreds of rate-limited requests.
+        """
+        self._validate_flow_scope(flow_scope)
+        network_label, chain_id = self._resolve_network_and_chain(network)
+        self.client.chain_id = chain_id
+        tag = self._normalize_block_tag(block)
+
+        allow_default_rpc = network is None
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        if not rpc:
+            raise ValueError(
+                f"get_block_summary requires a JSON-RPC endpoint; set RPC_URL_{chain_id} or RPC_{chain_id}."
+            )
+
+        block_raw = rpc.call("eth_getBlockByNumber", [tag, True])
+        if not isinstance(block_raw, dict):
+            raise ValueError("Unexpected block response.")
+        self._index_block_times(chain_id, [block_raw], head_tag=tag == "latest")
+        block_number_hex = block_raw.get("number")
+        block_number = self._hex_to_int(block_number_hex, "block_number")
+        txs = [tx for tx in block_raw.get("transactions") or [] if isinstance(tx, dict)]
+        receipts = self._get_block_receipts(rpc, chain_id, block_number_hex, txs)
+
+        prepared_list = []
+        for tx_raw, receipt_raw in zip(txs, receipts):
+            tx_hash = tx_raw.get("hash")
+            prepared_list.append(
+                self._prepare_tx_summary(
+                    self._tx_data(tx_hash, network_label, chain_id, tx_raw, receipt_raw),
+                    decode_transfers,
+                )
+            )
+
+        token_addresses: List[str] = list(
+            dict.fromkeys(addr for prepared in prepared_list for addr in prepared["token_addresses"])
+        )
+        addresses_to_annotate: set = set()
+        for prepared in prepared_list:
+            addresses_to_annotate.update(prepared["addresses_to_annotate"])
+
+        token_metadata: Dict[str, Dict[str, Any]] = {}
+        if token_addresses:
+            token_metadata = self._get_token_metadata_many(
+                token_addresses, network_label, chain_id, allow_default_rpc
+            )
+        contract_names: Dict[str, Optional[str]] = {}
+        if annotate_contracts and addresses_to_annotate:
+            contract_names = self._get_contract_names_many(
+                sorted(addresses_to_annotate), network_label, chain_id
+            )
+
+        transactions: List[Dict[str, Any]] = []
+        all_transfers: List[Dict[str, Any]] = []
+        keep_addrs: set = set()
+        totals = {"gas_used": 0, "execution_fee_wei": 0, "l1_fee_wei": 0, "total_fee_wei": 0}
+        failed = 0
+        log_count = 0
+        for prepared in prepared_list:
+            digest = self._build_tx_summary(
+                prepared,
+                token_metadata,
+                contract_names,
+                decode_transfers=decode_transfers,
+                annotate_contracts=annotate_contracts,
+                compact=True,
+                flow_scope=flow_scope,
+            )
+            gas = digest["gas"]
+            for key in totals:
+                if isinstance(gas.get(key), int):
+                    totals[key] += gas[key]
+            if digest["status"] == "failed":
+                failed += 1
+            log_count += digest["counts"]["logs"]
+            all_transfers.extend(prepared["erc20_transfers"])
+            if digest["from"]:
+                keep_addrs.add(digest["from"].lower())
+            if flow_scope == FLOW_SCOPE_USER_ROUTER and digest["to"]:
+                keep_addrs.add(digest["to"].lower())
+            if include_transactions:
+                for key in ("network", "chain_id", "block_number", "compact"):
+                    digest.pop(key, None)
+                transactions.append(digest)
+
+        net_flow = self._aggregate_net_token_flow(all_transfers, token_metadata)
+        flow_total_rows = len(net_flow)
+        if flow_scope != FLOW_SCOPE_ALL:
+            net_flow = [r for r in net_flow if (r["address"] or "").lower() in keep_addrs]
+
+        base_fee = self._hex_to_int(block_raw.get("baseFeePerGas"), "baseFeePerGas")
+        block_gas_used = self._hex_to_int(block_raw.get("gasUsed"), "gasUsed")
+        burnt_fee_wei = (
+            base_fee * block_gas_used if isinstance(base_fee, int) and isinstance(block_gas_used, int) else None
+        )
+        priority_fee_wei = (
+            totals["execution_fee_wei"] - burnt_fee_wei if isinstance(burnt_fee_wei, int) else None
+        )
+
+        def eth(value: Optional[int]) -> Optional[str]:
+            return self._format_scaled_int(value, 18) if isinstance(value, int) else None
 
-        block_obj = self._map_block(result, force_hashes_only=tx_hashes_only)
         return {
             "network": network_label,
             "chain_id": chain_id,
-            "block": block_obj,
-            "full_transactions": include_full_txs,
-            "tx_hashes_only": bool(tx_hashes_only),
+            "block_number": block_number,
+            "block_hash": block_raw.get("hash"),
+            "timestamp": self._hex_to_int(block_raw.get("timestamp"), "timestamp"),
+            "miner": block_raw.get("miner"),
+            "fees": {
+                "gas_used": totals["gas_used"],
+                "gas_limit": self._hex_to_int(block_raw.get("gasLimit"), "gasLimit"),
+                "base_fee_per_gas_wei": base_fee,
+                "execution_fee_wei": totals["execution_fee_wei"],
+                "execution_fee_eth": eth(totals["execution_fee_wei"]),
+                "burnt_fee_wei": burnt_fee_wei,
+                "burnt_fee_eth": eth(burnt_fee_wei),
+                "priority_fee_wei": priority_fee_wei,
+                "priority_fee_eth": eth(priority_fee_wei),
+                "l1_fee_wei": totals["l1_fee_wei"],
+                "l1_fee_eth": eth(totals["l1_fee_wei"]),
+                "total_fee_wei": totals["total_fee_wei"],
+                "total_fee_eth": eth(totals["total_fee_wei"]),
+            },
+            "tokens": [
+                {
+                    "address": addr,
+                    "symbol": (token_metadata.get(addr) or {}).get("symbol"),
+                    "decimals": (token_metadata.get(addr) or {}).get("decimals"),
+                }
+                for addr in sorted(token_addresses)
+            ],
+            "net_token_flow_by_address": net_flow,
+            "flow_scope": flow_scope,
+            "transactions": transactions if include_transactions else None,
+            "counts": {
+                "transactions": len(txs),
+                "failed": failed,
+                "logs": log_count,
+                "erc20_transfers": len(all_transfers),
+                "tokens": len(token_addresses),
+                "flow_rows_total": flow_total_rows,
+                "flow_rows_after_scope": len(net_flow),
+            },
         }
 
-    def get_block_time_by_number(
-        self, block: Union[int, str], network: Optional[str] = None
-    ) -> Dict[str, Any]:
-        block_data = self.get_block_by_number(block, network, full_transactions=False, tx_hashes_only=True)
-        blk = block_data.get("block") or {}
-        number_hex = blk.get("number")
-        timestamp_hex = blk.get("timestamp")
-
-        number_int = self._hex_to_int(number_hex, "block_number") if number_hex else None
-        timestamp_int = self._hex_to_int(timestamp_hex, "timestamp") if timestamp_hex else None
-        iso_time: Optional[str] = None
-        if timestamp_int is not None:
+    def _get_block_receipts(
+        self,
+        rpc: RpcClient,
+        chain_id: str,
+        block_number_hex: Optional[str],
+        txs: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Receipts for `txs` (in block order) via one `eth_getBlockReceipts`;
+        chains whose node rejects the method are remembered and go straight to
+        batched `eth_getTransactionReceipt` (one request per distinct hash).
+        Other errors only fail this call."""
+        if not txs:
+            return []
+        if isinstance(block_number_hex, str) and chain_id not in self._block_receipts_unsupported:
             try:
-                import datetime
-
-                iso_time = datetime.datetime.utcfromtimestamp(timestamp_int).isoformat() + "Z"
-            except Exception:
-                iso_time = None
-
-        return {
-            "network": block_data.get("network"),
-            "chain_id": block_data.get("chain_id"),
-            "block_number": number_int,
-            "block_number_hex": number_hex,
-            "timestamp": timestamp_int,
-            "timestamp_hex": timestamp_hex,
-            "timestamp_iso": iso_time,
-        }
+                result = rpc.call("eth_getBlockReceipts", [block_number_hex])
+            except ValueError as exc:
+                message = str(exc).lower()
+                if any(marker in message for marker in UNSUPPORTED_METHOD_MARKERS):
+                    self._block_receipts_unsupported.add(chain_id)
+                result = None
+            if isinstance(result, list) and len(result) == len(txs):
+                by_hash = {
+                    str(r.get("transactionHash") or "").lower(): r for r in result if isinstance(r, dict)
+                }
+                ordered = [by_hash.get(str(tx.get("hash") or "").lower()) for tx in txs]
+                if all(isinstance(r, dict) for r in ordered):
+                    return ordered
+
+        hashes = list(dict.fromkeys(str(tx.get("hash") or "").lower() for tx in txs))
+        receipts: Dict[str, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(hashes), BLOCK_RECEIPT_BATCH_SIZE):
+            chunk = hashes[start : start + BLOCK_RECEIPT_BATCH_SIZE]
+            results = rpc.batch_call("eth_getTransactionReceipt", [[tx_hash] for tx_hash in chunk])
+            receipts.update((tx_hash, r if isinstance(r, dict) else None) for tx_hash, r in zip(chunk, results))
+        return [receipts[str(tx.get("hash") or "").lower()] for tx in txs]
 
     def call_function(
         self,
@@ -981,25 +2659,34 @@ class ContractService:
         decimals: Optional[Any] = None,
     ) -> Dict[str, Any]:
         normalized_address, network_label, chain_id = self._prepare_context(address, network)
-        normalized_data, func_meta = self._prepare_call_data(
-            data=data, function=function, args=args, address=normalized_address, chain_id=chain_id, network_label=network_label
-        )
+        normalized_data, func_meta = self._build_call_data(data, function, args)
         tag = self._normalize_block_tag(block_tag)
 
         allow_default_rpc = network is None
         rpc = self._get_rpc_client(chain_id, allow_default_rpc)
-        if rpc:
-            raw_result = rpc.call(
-                "eth_call",
-                [{"to": normalized_address, "data": normalized_data}, tag],
-            )
-            if not isinstance(raw_result, str):
-                raise ValueError("RPC error: eth_call returned unexpected result.")
-            result = self._normalize_hex_string(raw_result, "result")
-        else:
+        if not rpc:
             self._require_rpc_for_historical_tag(tag, chain_id, "call_function")
+
+        def send_call() -> str:
+            if rpc:
+                raw_result = rpc.call(
+                    "eth_call",
+                    [{"to": normalized_address, "data": normalized_data}, tag],
+                )
+                if not isinstance(raw_result, str):
+                    raise ValueError("RPC error: eth_call returned unexpected result.")
+                return self._normalize_hex_string(raw_result, "result")
             payload = self.client.call(normalized_address, normalized_data, tag)
-            result = self._extract_proxy_result(payload)
+            return self._extract_proxy_result(payload)
+
+        # The eth_call needs only calldata; the ABI is needed only to decode,
+        # so the call goes out while the (possibly cold) ABI lookup runs.
+        with _thread_pool(1) as pool:
+            call_future = pool.submit(send_call)
+            func_meta = self._resolve_call_abi(
+                normalized_data, func_meta, normalized_address, chain_id, network_label, allow_default_rpc
+            )
+            result = call_future.result()
         decoded = self._decode_call_result(result, func_meta, decimals)
 
         response: Dict[str, Any] = {
@@ -1019,8 +2706,8 @@ class ContractService:
     def call_function_series(
         self,
         address: str,
-        from_block: Union[int, str],
-        to_block: Union[int, str],
+        from_block: Optional[Union[int, str]] = None,
+        to_block: Optional[Union[int, str]] = None,
         stride: Optional[int] = 1,
         data: Optional[str] = None,
         network: Optional[str] = None,
@@ -1028,33 +2715,98 @@ class ContractService:
         args: Optional[List[Any]] = None,
         decimals: Optional[Any] = None,
         batch_size: Optional[int] = None,
+        from_time: Optional[Union[int, str]] = None,
+        to_time: Optional[Union[int, str]] = None,
+        interval: Optional[Union[int, str]] = None,
+        columnar: bool = False,
     ) -> Dict[str, Any]:
+        """
+        Sample one read-only call across history, either every `stride`
+        blocks in [from_block, to_block] or every `interval` (hourly / daily /
+        weekly / seconds, default daily) in [from_time, to_time]. Time points
+        read the state of the last block at or before each point; all points
+        are resolved together by `_resolve_blocks_by_time` (a few shared
+        JSON-RPC batches seeded from `block_time_index`), not one search per
+        point.
+
+        `columnar=True` (outputs must all be static integers, e.g. `uint256`
+        or getReserves' `(uint112,uint112,uint32)`) replaces `series` with
+        `columns`: one list per block field and per output leaf, decoded by
+        `_decode_series_columns` straight from the concatenated result words.
+        `app.columnar.to_numpy` turns that into NumPy arrays.
+        """
         normalized_address, network_label, chain_id = self._prepare_context(address, network)
-        start_block = self._parse_block_number(from_block, 0, "from_block")
-        end_block = self._parse_block_number(to_block, 0, "to_block")
-        if start_block > end_block:
-            raise ValueError("from_block cannot be greater than to_block.")
+        time_mode = from_time is not None or to_time is not None
+        if time_mode:
+            if from_block is not None or to_block is not None:
+                raise ValueError("Pass either from_block/to_block or from_time/to_time, not both.")
+            if from_time is None or to_time is None:
+                raise ValueError("from_time and to_time must be passed together.")
+            start_time = self._parse_timestamp(from_time, "from_time")
+            end_time = self._parse_timestamp(to_time, "to_time")
+            if start_time > end_time:
+                raise ValueError("from_time cannot be greater than to_time.")
+            interval_val = self._normalize_series_interval(interval)
+            point_count = ((end_time - start_time) // interval_val) + 1
+            stride_val: Optional[int] = None
+        else:
+            if from_block is None or to_block is None:
+                raise ValueError("from_block and to_block are required (or pass from_time/to_time).")
+            if interval is not None:
+                raise ValueError("interval applies to from_time/to_time; use stride for block ranges.")
+            start_block = self._parse_block_number(from_block, 0, "from_block")
+            end_block = self._parse_block_number(to_block, 0, "to_block")
+            if start_block > end_block:
+                raise ValueError("from_block cannot be greater than to_block.")
+            stride_val = self._normalize_positive_int(stride, 1, "stride")
+            if stride_val <= 0:
+                raise ValueError("stride must be a positive integer.")
+            point_count = ((end_block - start_block) // stride_val) + 1
 
-        stride_val = self._normalize_positive_int(stride, 1, "stride")
-        if stride_val <= 0:
-            raise ValueError("stride must be a positive integer.")
         batch_size_val = self._normalize_positive_int(
             batch_size, DEFAULT_CALL_SERIES_BATCH_SIZE, "batch_size"
         )
         if batch_size_val <= 0:
             raise ValueError("batch_size must be a positive integer.")
-        point_count = ((end_block - start_block) // stride_val) + 1
         if point_count > MAX_CALL_SERIES_POINTS:
             raise ValueError(
                 f"call_function_series would issue {point_count} eth_call requests; "
-                f"maximum is {MAX_CALL_SERIES_POINTS}. Increase stride or narrow the block range."
+                f"maximum is {MAX_CALL_SERIES_POINTS}. "
+                + ("Increase interval or narrow the time range." if time_mode else "Increase stride or narrow the block range.")
             )
 
         allow_default_rpc = network is None
         rpc = self._get_rpc_client(chain_id, allow_default_rpc)
         if not rpc:
+            if time_mode:
+                raise ValueError(
+                    f"call_function_series: from_time/to_time requires a JSON-RPC archive node; "
+                    f"set RPC_URL_{chain_id} or RPC_{chain_id}."
+                )
             self._require_rpc_for_historical_tag(hex(start_block), chain_id, "call_function_series")
 
+        # (block_number, extra fields) per sample point, in order.
+        points: List[Tuple[int, Dict[str, Any]]] = []
+        if time_mode:
+            times = list(range(start_time, end_time + 1, interval_val))
+            resolved, _ = self._resolve_blocks_by_time(times, chain_id, rpc, "before")
+            for sample_time, hit in zip(times, resolved):
+                if hit is None:
+                    raise ValueError(f"from_time {sample_time} is before the chain's genesis block.")
+                points.append(
+                    (
+                        hit[0],
+                        {
+                            "timestamp": sample_time,
+                            "timestamp_iso": self._timestamp_iso(sample_time),
+                            "block_timestamp": hit[1],
+                        },
+                    )
+                )
+            start_block, end_block = points[0][0], points[-1][0]
+        else:
+            points = [(n, {}) for n in range(start_block, end_block + 1, stride_val)]
+
         normalized_data, func_meta = self._prepare_call_data(
             data=data,
             function=function,
@@ -1062,36 +2814,38 @@ class ContractService:
             address=normalized_address,
             chain_id=chain_id,
             network_label=network_label,
+            allow_default_rpc=allow_default_rpc,
         )
 
+        layout = self._series_column_layout(func_meta) if columnar else None
+        decode_result = self._call_result_decoder(func_meta, decimals)
         series: List[Dict[str, Any]] = []
-        current = start_block
-        while current <= end_block:
-            chunk_blocks: List[int] = []
-            while current <= end_block and len(chunk_blocks) < batch_size_val:
-                chunk_blocks.append(current)
-                current += stride_val
-
+        raw_series: List[str] = []
+        for start in range(0, len(points), batch_size_val):
+            chunk = points[start : start + batch_size_val]
             params_list = [
                 [{"to": normalized_address, "data": normalized_data}, hex(block_number)]
-                for block_number in chunk_blocks
+                for block_number, _ in chunk
             ]
             raw_results = rpc.batch_call("eth_call", params_list)
-            if len(raw_results) != len(chunk_blocks):
+            if len(raw_results) != len(chunk):
                 raise ValueError("RPC error: eth_call batch returned unexpected result count.")
 
-            for block_number, raw_result in zip(chunk_blocks, raw_results):
+            for (block_number, extra), raw_result in zip(chunk, raw_results):
                 if not isinstance(raw_result, str):
                     raise ValueError("RPC error: eth_call returned unexpected result.")
                 result = self._normalize_hex_string(raw_result, "result")
-                series.append(
-                    {
-                        "block_number": block_number,
-                        "block_tag": hex(block_number),
-                        "data": result,
-                        "decoded": self._decode_call_result(result, func_meta, decimals),
-                    }
-                )
+                if layout is not None:
+                    raw_series.append(result)
+                    continue
+                entry = {
+                    "block_number": block_number,
+                    "block_tag": hex(block_number),
+                    "data": result,
+                    "decoded": decode_result(result),
+                }
+                entry.update(extra)
+                series.append(entry)
 
         response: Dict[str, Any] = {
             "address": normalized_address,
@@ -1104,6 +2858,14 @@ class ContractService:
             "count": len(series),
             "series": series,
         }
+        if layout is not None:
+            del response["series"]
+            response["count"] = len(raw_series)
+            response.update(self._decode_series_columns(layout, points, raw_series, decimals))
+        if time_mode:
+            response["from_time"] = start_time
+            response["to_time"] = end_time
+            response["interval"] = interval_val
         if function:
             response["function"] = function
         if args is not None:
@@ -1205,8 +2967,12 @@ class ContractService:
         return f"-{formatted}" if negative else formatted
 
     def _format_scientific_int(self, value: int, decimals: int) -> str:
-        dec_value = Decimal(value) / (Decimal(10) ** decimals)
-        return format(dec_value, ".6E")
+        from decimal import Decimal, localcontext
+
+        with localcontext() as ctx:
+            ctx.prec = 100
+            dec_value = Decimal(value) / (Decimal(10) ** decimals)
+            return format(dec_value, ".6E")
 
     def _decimal_to_int(self, text: str, scale: int, field: str, allow_fraction: bool) -> int:
         candidate = text.strip().replace("_", "")
@@ -1337,6 +3103,8 @@ class ContractService:
             return None
         client = self._rpc_clients.get(url)
         if client is None:
+            from .rpc_client import RpcClient
+
             client = RpcClient(
                 rpc_url=url,
                 timeout=self.config.request_timeout,
@@ -1354,8 +3122,18 @@ class ContractService:
         address: str,
         chain_id: str,
         network_label: Optional[str],
+        allow_default_rpc: bool = False,
     ) -> Tuple[str, Dict[str, Any]]:
         """Build or normalize call data; if ABI is cached (proxy-aware), validate selector and length. Returns data + function metadata."""
+        normalized, func_meta = self._build_call_data(data, function, args)
+        return normalized, self._resolve_call_abi(
+            normalized, func_meta, address, chain_id, network_label, allow_default_rpc
+        )
+
+    def _build_call_data(
+        self, data: Optional[str], function: Optional[str], args: Optional[List[Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Offline half of `_prepare_call_data`: calldata + provisional metadata."""
         if function:
             if data:
                 raise ValueError("Provide either function+args or data, not both.")
@@ -1379,7 +3157,27 @@ class ContractService:
         # data must include at least 4-byte selector (8 hex chars after 0x)
         if len(normalized) < 10:
             raise ValueError("data must include 4-byte function selector.")
+        return normalized, func_meta
 
+    def _resolve_call_abi(
+        self,
+        normalized: str,
+        func_meta: Dict[str, Any],
+        address: str,
+        chain_id: str,
+        network_label: Optional[str],
+        allow_default_rpc: bool = False,
+    ) -> Dict[str, Any]:
+        """Network half of `_prepare_call_data`: find the ABI entry for the
+        selector (proxy-aware) and validate calldata length against it.
+        `allow_default_rpc` is the caller's: proxy detection uses the same
+        RPC endpoint as the call itself.
+
+        On a cold cache the lookups run as a small dependency graph rather
+        than a chain: the contract's own ABI fetch and, when RPC is
+        configured, proxy detection start together, and the implementation
+        ABI fetch starts as soon as detection names an implementation. The
+        preference order of ABIs is unchanged."""
         selector = normalized[2:10]
         selector_maps: List[Tuple[Dict[str, Dict[str, Any]], str]] = []
         implementation_hint: Optional[str] = None
@@ -1411,58 +3209,78 @@ class ContractService:
                 else:
                     selector_maps.append((selector_map, source))
 
-        def load_contract_abi(target: str, source: str, prefer: bool = False) -> Optional[Dict[str, Any]]:
-            impl_cached = self.cache.get(target, chain_id)
-            impl_data = impl_cached
-            if not impl_data:
-                try:
-                    impl_data = self.fetch_contract(target, network_label)
-                except Exception:
-                    impl_data = None
-            if impl_data:
-                add_selector_map(impl_data.get("abi"), source, prefer=prefer)
-            return impl_data
+        def fetch_contract_data(target: str) -> Optional[Dict[str, Any]]:
+            cached_data = self.cache.get(target, chain_id)
+            if cached_data:
+                return cached_data
+            try:
+                return self.fetch_contract(target, network_label)
+            except Exception:
+                return None
 
-        # 1) cached ABI on the address itself
-        cached = self.cache.get(address, chain_id)
-        if not cached:
+        def detect() -> Optional[Dict[str, Any]]:
             try:
-                cached = self.fetch_contract(address, network_label)
+                return self.detect_proxy(address, None if allow_default_rpc else network_label)
             except Exception:
-                cached = None
-        if cached:
-            add_selector_map(cached.get("abi"), "contract")
-            implementation_hint = self._normalize_address_optional(cached.get("implementation"))
-            proxy_info = self._proxy_info_from_contract(cached)
-
-        # 1.5) if we know implementation from metadata, prefer its ABI
-        if implementation_hint and implementation_hint != address:
-            impl_data = load_contract_abi(implementation_hint, "implementation", prefer=True)
-            if impl_data:
-                loaded_impl_address = implementation_hint
-
-        # 2) proxy-aware: if selector not found yet, try detect proxy and implementation ABI
-        need_proxy_lookup = True
-        for selector_map, _ in selector_maps:
-            if selector in selector_map:
-                need_proxy_lookup = False
-                break
+                return None
 
-        if need_proxy_lookup:
-            if proxy_info is None:
-                proxy_info = self.proxy_cache.get(address, chain_id)
-            needs_detect = proxy_info is None or (
-                proxy_info.get("is_proxy") and not proxy_info.get("implementation")
-            )
-            if needs_detect:
-                try:
-                    proxy_info = self.detect_proxy(address, network_label)
-                    self.proxy_cache.set(address, chain_id, proxy_info)
-                except Exception:
-                    proxy_info = None
+        def needs_detect(info: Optional[Dict[str, Any]]) -> bool:
+            return info is None or bool(info.get("is_proxy") and not info.get("implementation"))
+
+        def detected_implementation(info: Optional[Dict[str, Any]]) -> Optional[str]:
+            if info and info.get("is_proxy") and info.get("implementation"):
+                return self._normalize_address_optional(info.get("implementation"))
+            return None
+
+        impl_futures: Dict[str, Any] = {}
+        with _thread_pool(3) as pool:
+
+            def load_contract_abi(target: str, source: str, prefer: bool = False) -> Optional[Dict[str, Any]]:
+                future = impl_futures.get(target)
+                impl_data = future.result() if future else fetch_contract_data(target)
+                if impl_data:
+                    add_selector_map(impl_data.get("abi"), source, prefer=prefer)
+                return impl_data
+
+            # 1) ABI on the address itself, with proxy detection in parallel
+            # when the contract is uncached and detection is a cheap RPC batch.
+            cached = self.cache.get(address, chain_id)
+            detect_future = None
+            if not cached:
+                contract_future = pool.submit(fetch_contract_data, address)
+                if needs_detect(
+                    self._cached_proxy_info(address, chain_id, network_label, allow_default_rpc)
+                ) and self._get_rpc_client(chain_id, allow_default_rpc):
+                    detect_future = pool.submit(detect)
+                    speculative_impl = detected_implementation(detect_future.result())
+                    if speculative_impl and speculative_impl != address:
+                        impl_futures[speculative_impl] = pool.submit(fetch_contract_data, speculative_impl)
+                cached = contract_future.result()
+            if cached:
+                add_selector_map(cached.get("abi"), "contract")
+                implementation_hint = self._normalize_address_optional(cached.get("implementation"))
+                proxy_info = self._proxy_info_from_contract(cached)
+
+            # 1.5) if we know implementation from metadata, prefer its ABI
+            if implementation_hint and implementation_hint != address:
+                impl_data = load_contract_abi(implementation_hint, "implementation", prefer=True)
+                if impl_data:
+                    loaded_impl_address = implementation_hint
+
+            # 2) proxy-aware: if selector not found yet, try detect proxy and implementation ABI
+            need_proxy_lookup = True
+            for selector_map, _ in selector_maps:
+                if selector in selector_map:
+                    need_proxy_lookup = False
+                    break
 
-            if proxy_info and proxy_info.get("is_proxy") and proxy_info.get("implementation"):
-                impl_address = self._normalize_address_optional(proxy_info.get("implementation"))
+            if need_proxy_lookup:
+                if proxy_info is None:
+                    proxy_info = self._cached_proxy_info(address, chain_id, network_label, allow_default_rpc)
+                if needs_detect(proxy_info):
+                    proxy_info = detect_future.result() if detect_future else detect()
+
+                impl_address = detected_implementation(proxy_info)
                 if impl_address and impl_address != address and impl_address != loaded_impl_address:
                     impl_data = load_contract_abi(impl_address, "implementation", prefer=True)
                     if impl_data:
@@ -1484,7 +3302,7 @@ class ContractService:
                     func_meta["signature"] = self._function_signature(func_meta["name"] or "", inputs)
                 except Exception:
                     pass
-                return normalized, func_meta
+                return func_meta
 
             static_words = 0
             for inp in inputs:
@@ -1510,17 +3328,25 @@ class ContractService:
                 func_meta["signature"] = self._function_signature(func_meta["name"] or "", inputs)
             except Exception:
                 pass
-            return normalized, func_meta
+            return func_meta
 
         # If we have ABI info but selector not found:
         if available_selectors:
             # Soft fail: allow raw call but record warning for decoded/error
             func_meta["warning"] = f"Function selector 0x{selector} not found in cached ABI; returning raw result."
 
-        return normalized, func_meta
+        return func_meta
 
     def _decode_call_result(self, result_hex: str, func_meta: Dict[str, Any], decimals_hint: Optional[Any]) -> Dict[str, Any]:
-        decoded: Dict[str, Any] = {
+        return self._call_result_decoder(func_meta, decimals_hint)(result_hex)
+
+    def _call_result_decoder(
+        self, func_meta: Dict[str, Any], decimals_hint: Optional[Any]
+    ) -> Callable[[str], Dict[str, Any]]:
+        """`_decode_call_result` with everything that depends only on the
+        function and the decimals hint (output plan, names, decimals per
+        output) resolved once; `call_function_series` reuses it per point."""
+        template: Dict[str, Any] = {
             "ok": False,
             "error": None,
             "selector": f"0x{func_meta.get('selector')}" if func_meta.get("selector") else None,
@@ -1530,43 +3356,54 @@ class ContractService:
             "outputs": [],
             "warning": func_meta.get("warning"),
         }
-
-        if not isinstance(result_hex, str):
-            decoded["error"] = "Unexpected non-hex result."
-            return decoded
-
-        raw_hex = result_hex if result_hex.startswith("0x") else f"0x{result_hex}"
         entry = func_meta.get("entry")
-        if not isinstance(entry, dict):
-            decoded["error"] = decoded["error"] or "ABI not available for decoding."
-            return decoded
-
-        outputs = entry.get("outputs", [])
-        if not outputs:
-            decoded["ok"] = True
-            return decoded
+        outputs = entry.get("outputs", []) if isinstance(entry, dict) else None
+        plan: Optional[Callable[[bytes], List[Any]]] = None
+        items: List[Tuple[str, str, Optional[int]]] = []
+        setup_error: Optional[str] = None
+        if outputs:
+            try:
+                plan = self._output_decoder(outputs)
+                decimals_cfg = self._parse_decimals_hint(decimals_hint)
+                for idx, abi_out in enumerate(outputs):
+                    name = abi_out.get("name") or f"output{idx}"
+                    typ = abi_out.get("type") or ""
+                    dec = self._select_decimals(decimals_cfg, name, idx) if self._is_numeric_type(typ) else None
+                    items.append((name, typ, dec))
+            except Exception as exc:
+                setup_error = f"Failed to decode result: {exc}"
+
+        def decode(result_hex: str) -> Dict[str, Any]:
+            decoded = dict(template, outputs=[])
+            if not isinstance(result_hex, str):
+                decoded["error"] = "Unexpected non-hex result."
+                return decoded
+            if outputs is None:
+                decoded["error"] = "ABI not available for decoding."
+                return decoded
+            if not outputs:
+                decoded["ok"] = True
+                return decoded
+            if setup_error:
+                decoded["error"] = setup_error
+                return decoded
 
-        try:
-            data_bytes = self._hex_to_bytes(raw_hex)
-            values = self._decode_outputs(outputs, data_bytes)
-            decimals_cfg = self._parse_decimals_hint(decimals_hint)
-            output_items: List[Dict[str, Any]] = []
-            for idx, (abi_out, value) in enumerate(zip(outputs, values)):
-                name = abi_out.get("name") or f"output{idx}"
-                typ = abi_out.get("type") or ""
-                item: Dict[str, Any] = {"name": name, "type": typ, "value": value}
-                if self._is_numeric_type(typ) and isinstance(value, int):
-                    dec = self._select_decimals(decimals_cfg, name, idx)
-                    if dec is not None:
+            try:
+                values = plan(self._hex_to_bytes(result_hex))  # type: ignore[misc]
+                output_items: List[Dict[str, Any]] = []
+                for (name, typ, dec), value in zip(items, values):
+                    item: Dict[str, Any] = {"name": name, "type": typ, "value": value}
+                    if dec is not None and isinstance(value, int):
                         item["decimals"] = dec
                         item["value_scaled"] = self._format_scaled_int(value, dec)
-                output_items.append(item)
-            decoded["outputs"] = output_items
-            decoded["ok"] = True
-        except Exception as exc:
-            decoded["error"] = f"Failed to decode result: {exc}"
+                    output_items.append(item)
+                decoded["outputs"] = output_items
+                decoded["ok"] = True
+            except Exception as exc:
+                decoded["error"] = f"Failed to decode result: {exc}"
+            return decoded
 
-        return decoded
+        return decode
 
     def _parse_decimals_hint(self, decimals_hint: Optional[Any]) -> Dict[str, Any]:
         cfg: Dict[str, Any] = {"global": None, "names": {}, "indexes": {}}
@@ -1633,90 +3470,161 @@ class ContractService:
         return typ.startswith("uint") or typ.startswith("int")
 
     def _decode_outputs(self, outputs: List[Dict[str, Any]], data_bytes: bytes) -> List[Any]:
-        offsets: List[int] = []
-        prepared: List[Tuple[str, List[Optional[int]], List[Dict[str, Any]]]] = []
+        return self._output_decoder(outputs)(data_bytes)
+
+    def _output_decoder(self, outputs: List[Dict[str, Any]]) -> Callable[[bytes], List[Any]]:
+        """Compiled decoder for an ABI output list, cached per spec.
+
+        Type strings are parsed, dynamic-ness decided and static head offsets
+        computed once, into a tree of closures; decoding a result then only
+        reads words. Unsupported types fail here rather than mid-decode."""
+        key = json.dumps(outputs, sort_keys=True, default=str)
+        with self._decoder_plans_lock:
+            cached = self._decoder_plans.get(key)
+            if cached is not None:
+                self._decoder_plans.move_to_end(key)
+                return cached
+        # Compiled outside the lock; racing threads may both compile, which is harmless.
+        decode_components = self._compile_components(outputs)
+
+        def plan(data_bytes: bytes) -> List[Any]:
+            # One view over the whole result: word reads below slice the
+            # view (no copies) and only leaf values are materialized.
+            return decode_components(memoryview(data_bytes), 0)
+
+        with self._decoder_plans_lock:
+            self._decoder_plans[key] = plan
+            self._decoder_plans.move_to_end(key)
+            while len(self._decoder_plans) > MAX_DECODER_PLANS:
+                self._decoder_plans.popitem(last=False)
+        return plan
+
+    def _compile_components(
+        self, components: List[Dict[str, Any]]
+    ) -> Callable[[bytes, int], List[Any]]:
+        """Decoder for a tuple body / output list whose heads start at `base`."""
+        fields: List[Tuple[int, Callable[[bytes, int, int], Any]]] = []
         cursor = 0
-        for entry in outputs:
-            typ = entry.get("type", "")
-            components = entry.get("components") or []
-            base_type, dims = self._split_array_dimensions(typ)
-            prepared.append((base_type, dims, components))
-            if self._is_dynamic_type_full(base_type, dims, components):
-                offsets.append(cursor)
+        for comp in components:
+            base_type, dims = self._split_array_dimensions(comp.get("type", ""))
+            comp_components = comp.get("components") or []
+            fields.append((cursor, self._compile_type(base_type, dims, comp_components)))
+            if self._is_dynamic_type_full(base_type, dims, comp_components):
                 cursor += 32
             else:
-                size = self._static_type_size(base_type, dims, components)
-                offsets.append(cursor)
-                cursor += size
+                cursor += self._static_type_size(base_type, dims, comp_components)
+        plan = tuple(fields)
 
-        values: List[Any] = []
-        for off, (base_type, dims, components) in zip(offsets, prepared):
-            values.append(self._decode_type(base_type, dims, components, data_bytes, off, 0))
-        return values
+        if len(plan) == 1:
+            (only_off, only_decoder), = plan
+
+            def decode_single(data_bytes: bytes, base: int) -> List[Any]:
+                return [only_decoder(data_bytes, base + only_off, base)]
+
+            return decode_single
+
+        def decode(data_bytes: bytes, base: int) -> List[Any]:
+            return [decoder(data_bytes, base + off, base) for off, decoder in plan]
+
+        return decode
+
+    def _compile_type(
+        self, base_type: str, dimensions: List[Optional[int]], components: List[Dict[str, Any]]
+    ) -> Callable[[bytes, int, int], Any]:
+        """Decoder `(data_bytes, head_offset, data_base) -> value` for one type;
+        `head_offset` is the value's head word, `data_base` the start of the
+        enclosing heads that dynamic offsets are relative to. `data_bytes` is
+        the memoryview made by `_output_decoder`."""
+        read_uint = self._read_uint
 
-    def _decode_type(
-        self,
-        base_type: str,
-        dimensions: List[Optional[int]],
-        components: List[Dict[str, Any]],
-        data_bytes: bytes,
-        head_offset: int,
-        data_base: int,
-    ) -> Any:
         if dimensions:
-            return self._decode_array(base_type, dimensions, components, data_bytes, head_offset, data_base)
+            dim = dimensions[0]
+            remaining_dims = dimensions[1:]
+            element = self._compile_type(base_type, remaining_dims, components)
+            element_dynamic = self._is_dynamic_type_full(base_type, remaining_dims, components)
+            element_size = 32 if element_dynamic else self._static_type_size(base_type, remaining_dims, components)
+
+            if dim is None or element_dynamic:
+                # dynamic array or static array containing dynamic elements -> treated as dynamic
+                def decode_dynamic_array(data_bytes: bytes, head_offset: int, data_base: int) -> List[Any]:
+                    array_base = data_base + read_uint(data_bytes, head_offset)
+                    if dim is None:
+                        length = read_uint(data_bytes, array_base)
+                        head_start = array_base + 32
+                    else:
+                        # T[k] with dynamic T: no length word, elements start right away.
+                        length = dim
+                        head_start = array_base
+                    # Element offsets are relative to the start of the element heads.
+                    return [
+                        element(data_bytes, head_start + element_size * idx, head_start) for idx in range(length)
+                    ]
+
+                return decode_dynamic_array
+
+            def decode_static_array(data_bytes: bytes, head_offset: int, data_base: int) -> List[Any]:
+                return [element(data_bytes, head_offset + element_size * idx, data_base) for idx in range(dim)]
+
+            return decode_static_array
 
-        # static word for inline static types or offset for dynamic
-        word = self._read_word(data_bytes, head_offset)
         if base_type == "address":
-            return "0x" + word[-20:].hex()
+
+            def decode_address(data_bytes: bytes, head_offset: int, data_base: int) -> str:
+                end = head_offset + 32
+                if end > len(data_bytes):
+                    raise ValueError("Result shorter than expected for ABI decoding.")
+                return "0x" + data_bytes[end - 20 : end].hex()
+
+            return decode_address
 
         if base_type.startswith("uint"):
-            bits = 256
             suffix = base_type[4:]
-            if suffix:
-                bits = int(suffix)
+            bits = int(suffix) if suffix else 256
             if bits <= 0 or bits > 256 or bits % 8 != 0:
                 raise ValueError(f"Unsupported uint size {bits}.")
-            return int.from_bytes(word, "big")
+
+            # Hot path for series of numeric reads: word read inlined.
+            def decode_uint(data_bytes: bytes, head_offset: int, data_base: int) -> int:
+                end = head_offset + 32
+                if end > len(data_bytes):
+                    raise ValueError("Result shorter than expected for ABI decoding.")
+                return int.from_bytes(data_bytes[head_offset:end], "big")
+
+            return decode_uint
 
         if base_type.startswith("int"):
-            bits = 256
             suffix = base_type[3:]
-            if suffix:
-                bits = int(suffix)
+            bits = int(suffix) if suffix else 256
             if bits <= 0 or bits > 256 or bits % 8 != 0:
                 raise ValueError(f"Unsupported int size {bits}.")
-            unsigned = int.from_bytes(word, "big")
-            sign_bit = 1 << (bits - 1)
-            mask = 1 << bits
-            return unsigned - mask if unsigned & sign_bit else unsigned
+
+            # intN words are sign-extended to 256 bits.
+            def decode_int(data_bytes: bytes, head_offset: int, data_base: int) -> int:
+                end = head_offset + 32
+                if end > len(data_bytes):
+                    raise ValueError("Result shorter than expected for ABI decoding.")
+                return int.from_bytes(data_bytes[head_offset:end], "big", signed=True)
+
+            return decode_int
 
         if base_type == "bool":
-            return bool(int.from_bytes(word, "big"))
+            return lambda data_bytes, head_offset, data_base: bool(read_uint(data_bytes, head_offset))
 
-        if base_type == "bytes":
-            offset = int.from_bytes(word, "big")
-            start = data_base + offset
-            length = int.from_bytes(self._read_word(data_bytes, start), "big")
-            data_start = start + 32
-            data_end = data_start + length
-            if data_end > len(data_bytes):
-                raise ValueError("bytes out of range.")
-            return "0x" + data_bytes[data_start:data_end].hex()
+        if base_type in ("bytes", "string"):
+            is_string = base_type == "string"
 
-        if base_type == "string":
-            offset = int.from_bytes(word, "big")
-            start = data_base + offset
-            length = int.from_bytes(self._read_word(data_bytes, start), "big")
-            data_start = start + 32
-            data_end = data_start + length
-            if data_end > len(data_bytes):
-                raise ValueError("string out of range.")
-            try:
-                return data_bytes[data_start:data_end].decode("utf-8", errors="replace")
-            except Exception as exc:
-                raise ValueError("Failed to decode string.") from exc
+            def decode_bytes(data_bytes: bytes, head_offset: int, data_base: int) -> str:
+                start = data_base + read_uint(data_bytes, head_offset)
+                length = read_uint(data_bytes, start)
+                data_start = start + 32
+                data_end = data_start + length
+                if data_end > len(data_bytes):
+                    raise ValueError(f"{base_type} out of range.")
+                if is_string:
+                    return str(data_bytes[data_start:data_end], "utf-8", "replace")
+                return "0x" + data_bytes[data_start:data_end].hex()
+
+            return decode_bytes
 
         if base_type.startswith("bytes"):
             size_part = base_type[5:]
@@ -1725,92 +3633,29 @@ class ContractService:
             size = int(size_part)
             if size <= 0 or size > 32:
                 raise ValueError("bytesN size must be between 1 and 32.")
-            return "0x" + word[:size].hex()
+
+            def decode_fixed_bytes(data_bytes: bytes, head_offset: int, data_base: int) -> str:
+                if head_offset + 32 > len(data_bytes):
+                    raise ValueError("Result shorter than expected for ABI decoding.")
+                return "0x" + data_bytes[head_offset : head_offset + size].hex()
+
+            return decode_fixed_bytes
 
         if base_type == "tuple":
+            body = self._compile_components(components)
+            names = [comp.get("name") or f"field{idx}" for idx, comp in enumerate(components)]
             is_dynamic_tuple = self._is_dynamic_type_full(base_type, [], components)
-            return self._decode_tuple(components, data_bytes, head_offset, data_base, is_dynamic_tuple)
-
-        raise ValueError(f"Unsupported ABI output type '{base_type}'.")
 
-    def _decode_array(
-        self,
-        base_type: str,
-        dimensions: List[Optional[int]],
-        components: List[Dict[str, Any]],
-        data_bytes: bytes,
-        head_offset: int,
-        data_base: int,
-    ) -> Any:
-        dim = dimensions[0]
-        remaining_dims = dimensions[1:]
-        element_dynamic = self._is_dynamic_type_full(base_type, remaining_dims, components)
-
-        if dim is None or element_dynamic:
-            # dynamic array or static array containing dynamic elements -> treated as dynamic
-            offset = int.from_bytes(self._read_word(data_bytes, head_offset), "big")
-            array_base = data_base + offset
-            length = int.from_bytes(self._read_word(data_bytes, array_base), "big")
-            values: List[Any] = []
-            head_start = array_base + 32
-            element_head_size = (
-                32 if element_dynamic else self._static_type_size(base_type, remaining_dims, components)
-            )
-            for idx in range(length):
-                elem_head = head_start + element_head_size * idx
-                values.append(
-                    self._decode_type(base_type, remaining_dims, components, data_bytes, elem_head, array_base)
-                )
-            return values
-
-        # static array with static elements
-        length = dim
-        element_size = self._static_type_size(base_type, remaining_dims, components)
-        values = []
-        for idx in range(length):
-            elem_head = head_offset + element_size * idx
-            values.append(
-                self._decode_type(base_type, remaining_dims, components, data_bytes, elem_head, data_base)
-            )
-        return values
+            def decode_tuple(data_bytes: bytes, head_offset: int, data_base: int) -> Dict[str, Any]:
+                if is_dynamic_tuple:
+                    tuple_base = data_base + read_uint(data_bytes, head_offset)
+                else:
+                    tuple_base = head_offset
+                return dict(zip(names, body(data_bytes, tuple_base)))
 
-    def _decode_tuple(
-        self,
-        components: List[Dict[str, Any]],
-        data_bytes: bytes,
-        head_offset: int,
-        data_base: int,
-        is_dynamic: bool,
-    ) -> Dict[str, Any]:
-        tuple_base = data_base + int.from_bytes(self._read_word(data_bytes, head_offset), "big") if is_dynamic else head_offset
-        values = self._decode_components(components, data_bytes, tuple_base)
-        obj: Dict[str, Any] = {}
-        for idx, (comp, val) in enumerate(zip(components, values)):
-            name = comp.get("name") or f"field{idx}"
-            obj[name] = val
-        return obj
-
-    def _decode_components(self, components: List[Dict[str, Any]], data_bytes: bytes, base_offset: int) -> List[Any]:
-        offsets: List[int] = []
-        prepared: List[Tuple[str, List[Optional[int]], List[Dict[str, Any]]]] = []
-        cursor = 0
-        for comp in components:
-            typ = comp.get("type", "")
-            comp_components = comp.get("components") or []
-            base_type, dims = self._split_array_dimensions(typ)
-            prepared.append((base_type, dims, comp_components))
-            if self._is_dynamic_type_full(base_type, dims, comp_components):
-                offsets.append(cursor)
-                cursor += 32
-            else:
-                size = self._static_type_size(base_type, dims, comp_components)
-                offsets.append(cursor)
-                cursor += size
+            return decode_tuple
 
-        values: List[Any] = []
-        for off, (base_type, dims, comp_components) in zip(offsets, prepared):
-            values.append(self._decode_type(base_type, dims, comp_components, data_bytes, base_offset + off, base_offset))
-        return values
+        raise ValueError(f"Unsupported ABI output type '{base_type}'.")
 
     def _is_dynamic_type_full(
         self, base_type: str, dimensions: List[Optional[int]], components: List[Dict[str, Any]]
@@ -1854,11 +3699,14 @@ class ContractService:
 
         return 32
 
-    def _read_word(self, data_bytes: bytes, offset: int) -> bytes:
+    @staticmethod
+    def _read_uint(data_bytes: bytes, offset: int) -> int:
+        """Unsigned word at `offset`, read in place (no slice copy when
+        `data_bytes` is a memoryview)."""
         end = offset + 32
         if end > len(data_bytes):
             raise ValueError("Result shorter than expected for ABI decoding.")
-        return data_bytes[offset:end]
+        return int.from_bytes(data_bytes[offset:end], "big")
 
     def _hex_to_bytes(self, value: str) -> bytes:
         if not isinstance(value, str):
@@ -1866,9 +3714,14 @@ class ContractService:
         v = value[2:] if value.startswith("0x") else value
         if len(v) % 2 != 0:
             v = "0" + v
-        if not re.fullmatch(r"[0-9a-fA-F]*", v):
+        try:
+            data = bytes.fromhex(v)
+        except ValueError:
+            raise ValueError("Result must be a hex string.") from None
+        # fromhex skips whitespace; a strict hex string decodes to exactly half its length.
+        if 2 * len(data) != len(v):
             raise ValueError("Result must be a hex string.")
-        return bytes.fromhex(v)
+        return data
 
     def _encode_function_call(self, function: str, args: List[Any]) -> Tuple[str, str]:
         """Encode function selector + arguments into hex data."""
@@ -1880,12 +3733,20 @@ class ContractService:
         if not selector:
             raise ValueError("Failed to compute function selector.")
 
+        data_bytes, _dynamic = self._encode_sequence(input_types, list(args))
+        return selector, "0x" + selector + data_bytes.hex()
+
+    def _encode_sequence(self, types: List[str], values: List[Any]) -> Tuple[bytes, bool]:
+        """Encode values as an ABI tuple (function args or tuple components):
+        static values inline in the head, dynamic values as head offsets into
+        the tail. Static multi-word values (static tuples / T[k]) take their
+        full size in the head."""
+        encoded = [self._encode_abi_value(typ, value) for typ, value in zip(types, values)]
         head_parts: List[bytes] = []
         tail_parts: List[bytes] = []
-        dynamic_offset = 32 * len(input_types)
+        dynamic_offset = sum(32 if dynamic else len(enc) for enc, dynamic in encoded)
 
-        for typ, value in zip(input_types, args):
-            enc, dynamic = self._encode_abi_value(typ, value)
+        for enc, dynamic in encoded:
             if dynamic:
                 # head contains offset to current tail start
                 head_parts.append(self._pad32(dynamic_offset.to_bytes(32, "big")))
@@ -1894,8 +3755,7 @@ class ContractService:
             else:
                 head_parts.append(enc)
 
-        data_bytes = b"".join(head_parts + tail_parts)
-        return selector, "0x" + selector + data_bytes.hex()
+        return b"".join(head_parts + tail_parts), any(dynamic for _, dynamic in encoded)
 
     def _normalize_address(self, address: str) -> str:
         if not isinstance(address, str):
@@ -2287,7 +4147,8 @@ class ContractService:
         self.cache.set(address, chain_id, parsed)
         proxy_info = self._proxy_info_from_contract(parsed)
         if proxy_info:
-            self.proxy_cache.set(address, chain_id, proxy_info)
+            # No verified_block to revalidate from: keep it out of the disk cache.
+            self.proxy_cache.set(address, chain_id, proxy_info, persist=False)
         return parsed
 
     def _apply_inline_policy(
@@ -2464,61 +4325,36 @@ class ContractService:
     def _normalize_hex_string(self, value: str, field: str, pad_to: Optional[int] = None) -> str:
         if not isinstance(value, str):
             raise ValueError(f"{field} must be a hex string.")
+        if not pad_to and value.startswith("0x") and HEX_BODY_PATTERN.fullmatch(value, 2):
+            # Already canonical (the usual RPC result): no copies.
+            return value
         candidate = value.strip().lower()
         if not candidate.startswith("0x"):
             candidate = f"0x{candidate}"
 
         hex_body = candidate[2:]
-        if not re.fullmatch(r"[0-9a-fA-F]*", hex_body):
+        if not HEX_BODY_PATTERN.fullmatch(hex_body):
             raise ValueError(f"{field} must be a hex string.")
 
         if pad_to:
             candidate = f"0x{hex_body.rjust(pad_to, '0')}"
         return candidate
 
-    def _map_block(self, block: Dict[str, Any], force_hashes_only: bool = False) -> Dict[str, Any]:
+    def _map_block(self, block: Dict[str, Any], force_hashes_only: bool = False) -> Optional[BlockRecord]:
         if not isinstance(block, dict):
-            return {}
-        mapped = {
-            "number": block.get("number"),
-            "hash": block.get("hash"),
-            "parentHash": block.get("parentHash"),
-            "nonce": block.get("nonce"),
-            "sha3Uncles": block.get("sha3Uncles"),
-            "logsBloom": block.get("logsBloom"),
-            "transactionsRoot": block.get("transactionsRoot"),
-            "stateRoot": block.get("stateRoot"),
-            "receiptsRoot": block.get("receiptsRoot"),
-            "miner": block.get("miner"),
-            "difficulty": block.get("difficulty"),
-            "totalDifficulty": block.get("totalDifficulty"),
-            "extraData": block.get("extraData"),
-            "size": block.get("size"),
-            "gasLimit": block.get("gasLimit"),
-            "gasUsed": block.get("gasUsed"),
-            "timestamp": block.get("timestamp"),
-            "transactions": None,
-            "uncles": block.get("uncles"),
-            "baseFeePerGas": block.get("baseFeePerGas"),
-            "mixHash": block.get("mixHash"),
-            "blobGasUsed": block.get("blobGasUsed"),
-            "excessBlobGas": block.get("excessBlobGas"),
-            "withdrawals": block.get("withdrawals"),
-            "withdrawalsRoot": block.get("withdrawalsRoot"),
-            "parentBeaconBlockRoot": block.get("parentBeaconBlockRoot"),
-            "blobGasPrice": block.get("blobGasPrice"),
-        }
+            return None
+        mapped = BlockRecord.from_raw(block)
 
         txs = block.get("transactions")
         if force_hashes_only:
             if isinstance(txs, list):
-                mapped["transactions"] = [tx.get("hash") if isinstance(tx, dict) else tx for tx in txs]
+                mapped.transactions = [tx.get("hash") if isinstance(tx, dict) else tx for tx in txs]
             else:
-                mapped["transactions"] = txs
+                mapped.transactions = txs
             return mapped
 
         if isinstance(txs, list) and all(isinstance(tx, str) for tx in txs):
-            mapped["transactions"] = txs
+            mapped.transactions = txs
             return mapped
 
         if isinstance(txs, list):
@@ -2545,9 +4381,9 @@ class ContractService:
                         "accessList": tx.get("accessList"),
                     }
                 )
-            mapped["transactions"] = mapped_txs
+            mapped.transactions = mapped_txs
         else:
-            mapped["transactions"] = txs
+            mapped.transactions = txs
         return mapped
 
     def _function_signature(self, name: str, inputs: List[Dict[str, Any]]) -> str:
@@ -2801,6 +4637,16 @@ class ContractService:
             padded = data_bytes.ljust(32, b"\x00")
             return padded, False
 
+        if base_type.startswith("(") and base_type.endswith(")"):
+            _, component_types = self._parse_function_signature(f"tuple{base_type}")
+            if not isinstance(value, (list, tuple)):
+                raise ValueError("tuple value must be a list or tuple.")
+            if len(value) != len(component_types):
+                raise ValueError(
+                    f"Tuple length mismatch: expected {len(component_types)}, got {len(value)}."
+                )
+            return self._encode_sequence(component_types, list(value))
+
         raise ValueError(f"Unsupported ABI type '{base_type}'.")
 
     def _encode_array(self, base_type: str, dimensions: List[Optional[int]], value: Any) -> Tuple[bytes, bool]:
@@ -2925,18 +4771,8 @@ class ContractService:
         # last 20 bytes as address
         return f"0x{normalized[-40:]}"
 
-    def _map_transaction(self, tx: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "hash": tx.get("hash"),
-            "from": tx.get("from"),
-            "to": tx.get("to"),
-            "value": tx.get("value"),
-            "gas": tx.get("gas"),
-            "gas_price": tx.get("gasPrice"),
-            "block_number": tx.get("blockNumber"),
-            "timestamp": tx.get("timeStamp"),
-            "input": tx.get("input"),
-        }
+    def _map_transaction(self, tx: Dict[str, Any]) -> TransactionRecord:
+        return TransactionRecord.from_raw(tx)
 
     def _map_transaction_detail(self, tx: Dict[str, Any]) -> Dict[str, Any]:
         def hx(field: str) -> Optional[int]:
@@ -2998,27 +4834,8 @@ class ContractService:
         except Exception:
             raise ValueError(f"{field} is not a valid hex value.")
 
-    def _map_token_transfer(self, transfer: Dict[str, Any], token_type: str) -> Dict[str, Any]:
-        base = {
-            "token_address": transfer.get("contractAddress") or transfer.get("tokenAddress"),
-            "token_symbol": transfer.get("tokenSymbol"),
-            "from": transfer.get("from"),
-            "to": transfer.get("to"),
-            "tx_hash": transfer.get("hash"),
-            "block_number": transfer.get("blockNumber"),
-            "timestamp": transfer.get("timeStamp"),
-            "token_type": token_type,
-        }
-
-        if token_type == "erc20":
-            base["value"] = transfer.get("value")
-            base["decimals"] = transfer.get("tokenDecimal")
-        elif token_type == "erc721":
-            base["token_id"] = transfer.get("tokenID") or transfer.get("tokenId")
-        elif token_type == "erc1155":
-            base["token_id"] = transfer.get("tokenID") or transfer.get("tokenId")
-            base["value"] = transfer.get("tokenValue") or transfer.get("value")
-        return base
+    def _map_token_transfer(self, transfer: Dict[str, Any], token_type: str) -> TokenTransferRecord:
+        return TokenTransferRecord.from_raw(transfer, token_type)
 
     # ---- get_transaction_summary helpers ----
 
@@ -3043,8 +4860,8 @@ class ContractService:
             data = log.get("data") or "0x"
             if not isinstance(data, str):
                 return None
-            data_clean = data[2:] if data.lower().startswith("0x") else data
-            amount_int = int(data_clean, 16) if data_clean else 0
+            # int(..., 16) accepts the 0x prefix itself: no slice copy per log.
+            amount_int = int(data, 16) if data not in ("", "0x", "0X") else 0
         except Exception:
             return None
         token_addr = log.get("address")
@@ -3078,6 +4895,14 @@ class ContractService:
         self.contract_name_cache.set(address, chain_id, {"name": name})
         return name
 
+    def _token_metadata_fields(self) -> Tuple[Tuple[str, str, Any], ...]:
+        """(field, selector, decoder) for the ERC20 metadata we resolve."""
+        return (
+            ("symbol", "0x95d89b41", self._decode_string_or_bytes32),
+            ("decimals", "0x313ce567", self._decode_uint8),
+            ("name", "0x06fdde03", self._decode_string_or_bytes32),
+        )
+
     def _get_token_metadata(
         self,
         address: str,
@@ -3098,19 +4923,15 @@ class ContractService:
         # This also auto-migrates pre-tightened-helper cache entries on disk:
         # any null value gets refreshed and rewritten on the next access.
         cached = self.token_metadata_cache.get(address, chain_id) or {}
-        fields = (
-            ("symbol", "0x95d89b41", self._raw_call_string_or_bytes32),
-            ("decimals", "0x313ce567", self._raw_call_uint8),
-            ("name", "0x06fdde03", self._raw_call_string_or_bytes32),
-        )
+        fields = self._token_metadata_fields()
         if all(cached.get(k) is not None for k, _, _ in fields):
             return dict(cached)
         result = {k: v for k, v in cached.items() if v is not None}
-        for field, selector, fetcher in fields:
+        for field, selector, decoder in fields:
             if result.get(field) is not None:
                 continue
             try:
-                value = fetcher(address, selector, chain_id, allow_default_rpc)
+                value = decoder(self._raw_eth_call(address, selector, chain_id, allow_default_rpc))
             except _TransientCallError:
                 continue
             if value is not None:
@@ -3120,6 +4941,141 @@ class ContractService:
             result.setdefault(field, None)
         return result
 
+    def _get_token_metadata_many(
+        self,
+        addresses: List[str],
+        network_label: Optional[str],
+        chain_id: str,
+        allow_default_rpc: bool,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Resolve metadata for many tokens at once. Every missing field of
+        every uncached token goes out as one Multicall3 `aggregate3` eth_call
+        (allowFailure=true), decoded with the same helpers and cached under
+        the same rules as `_get_token_metadata`: a reverted sub-call counts as
+        transient (like an RPC error on the per-call path) and is not cached.
+        Falls back to the per-token thread pool only when Multicall3 isn't
+        deployed on the chain."""
+        fields = self._token_metadata_fields()
+        token_metadata: Dict[str, Dict[str, Any]] = {}
+        partials: Dict[str, Dict[str, Any]] = {}
+        for addr in addresses:
+            cached = self.token_metadata_cache.get(addr, chain_id) or {}
+            if all(cached.get(k) is not None for k, _, _ in fields):
+                token_metadata[addr] = dict(cached)
+            else:
+                partials[addr] = {k: v for k, v in cached.items() if v is not None}
+        if not partials:
+            return token_metadata
+
+        calls = [
+            (addr, field, selector, decoder)
+            for addr, partial in partials.items()
+            for field, selector, decoder in fields
+            if partial.get(field) is None
+        ]
+        try:
+            outcomes = self._multicall3(
+                [(addr, selector) for addr, _, selector, _ in calls], chain_id, allow_default_rpc
+            )
+        except _TransientCallError:
+            # Whole aggregate failed (node hiccup / rate limit): nothing new to
+            # cache, missing fields retry on the next call.
+            outcomes = []
+
+        if outcomes is None:
+            with _thread_pool(min(self.config.metadata_fetch_concurrency, len(partials))) as pool:
+                results = pool.map(
+                    lambda a: (a, self._get_token_metadata(a, network_label, chain_id, allow_default_rpc)),
+                    list(partials),
+                )
+                for addr, meta in results:
+                    token_metadata[addr] = meta
+            return token_metadata
+
+        if outcomes:
+            for (addr, field, _, decoder), (success, raw) in zip(calls, outcomes):
+                if not success:
+                    continue
+                try:
+                    value = decoder(raw)
+                except _TransientCallError:
+                    continue
+                if value is not None:
+                    partials[addr][field] = value
+            self.token_metadata_cache.set_many(
+                {addr: dict(partial) for addr, partial in partials.items()}, chain_id
+            )
+
+        for addr, partial in partials.items():
+            for field, _, _ in fields:
+                partial.setdefault(field, None)
+            token_metadata[addr] = partial
+        return token_metadata
+
+    def _multicall3(
+        self,
+        calls: List[Tuple[str, str]],
+        chain_id: str,
+        allow_default_rpc: bool,
+    ) -> Optional[List[Tuple[bool, str]]]:
+        """Run `(target, calldata)` read-only calls through Multicall3
+        `aggregate3` with allowFailure=true, at `latest`. Returns one
+        `(success, return_hex)` per call in order, or `None` when Multicall3
+        isn't deployed on the chain (the aggregate `eth_call` answers `0x`).
+        Raises `_TransientCallError` for RPC-level failures. More than
+        `MULTICALL3_MAX_CALLS` calls are split into chunks, sent as one
+        JSON-RPC batch on the RPC path."""
+        if not calls:
+            return []
+        if chain_id in self._multicall3_unavailable:
+            return None
+
+        chunks = [
+            calls[i : i + MULTICALL3_MAX_CALLS] for i in range(0, len(calls), MULTICALL3_MAX_CALLS)
+        ]
+        payloads = [
+            self._encode_function_call(
+                MULTICALL3_AGGREGATE3_SIGNATURE,
+                [[[target, True, data] for target, data in chunk]],
+            )[1]
+            for chunk in chunks
+        ]
+
+        rpc = self._get_rpc_client(chain_id, allow_default_rpc)
+        try:
+            if rpc:
+                raw_results = rpc.batch_call(
+                    "eth_call",
+                    [[{"to": MULTICALL3_ADDRESS, "data": payload}, "latest"] for payload in payloads],
+                )
+            else:
+                self.client.chain_id = chain_id
+                raw_results = [
+                    self._extract_proxy_result(
+                        self.client.call(MULTICALL3_ADDRESS, payload, "latest"), allow_none=True
+                    )
+                    for payload in payloads
+                ]
+        except Exception as exc:
+            raise _TransientCallError(str(exc)) from exc
+
+        outcomes: List[Tuple[bool, str]] = []
+        for chunk, raw in zip(chunks, raw_results):
+            if not isinstance(raw, str):
+                raise _TransientCallError("Multicall3 eth_call returned non-string result")
+            if raw.lower() in {"", "0x"}:
+                self._multicall3_unavailable.add(chain_id)
+                return None
+            try:
+                rows = self._decode_outputs(MULTICALL3_RESULT_OUTPUTS, self._hex_to_bytes(raw))[0]
+            except Exception as exc:
+                raise _TransientCallError(f"Multicall3 result could not be decoded: {exc}") from exc
+            if len(rows) != len(chunk):
+                raise _TransientCallError("Multicall3 returned unexpected result count")
+            for row in rows:
+                outcomes.append((bool(row.get("success")), row.get("returnData") or "0x"))
+        return outcomes
+
     def _raw_eth_call(
         self,
         address: str,
@@ -3146,16 +5102,13 @@ class ContractService:
             return result
         return None
 
-    def _raw_call_string_or_bytes32(
-        self, address: str, data_hex: str, chain_id: str, allow_default_rpc: bool
-    ) -> Optional[str]:
+    def _decode_string_or_bytes32(self, raw: Optional[str]) -> Optional[str]:
         """Return the decoded string, or `None` only when both ABI string and
         bytes32 decoders failed on a non-empty result. "Empty / all-zero / not
         a string" outcomes are treated as transient (raise `_TransientCallError`)
         because real ERC20 tokens always have a symbol — an empty result is
         almost always a node hiccup, not the contract's actual state, and
         caching it as `None` would permanently mask the field."""
-        raw = self._raw_eth_call(address, data_hex, chain_id, allow_default_rpc)
         if not isinstance(raw, str):
             raise _TransientCallError("eth_call returned non-string result")
         body = raw[2:] if raw.lower().startswith("0x") else raw
@@ -3196,14 +5149,11 @@ class ContractService:
         # doesn't expose a parseable symbol/name. Cache as None.
         return None
 
-    def _raw_call_uint8(
-        self, address: str, data_hex: str, chain_id: str, allow_default_rpc: bool
-    ) -> Optional[int]:
+    def _decode_uint8(self, raw: Optional[str]) -> Optional[int]:
         """Return the parsed uint8, or raise `_TransientCallError` for any
         ambiguous outcome. There is no legitimate "contract doesn't have
         decimals()" case for a real ERC20 — caching `None` for decimals
         permanently breaks token amount scaling, so we always retry."""
-        raw = self._raw_eth_call(address, data_hex, chain_id, allow_default_rpc)
         if not isinstance(raw, str):
             raise _TransientCallError("eth_call returned non-string result")
         body = raw[2:] if raw.lower().startswith("0x") else raw
@@ -3217,13 +5167,5 @@ class ContractService:
             return value
         raise _TransientCallError(f"eth_call returned uint8 out of range: {value}")
 
-    def _map_log(self, entry: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "address": entry.get("address"),
-            "topics": entry.get("topics"),
-            "data": entry.get("data"),
-            "block_number": entry.get("blockNumber"),
-            "tx_hash": entry.get("transactionHash"),
-            "log_index": entry.get("logIndex"),
-            "time_stamp": entry.get("timeStamp"),
-        }
+    def _map_log(self, entry: Dict[str, Any]) -> LogRecord:
+        return LogRecord.from_raw(entry)
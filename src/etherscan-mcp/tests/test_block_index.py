@@ -0,0 +1,57 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.block_index import BlockTimeIndex
+
+
+class BlockTimeIndexTest(unittest.TestCase):
+    def test_thins_caps_and_keeps_pinned_pairs(self) -> None:
+        index = BlockTimeIndex(finality_depth=0, spacing_seconds=100, max_samples=16)
+        index.record_head("1", 10_000)
+        index.add_many("1", [(n, n * 12) for n in range(0, 100)])  # 12s blocks: one per 9 survives
+        self.assertEqual(index.size("1"), 12)
+        self.assertEqual(index.bracket("1", 50 * 12, True), ((45, 540), (54, 648)))
+
+        index.add_many("1", [(50, 600), (51, 612)], pinned=True)
+        self.assertEqual(index.bracket("1", 600, True), ((50, 600), (51, 612)))
+
+        index.add_many("1", [(n, n * 12) for n in range(100, 10_000)])
+        self.assertLessEqual(index.size("1"), 16)
+        self.assertEqual(index.bracket("1", 600, True), ((50, 600), (51, 612)))
+
+    def test_flushes_only_when_samples_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "block_times.json"
+            index = BlockTimeIndex(disk_path=path, finality_depth=0, spacing_seconds=100)
+            index.record_head("1", 1_000)
+            index.add_many("1", [(10, 120)])
+            index.flush()
+            path.write_text("{}")  # any further write would overwrite this
+
+            index.record_head("1", 2_000)
+            index.add_many("1", [(11, 132), (10, 120)])  # within spacing / already known
+            index.flush()
+            self.assertEqual(path.read_text(), "{}")
+
+            index.add_many("1", [(500, 6_000)])
+            index.flush()
+            self.assertEqual(json.loads(path.read_text())["1"], {"head": 2_000, "samples": [[10, 120], [500, 6_000]]})
+
+    def test_head_max_age_ignores_heads_not_seen_in_this_process(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "block_times.json"
+            index = BlockTimeIndex(disk_path=path, finality_depth=0)
+            index.record_head("1", 1_000)
+            self.assertEqual(index.head("1", max_age=60), 1_000)
+            index.add_many("1", [(10, 120)])
+            index.flush()
+
+            reloaded = BlockTimeIndex(disk_path=path, finality_depth=0)
+            self.assertEqual(reloaded.head("1"), 1_000)
+            self.assertIsNone(reloaded.head("1", max_age=60))
+
+
+if __name__ == "__main__":
+    unittest.main()
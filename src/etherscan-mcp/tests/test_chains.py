@@ -0,0 +1,127 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.chains import ChainRegistry
+
+URL = "https://api.etherscan.io/v2/chainlist"
+
+
+def chainlist(*rows: tuple) -> Dict[str, Any]:
+    return {"result": [{"chainname": name, "chainid": cid, "status": 1} for name, cid in rows]}
+
+
+class FakeClient:
+    def __init__(self, payload: Any) -> None:
+        self.payload = payload
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_chainlist(self, url: str) -> Dict[str, Any]:
+        self.calls += 1
+        self.release.wait(5)
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+
+class ChainSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "chainlist.json"
+
+    def test_snapshot_resolves_without_fetch(self) -> None:
+        first = FakeClient(chainlist(("Ethereum Mainnet", "1"), ("Arbitrum One Mainnet", "42161")))
+        ChainRegistry(first, URL, snapshot_path=self.path).resolve("arbitrum")
+        self.assertEqual(first.calls, 1)
+
+        offline = FakeClient(OSError("network down"))
+        registry = ChainRegistry(offline, URL, snapshot_path=self.path)
+        self.assertEqual(registry.resolve("arbitrum")[:2], ("arbitrum-one-mainnet", "42161"))
+        self.assertEqual(registry.resolve("42161")[2]["chainname"], "Arbitrum One Mainnet")
+        self.assertEqual(offline.calls, 0)
+
+        # A snapshot of another chainlist endpoint is not used.
+        with self.assertRaises(OSError):
+            ChainRegistry(offline, URL + "?other", snapshot_path=self.path).resolve("arbitrum")
+
+    def test_stale_snapshot_answers_while_refreshing(self) -> None:
+        ChainRegistry(FakeClient(chainlist(("Ethereum Mainnet", "1"))), URL, snapshot_path=self.path).refresh()
+        snapshot = json.loads(self.path.read_text())
+        snapshot["fetched_at"] = time.time() - 7200
+        self.path.write_text(json.dumps(snapshot))
+
+        client = FakeClient(chainlist(("Ethereum Mainnet", "1"), ("Base Mainnet", "8453")))
+        client.release.clear()
+        registry = ChainRegistry(client, URL, ttl_seconds=3600, snapshot_path=self.path)
+        self.assertEqual(registry.resolve("ethereum")[1], "1")  # served stale, fetch still blocked
+        with self.assertRaises(ValueError):
+            registry.resolve("base mainnet")
+
+        client.release.set()
+        registry.wait_for_refresh(5)
+        self.assertEqual(registry.resolve("base mainnet")[1], "8453")
+        self.assertEqual(client.calls, 1)
+        self.assertIn("base mainnet", json.loads(self.path.read_text())["index"])
+
+    def test_failed_background_refresh_keeps_stale_list(self) -> None:
+        ChainRegistry(FakeClient(chainlist(("Ethereum Mainnet", "1"))), URL, snapshot_path=self.path).refresh()
+        client = FakeClient(OSError("network down"))
+        registry = ChainRegistry(client, URL, ttl_seconds=30, snapshot_path=self.path)
+        registry._loaded_at -= 60
+
+        results: List[str] = []
+        for _ in range(3):
+            results.append(registry.resolve("ethereum")[1])
+            registry.wait_for_refresh(5)
+        self.assertEqual(results, ["1", "1", "1"])
+        self.assertEqual(client.calls, 1)  # retries are spaced out
+
+
+
+class ChainResolveTest(unittest.TestCase):
+    def make_registry(self) -> ChainRegistry:
+        client = FakeClient(
+            chainlist(
+                ("Ethereum Mainnet", "1"),
+                ("Arbitrum One Mainnet", "42161"),
+                ("Arbitrum Nova Mainnet", "42170"),
+                ("Arbitrum Sepolia Testnet", "421614"),
+                ("OP Mainnet", "10"),
+            )
+        )
+        registry = ChainRegistry(client, URL)
+        registry.refresh()
+        return registry
+
+    def test_prefix_and_substring_ranking(self) -> None:
+        registry = self.make_registry()
+        label, cid, meta = registry.resolve("arbitrum n")
+        self.assertEqual((label, cid, meta["matched_by"]), ("arbitrum-nova-mainnet", "42170", "fuzzy"))
+        self.assertEqual(registry.resolve("one main")[1], "42161")  # substring only
+        self.assertEqual(registry.resolve("nova")[1], "42170")
+        self.assertEqual(registry.resolve("arb1")[1], "42161")  # alias, exact
+        with self.assertRaisesRegex(ValueError, "Ambiguous"):
+            registry.resolve("arbi")  # prefix of three chains beats the substring hits
+        with self.assertRaisesRegex(ValueError, "Unknown network"):
+            registry.resolve("solana")
+
+    def test_memo_is_copied_and_cleared_on_refresh(self) -> None:
+        registry = self.make_registry()
+        meta = registry.resolve("arbitrum n")[2]
+        meta["matched_by"] = "mutated"
+        self.assertEqual(registry.resolve("arbitrum n")[2]["matched_by"], "fuzzy")
+
+        registry._client.payload = chainlist(("Arbitrum Next Mainnet", "7"))
+        registry.refresh(force=True)
+        self.assertEqual(registry.resolve("arbitrum n")[1], "7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,16 @@
+import os
+import subprocess
+import sys
 import unittest
+from pathlib import Path
 
 from app.cli import _redact_secrets
 
+APP_DIR = str(Path(__file__).resolve().parents[1])
+# Generous ceiling for the app's own imports (measured ~70ms incl. app.daemon); catches an
+# eager `requests` / service-wide import creeping back in, not jitter.
+IMPORT_BUDGET_US = 250_000
+
 
 class RedactSecretsTest(unittest.TestCase):
     def test_redacts_path_query_and_fragment(self) -> None:
@@ -31,5 +40,33 @@ class RedactSecretsTest(unittest.TestCase):
         )
 
 
+class OfflineStartupTest(unittest.TestCase):
+    def test_offline_command_skips_network_stack_and_api_key(self) -> None:
+        env = {k: v for k, v in os.environ.items() if k != "ETHERSCAN_API_KEY"}
+        env.update(ETHERSCAN_MCP_NO_DAEMON="1", PYTHONPATH=APP_DIR)
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "app", "keccak", "--value", "abc"],
+            cwd=APP_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        self.assertIn("0x4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45", proc.stdout)
+
+        # "import time: self | cumulative | module" lines; top-level entries are unindented.
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cum, name = line.split("|")
+                if cum.strip().isdigit():
+                    cumulative[name.rstrip()] = int(cum)
+        modules = {name.strip() for name in cumulative}
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("concurrent.futures", modules)
+        own = sum(us for name, us in cumulative.items() if name.startswith(" app") and not name.startswith("  "))
+        self.assertLess(own, IMPORT_BUDGET_US)
+
+
 if __name__ == "__main__":
     unittest.main()
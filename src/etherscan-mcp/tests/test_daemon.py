@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app import daemon
+from app.config import Config
+from app.service import ContractService
+
+APP_DIR = str(Path(__file__).resolve().parents[1])
+
+
+class DaemonTest(unittest.TestCase):
+    def test_cli_forwards_to_running_daemon(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "d.sock")
+            svc = ContractService(Config(api_key="test", chain_id_override="1", cache_dir=None))
+            # Client and daemon share one environment, whatever the developer's
+            # shell exports (e.g. ETHERSCAN_API_KEY), so nothing falls back.
+            env = {k: v for k, v in os.environ.items() if k != "ETHERSCAN_MCP_NO_DAEMON"}
+            env.update(ETHERSCAN_MCP_SOCKET=path, PYTHONPATH=APP_DIR)
+            summary: dict = {}
+            server = threading.Thread(target=lambda: summary.update(daemon.serve(svc, path, env)), daemon=True)
+            server.start()
+            while not os.path.exists(path):
+                server.join(0.01)
+
+            def run(*argv: str) -> subprocess.CompletedProcess:
+                return subprocess.run(
+                    [sys.executable, "-m", "app", *argv], cwd=APP_DIR, env=env, capture_output=True, text=True
+                )
+
+            ok = run("--compact-output", "keccak", "--value", "abc")
+            bad = run("convert", "--value", "1", "--from", "nope", "--to", "eth")
+            # An argument value that happens to be a daemon-local subcommand name.
+            named_stats = run("keccak", "--value", "stats")
+            stats = run("stats")
+            self.assertEqual(daemon.stop(path)["stopped"], True)
+            server.join(5)
+
+        self.assertEqual((ok.returncode, ok.stderr), (0, ""))
+        self.assertIn('"0x4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"', ok.stdout)
+        self.assertEqual(bad.returncode, 1)
+        self.assertTrue(bad.stderr.startswith("Error: "))
+        self.assertEqual(named_stats.returncode, 0, named_stats.stderr)
+        self.assertEqual(summary["commands_served"], 3)  # all ran in the daemon, none locally
+        self.assertEqual(stats.returncode, 0, stats.stderr)
+        tools = {
+            (row["labels"]["tool"], row["labels"]["outcome"])
+            for row in json.loads(stats.stdout)["histograms"]["tool_duration_seconds"]
+        }
+        self.assertLessEqual({("keccak", "ok"), ("convert", "error")}, tools)
+        self.assertFalse(os.path.exists(path))
+
+    def test_ignores_paths_that_are_not_own_sockets(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "d.sock")
+            Path(path).write_text("")
+            self.assertIsNone(daemon.forward(["keccak", "--value", "abc"], path))
+            svc = ContractService(Config(api_key="test", chain_id_override="1", cache_dir=None))
+            with self.assertRaisesRegex(ValueError, "refusing to start"):
+                daemon.serve(svc, path)
+            self.assertTrue(os.path.exists(path))
+
+    def test_no_daemon_means_local_run(self) -> None:
+        self.assertIsNone(daemon.forward(["keccak", "--value", "abc"], "/nonexistent/etherscan-mcp.sock"))
+        with self.assertRaisesRegex(ValueError, "No daemon"):
+            daemon.stats("/nonexistent/etherscan-mcp.sock")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import csv
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.export import export_result
+from app.records import LogRecord, TokenTransferRecord
+
+TOKEN = "0x" + "aa" * 20
+TOPIC = "0x" + "dd" * 32
+TX_HASH = "0x" + "11" * 32
+
+
+def sample_logs() -> dict:
+    rows = [
+        LogRecord(TOKEN, [TOPIC], "0x", hex(20_000_000 + i), TX_HASH, hex(i), "0x65920080") for i in range(3)
+    ]
+    return {"logs": rows}
+
+
+def sample_series() -> dict:
+    def point(block: int, ok: bool) -> dict:
+        outputs = [{"name": "totalSupply", "type": "uint256", "value": 10**30 + block, "decimals": 18, "value_scaled": "x"}]
+        return {
+            "block_number": block,
+            "block_tag": hex(block),
+            "data": "0x",
+            "decoded": {"ok": ok, "outputs": outputs if ok else []},
+        }
+
+    return {"series": [point(10, False), point(20, True)]}
+
+
+class ExportTest(unittest.TestCase):
+    def test_csv_logs_and_series(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            logs_path = str(Path(tmp) / "logs.csv")
+            summary = export_result(sample_logs(), "logs", "csv", logs_path)
+            with open(logs_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+
+            self.assertEqual(summary["rows"], 3)
+            self.assertEqual([r["block_number"] for r in rows], ["20000000", "20000001", "20000002"])
+            self.assertEqual((rows[0]["topics"], rows[0]["time_stamp"]), (f'["{TOPIC}"]', str(0x65920080)))
+
+            series_path = str(Path(tmp) / "series.csv")
+            summary = export_result(sample_series(), "series", "csv", series_path)
+            with open(series_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+
+            self.assertEqual(summary["columns"], ["block_number", "data", "totalSupply", "totalSupply_scaled"])
+            self.assertEqual([r["totalSupply"] for r in rows], ["", str(10**30 + 20)])
+
+    def test_binary_formats_need_out(self) -> None:
+        with self.assertRaises(ValueError):
+            export_result(sample_logs(), "logs", "parquet", None)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_typed_columns(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        transfer = TokenTransferRecord(TOKEN, "TKN", TOKEN, TOKEN, TX_HASH, "19000000", "1700000000", "erc20", str(2**200), "18")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "transfers.parquet")
+            export_result({"transfers": [transfer]}, "transfers", "parquet", path)
+            table = pq.read_table(path)
+
+        self.assertEqual(table.schema.field("block_number").type, pa.int64())
+        self.assertEqual(table.schema.field("from").type, pa.binary(20))
+        self.assertEqual(table.column("value").to_pylist(), [str(2**200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
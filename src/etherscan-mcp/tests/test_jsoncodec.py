@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from app import jsoncodec
+from app.records import TransactionRecord, jsonable
+
+
+class JsonCodecTest(unittest.TestCase):
+    def test_matches_stdlib_output(self) -> None:
+        value = {
+            "series": [{"block_number": 1, "value": 2**255, "ok": True}],
+            "rows": [TransactionRecord("0x01", "0xaa", None, "1", "21000", "1", "0x10", "1", "0x")],
+            3: None,
+        }
+        expected = json.loads(json.dumps(value, default=jsonable))
+
+        for indent in (False, True):
+            text = jsoncodec.dumps(value, indent=indent, default=jsonable)
+            self.assertEqual(json.loads(text), expected)
+            self.assertEqual("\n" in text, indent)
+        self.assertEqual(expected["rows"][0]["from"], "0xaa")
+
+    def test_non_ascii_is_written_the_same_with_or_without_big_ints(self) -> None:
+        for value in ({"name": "Ünï ✓"}, {"name": "Ünï ✓", "supply": 2**200}):
+            with self.subTest(big_int="supply" in value):
+                self.assertIn("Ünï ✓", jsoncodec.dumps(value))
+                self.assertIn("Ünï ✓", jsoncodec.dumps(value, indent=True))
+
+    def test_loads_bytes_and_rejects_garbage(self) -> None:
+        self.assertEqual(jsoncodec.loads(b'{"result":"0x1"}'), {"result": "0x1"})
+        with self.assertRaises(ValueError):
+            jsoncodec.loads(b"<html>")
+
+
+if __name__ == "__main__":
+    unittest.main()
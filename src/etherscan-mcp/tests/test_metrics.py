@@ -0,0 +1,128 @@
+import unittest
+from typing import Any, Iterator, List
+
+from app.cache import ContractCache
+from app.etherscan_client import EtherscanClient
+from app.metrics import REGISTRY, Registry, instrument_tools
+from app.service import _thread_pool
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200) -> None:
+        self.content = body
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self, bodies: List[bytes]) -> None:
+        self.bodies = bodies
+
+    def get(self, url: str, params: Any = None, timeout: Any = None) -> FakeResponse:
+        return FakeResponse(self.bodies.pop(0))
+
+
+def counter(snapshot: dict, name: str, **labels: str) -> float:
+    return sum(
+        row["value"] for row in snapshot["counters"].get(name, []) if labels.items() <= row["labels"].items()
+    )
+
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        REGISTRY.reset()
+
+    def test_histogram_quantiles_and_prometheus_text(self) -> None:
+        registry = Registry()
+        for seconds in (0.002, 0.003, 0.004, 0.2):
+            registry.observe("tool_duration_seconds", seconds, tool="call_function", outcome="ok")
+        registry.inc("cache_requests_total", cache="proxy", result="hit")
+        registry.inc("cache_requests_total", 3, cache="proxy", result="miss")
+
+        row = registry.snapshot()["histograms"]["tool_duration_seconds"][0]
+        self.assertEqual((row["count"], row["sum_seconds"]), (4, 0.209))
+        self.assertLessEqual(row["p50_seconds"], 0.005)
+        self.assertGreater(row["p99_seconds"], 0.1)
+        self.assertEqual(registry.snapshot()["cache_hit_ratio"], {"proxy": 0.25})
+
+        text = registry.render_prometheus()
+        self.assertIn('etherscan_mcp_tool_duration_seconds_bucket{outcome="ok",tool="call_function",le="0.005"} 3', text)
+        self.assertIn('etherscan_mcp_tool_duration_seconds_bucket{outcome="ok",tool="call_function",le="+Inf"} 4', text)
+        self.assertIn('etherscan_mcp_cache_requests_total{cache="proxy",result="miss"} 3', text)
+        self.assertIn("# TYPE etherscan_mcp_cache_requests_total counter", text)
+
+    def test_only_outermost_tool_call_is_timed(self) -> None:
+        @instrument_tools(exclude=("helper",))
+        class Service:
+            def outer(self) -> int:
+                return self.inner() + self.helper()
+
+            def inner(self) -> int:
+                return 1
+
+            def helper(self) -> int:
+                return 1
+
+            def broken(self) -> None:
+                raise ValueError("boom")
+
+            def pooled(self) -> List[int]:
+                with _thread_pool(2) as pool:
+                    return list(pool.map(lambda _: self.inner(), range(3)))
+
+            def iter_items(self) -> Iterator[int]:
+                for _ in range(2):
+                    yield self.inner()
+
+            def collect(self) -> List[int]:
+                return list(self.iter_items())
+
+        svc = Service()
+        svc.outer()
+        with self.assertRaises(ValueError):
+            svc.broken()
+        svc.pooled()
+        svc.collect()
+        for _ in svc.iter_items():
+            svc.inner()  # the consumer's own calls between items are tools
+
+        rows = REGISTRY.snapshot()["histograms"]["tool_duration_seconds"]
+        self.assertEqual(
+            [(row["labels"]["tool"], row["labels"]["outcome"], row["count"]) for row in rows],
+            [
+                ("broken", "error", 1),
+                ("collect", "ok", 1),
+                ("inner", "ok", 2),
+                ("iter_items", "ok", 1),
+                ("outer", "ok", 1),
+                ("pooled", "ok", 1),
+            ],
+        )
+
+    def test_upstream_retries_rate_limits_bytes_and_cache(self) -> None:
+        client = EtherscanClient("key", "https://example.invalid/api", "1", backoff_seconds=0)
+        limited = b'{"status":"0","message":"NOTOK","result":"Max calls per sec rate limit reached (5/sec)"}'
+        client.session = FakeSession([limited, b'{"status":"1","result":"0x10"}'])
+        self.assertEqual(client.get_block_number()["result"], "0x10")
+
+        cache = ContractCache(name="token_metadata")
+        cache.get("0xAA", "1")
+        cache.set("0xaa", "1", {"symbol": "X"}, persist=False)
+        cache.get("0xaa", "1")
+
+        snapshot = REGISTRY.snapshot()
+        self.assertEqual(counter(snapshot, "upstream_retries_total", method="eth_blockNumber", reason="rate_limited"), 1)
+        self.assertEqual(counter(snapshot, "upstream_rate_limited_total", upstream="etherscan"), 1)
+        self.assertEqual(counter(snapshot, "upstream_bytes_total", direction="received"), len(limited) + 30)
+        upstream = snapshot["histograms"]["upstream_request_duration_seconds"]
+        self.assertEqual(
+            [(row["labels"]["method"], row["labels"]["outcome"], row["count"]) for row in upstream],
+            [("eth_blockNumber", "ok", 1)],
+        )
+        self.assertEqual(snapshot["cache_hit_ratio"], {"token_metadata": 0.5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1147 @@
+import importlib.util
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest import mock
+
+from app.config import Config, resolve_chain_id
+from app.records import LogRecord, materialize
+from app.service import (
+    ADMIN_CHANGED_TOPIC,
+    EIP1822_PROXIABLE_SLOT,
+    EIP1967_ADMIN_SLOT,
+    EIP1967_BEACON_SLOT,
+    EIP1967_IMPLEMENTATION_SLOT,
+    MULTICALL3_ADDRESS,
+    PROXY_REVALIDATE_INTERVAL,
+    ContractService,
+)
+
+RPC_URL = "http://rpc.test"
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+TX_HASH = "0x" + "11" * 32
+
+
+class FakeRpc:
+    """Stand-in for RpcClient: routes every call through `handler(method, params)`
+    and records `(kind, method, params)` so tests can count round trips."""
+
+    def __init__(self, handler: Callable[[str, List[Any]], Any]) -> None:
+        self.handler = handler
+        self.requests: List[tuple] = []
+
+    def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        self.requests.append(("call", method, params))
+        return self.handler(method, params or [])
+
+    def batch_call(self, method: str, params_list: List[List[Any]]) -> List[Any]:
+        self.requests.append(("batch", method, params_list))
+        return [self.handler(method, params) for params in params_list]
+
+    def batch_request(self, calls: List[tuple]) -> List[Any]:
+        self.requests.append(("batch", None, calls))
+        return [self.handler(method, params) for method, params in calls]
+
+    def get_block_number(self) -> int:
+        return int(self.call("eth_blockNumber", []), 16)
+
+
+def make_service(rpc: Optional[FakeRpc] = None) -> ContractService:
+    config = Config(
+        api_key="test",
+        chain_id_override="1",
+        rpc_urls={"1": RPC_URL} if rpc else {},
+        cache_dir=None,
+    )
+    svc = ContractService(config)
+    # Named networks resolve offline via the static map (no chainlist fetch).
+    svc.chains.resolve = lambda network: (str(network).lower(), resolve_chain_id(str(network)), {})
+    if rpc:
+        svc._rpc_clients[RPC_URL] = rpc
+    return svc
+
+
+def abi_string(svc: ContractService, text: str) -> str:
+    return "0x" + svc._encode_sequence(["string"], [text])[0].hex()
+
+
+def abi_uint(value: int) -> str:
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+def aggregate3_result(svc: ContractService, rows: List[tuple]) -> str:
+    encoded, _ = svc._encode_sequence(["(bool,bytes)[]"], [[[ok, data] for ok, data in rows]])
+    return "0x" + encoded.hex()
+
+
+class AbiCodecTest(unittest.TestCase):
+    def test_round_trips_dynamic_arrays_of_dynamic_elements(self) -> None:
+        svc = make_service()
+        cases = [
+            ("string[]", [], ["a", "bcd"]),
+            ("string[2]", [], ["x", "y"]),
+            (
+                "tuple[]",
+                [{"name": "ok", "type": "bool"}, {"name": "data", "type": "bytes"}],
+                [{"ok": True, "data": "0x1234"}, {"ok": False, "data": "0x"}],
+            ),
+        ]
+        for typ, components, value in cases:
+            with self.subTest(typ=typ):
+                sig_type = "(bool,bytes)[]" if components else typ
+                raw = value if not components else [[v["ok"], v["data"]] for v in value]
+                encoded, _ = svc._encode_sequence([sig_type], [raw])
+                decoded = svc._decode_outputs([{"type": typ, "components": components}], encoded)
+                self.assertEqual(decoded, [value])
+
+
+    def test_output_plans_are_compiled_once_per_spec(self) -> None:
+        svc = make_service()
+        outputs = [{"name": "reserves", "type": "tuple", "components": [{"name": "r0", "type": "uint112"}, {"name": "r1", "type": "int256"}]}]
+        plan = svc._output_decoder(outputs)
+        self.assertIs(svc._output_decoder([dict(outputs[0])]), plan)
+        encoded, _ = svc._encode_sequence(["(uint112,int256)"], [[7, -3]])
+        self.assertEqual(plan(encoded), [{"r0": 7, "r1": -3}])
+
+        with mock.patch("app.service.MAX_DECODER_PLANS", 2):
+            svc._output_decoder([{"type": "uint8"}])
+            svc._output_decoder(outputs)  # refreshed: the uint8 plan is now oldest
+            svc._output_decoder([{"type": "bool"}])
+        self.assertEqual(len(svc._decoder_plans), 2)
+        self.assertIs(svc._output_decoder(outputs), plan)
+
+        decode = svc._call_result_decoder({"selector": "0902f1ac", "entry": {"outputs": [{"type": "fixed128x18"}]}}, None)
+        result = decode("0x" + "00" * 32)
+        self.assertFalse(result["ok"])
+        self.assertIn("Unsupported ABI output type", result["error"])
+
+    def test_decodes_from_views_and_rejects_loose_hex(self) -> None:
+        svc = make_service()
+        outputs = [
+            {"name": "tick", "type": "int24"},
+            {"name": "owner", "type": "address"},
+            {"name": "tag", "type": "bytes4"},
+            {"name": "label", "type": "string"},
+        ]
+        encoded, _ = svc._encode_sequence(["int256", "address", "bytes4", "string"], [-3, TOKEN_A, "0xdeadbeef", "hi"])
+        decode = svc._call_result_decoder({"selector": "00000000", "entry": {"outputs": outputs}}, None)
+
+        result = decode("0x" + encoded.hex())
+
+        self.assertEqual([o["value"] for o in result["outputs"]], [-3, TOKEN_A, "0xdeadbeef", "hi"])
+        for loose in ("0x00 11", "0xzz"):
+            with self.assertRaises(ValueError):
+                svc._hex_to_bytes(loose)
+        self.assertFalse(decode("0x" + "00" * 31)["ok"])
+
+
+class TokenMetadataMulticallTest(unittest.TestCase):
+    def test_resolves_all_tokens_in_one_aggregate_call(self) -> None:
+        svc = make_service(FakeRpc(lambda m, p: None))
+        answers = {
+            (TOKEN_A, "0x95d89b41"): (True, abi_string(svc, "USDC")),
+            (TOKEN_A, "0x313ce567"): (True, abi_uint(6)),
+            (TOKEN_A, "0x06fdde03"): (True, abi_string(svc, "USD Coin")),
+            (TOKEN_B, "0x95d89b41"): (True, "0x" + b"MKR".ljust(32, b"\x00").hex()),
+            (TOKEN_B, "0x313ce567"): (True, abi_uint(18)),
+            (TOKEN_B, "0x06fdde03"): (False, "0x"),
+        }
+
+        def handler(method: str, params: List[Any]) -> Any:
+            self.assertEqual(method, "eth_call")
+            self.assertEqual(params[0]["to"], MULTICALL3_ADDRESS)
+            data = bytes.fromhex(params[0]["data"][10:])
+            calls = svc._decode_outputs(
+                [
+                    {
+                        "type": "tuple[]",
+                        "components": [
+                            {"name": "target", "type": "address"},
+                            {"name": "allowFailure", "type": "bool"},
+                            {"name": "callData", "type": "bytes"},
+                        ],
+                    }
+                ],
+                data,
+            )[0]
+            return aggregate3_result(svc, [answers[(c["target"], c["callData"])] for c in calls])
+
+        rpc = FakeRpc(handler)
+        svc._rpc_clients[RPC_URL] = rpc
+
+        meta = svc._get_token_metadata_many([TOKEN_A, TOKEN_B], "mainnet", "1", allow_default_rpc=False)
+
+        self.assertEqual(len(rpc.requests), 1)
+        self.assertEqual(meta[TOKEN_A], {"symbol": "USDC", "decimals": 6, "name": "USD Coin"})
+        self.assertEqual(meta[TOKEN_B], {"symbol": "MKR", "decimals": 18, "name": None})
+        # Reverted sub-call is transient: not cached, retried next time.
+        self.assertEqual(svc.token_metadata_cache.get(TOKEN_B, "1"), {"symbol": "MKR", "decimals": 18})
+
+        svc._get_token_metadata_many([TOKEN_A], "mainnet", "1", allow_default_rpc=False)
+        self.assertEqual(len(rpc.requests), 1)
+
+    def test_falls_back_to_per_call_when_multicall3_missing(self) -> None:
+        svc = make_service(FakeRpc(lambda m, p: None))
+        per_call: Dict[str, str] = {
+            "0x95d89b41": abi_string(svc, "WETH"),
+            "0x313ce567": abi_uint(18),
+            "0x06fdde03": abi_string(svc, "Wrapped Ether"),
+        }
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if params[0]["to"] == MULTICALL3_ADDRESS:
+                return "0x"
+            return per_call[params[0]["data"]]
+
+        svc._rpc_clients[RPC_URL] = FakeRpc(handler)
+
+        meta = svc._get_token_metadata_many([TOKEN_A], "mainnet", "1", allow_default_rpc=False)
+
+        self.assertEqual(meta[TOKEN_A], {"symbol": "WETH", "decimals": 18, "name": "Wrapped Ether"})
+        self.assertIn("1", svc._multicall3_unavailable)
+
+
+class GetTransactionTest(unittest.TestCase):
+    def test_fetches_transaction_and_receipt_in_one_batch(self) -> None:
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return "0x10"
+            if method == "eth_getTransactionByHash":
+                return {"hash": params[0], "from": TOKEN_A, "to": TOKEN_B, "value": "0x0", "blockNumber": "0x10"}
+            if method == "eth_getTransactionReceipt":
+                return {"status": "0x1", "gasUsed": "0x5208", "blockNumber": "0x10", "logs": []}
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+
+        result = svc.get_transaction(TX_HASH)
+
+        self.assertEqual(len(rpc.requests), 1)
+        self.assertEqual(result["transaction"]["block_number"], 16)
+        self.assertEqual(result["receipt"]["gas_used"], 21000)
+        # Head == tx block: not final yet, so nothing is cached.
+        svc.get_transaction(TX_HASH)
+        self.assertEqual(len(rpc.requests), 2)
+
+    def test_rpc_head_failure_keeps_transaction(self) -> None:
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                raise ValueError("RPC error: code -32000: head unavailable.")
+            if method == "eth_getTransactionByHash":
+                return {"hash": params[0], "from": TOKEN_A, "to": TOKEN_B, "value": "0x0", "blockNumber": "0x10"}
+            if method == "eth_getTransactionReceipt":
+                return {"status": "0x1", "gasUsed": "0x5208", "blockNumber": "0x10", "logs": []}
+            raise AssertionError(method)
+
+        svc = make_service(FakeRpc(handler))
+
+        ((tx, receipt, finalized),) = svc._fetch_transactions_with_receipts([TX_HASH], "1", svc._rpc_clients[RPC_URL])
+
+        self.assertEqual((tx["hash"], receipt["gasUsed"], finalized), (TX_HASH, "0x5208", False))
+
+    def test_etherscan_head_failure_or_reuse(self) -> None:
+        svc = make_service()
+        fetched: List[str] = []
+        head_calls: List[int] = []
+
+        def get_block_number() -> Dict[str, Any]:
+            head_calls.append(1)
+            raise ValueError("Etherscan error: rate limited")
+
+        def get_transaction(tx_hash: str) -> Dict[str, Any]:
+            fetched.append(tx_hash)
+            return {"result": {"hash": tx_hash, "from": TOKEN_A, "to": TOKEN_B, "value": "0x0", "blockNumber": "0x10"}}
+
+        svc.client.get_block_number = get_block_number  # type: ignore[assignment]
+        svc.client.get_transaction = get_transaction  # type: ignore[assignment]
+        svc.client.get_transaction_receipt = lambda tx_hash: {  # type: ignore[assignment]
+            "result": {"status": "0x1", "gasUsed": "0x5208", "blockNumber": "0x10", "logs": []}
+        }
+
+        # Head lookup fails: the transaction still comes back, just uncached.
+        self.assertEqual(svc.get_transaction(TX_HASH)["receipt"]["gas_used"], 21000)
+        self.assertEqual(len(head_calls), 1)
+
+        # A freshly recorded head replaces eth_blockNumber and finalizes the pair.
+        svc.block_time_index.record_head("1", 0x10 + 64)
+        svc.get_transaction(TX_HASH)
+        svc.get_transaction(TX_HASH)
+        self.assertEqual(len(head_calls), 1)
+        self.assertEqual(len(fetched), 2)
+
+
+class FinalizedTxCacheTest(unittest.TestCase):
+    def _service(self, head: str, symbol_ok: bool) -> tuple:
+        transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return head
+            if method == "eth_getTransactionByHash":
+                return {"hash": params[0], "from": TOKEN_B, "to": TOKEN_A, "value": "0x0", "blockNumber": "0x10"}
+            if method == "eth_getTransactionReceipt":
+                return {
+                    "status": "0x1",
+                    "gasUsed": "0x5208",
+                    "blockNumber": "0x10",
+                    "logs": [
+                        {
+                            "address": TOKEN_A,
+                            "topics": [transfer_topic, "0x" + "00" * 12 + "bb" * 20, "0x" + "00" * 12 + "cc" * 20],
+                            "data": abi_uint(5),
+                        }
+                    ],
+                }
+            if method == "eth_call":
+                return aggregate3_result(
+                    svc, [(symbol_ok, abi_string(svc, "USDC")), (True, abi_uint(6)), (True, abi_string(svc, "USD Coin"))]
+                )
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+        return svc, rpc
+
+    def test_serves_finalized_summary_without_network(self) -> None:
+        svc, rpc = self._service(head=hex(0x10 + 64), symbol_ok=True)
+
+        first = svc.get_transaction_summary(TX_HASH, annotate_contracts=False, compact=True)
+        requests_after_first = len(rpc.requests)
+        second = svc.get_transaction_summary(TX_HASH, annotate_contracts=False, compact=True)
+        svc.get_transaction(TX_HASH)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(rpc.requests), requests_after_first)
+        # Different output shape: summary recomputed, raw tx + receipt reused.
+        svc.get_transaction_summary(TX_HASH, annotate_contracts=False)
+        self.assertEqual(len(rpc.requests), requests_after_first)
+
+    def test_skips_summary_cache_when_metadata_incomplete(self) -> None:
+        svc, rpc = self._service(head=hex(0x10 + 64), symbol_ok=False)
+
+        svc.get_transaction_summary(TX_HASH, annotate_contracts=False)
+        svc.get_transaction_summary(TX_HASH, annotate_contracts=False)
+
+        # Raw pair cached (one tx batch total), summary rebuilt and symbol retried.
+        self.assertEqual([r[1] for r in rpc.requests], [None, "eth_call", "eth_call"])
+
+
+class TransactionSummariesTest(unittest.TestCase):
+    def test_batches_fetches_and_shares_lookups_across_batches(self) -> None:
+        transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+        sender = "0x" + "00" * 12 + "cc" * 20
+        recipient = "0x" + "00" * 12 + "dd" * 20
+        hashes = ["0x" + f"{i:02x}" * 32 for i in range(1, 6)]
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return "0x10"
+            if method == "eth_getTransactionByHash":
+                return {"hash": params[0], "from": "0x" + "cc" * 20, "to": TOKEN_A, "value": "0x0"}
+            if method == "eth_getTransactionReceipt":
+                return {
+                    "status": "0x1",
+                    "gasUsed": "0x5208",
+                    "effectiveGasPrice": "0x1",
+                    "logs": [{"address": TOKEN_A, "topics": [transfer_topic, sender, recipient], "data": abi_uint(10**6)}],
+                }
+            if method == "eth_call" and params[0]["to"] == MULTICALL3_ADDRESS:
+                return aggregate3_result(svc, [(True, abi_string(svc, "USDC")), (True, abi_uint(6)), (True, abi_string(svc, "USD Coin"))])
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+
+        result = svc.get_transaction_summaries(
+            hashes + hashes[:1], annotate_contracts=False, batch_size=2
+        )
+
+        self.assertEqual(result["count"], 5)
+        self.assertEqual([s["tx_hash"] for s in result["summaries"]], hashes)
+        self.assertEqual(result["summaries"][4]["erc20_transfers"][0]["amount_scaled"], "1")
+        tx_batches = [r for r in rpc.requests if r[1] is None]
+        multicalls = [r for r in rpc.requests if r[1] == "eth_call"]
+        # eth_blockNumber rides the first batch; later ones reuse that head.
+        self.assertEqual([len(r[2]) for r in tx_batches], [5, 4, 2])
+        self.assertEqual(len(multicalls), 1)
+
+        compact = svc.get_transaction_summaries(hashes[:1], annotate_contracts=False, compact=True)
+        self.assertEqual(compact["summaries"][0]["counts"]["erc20_transfers"], 1)
+
+
+class BlockSummaryTest(unittest.TestCase):
+    TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+    def _block_handler(self, svc_ref: List[ContractService], block_receipts: Any) -> Callable[[str, List[Any]], Any]:
+        user = "0x" + "cc" * 20
+        pool = "0x" + "00" * 12 + "dd" * 20
+        hashes = ["0x" + f"{i:02x}" * 32 for i in range(1, 4)]
+        txs = [
+            {"hash": h, "from": user, "to": TOKEN_B, "value": "0x0", "blockNumber": "0x10"} for h in hashes
+        ]
+        receipts = [
+            {
+                "transactionHash": h,
+                "status": "0x1",
+                "gasUsed": "0x5208",
+                "effectiveGasPrice": "0x3",
+                "logs": [
+                    {
+                        "address": TOKEN_A,
+                        "topics": [self.TRANSFER_TOPIC, pool, "0x" + "00" * 12 + "cc" * 20],
+                        "data": abi_uint(10**6),
+                    }
+                ],
+            }
+            for h in hashes
+        ]
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_getBlockByNumber":
+                return {
+                    "number": "0x10",
+                    "hash": "0x" + "ee" * 32,
+                    "gasUsed": hex(3 * 21000),
+                    "baseFeePerGas": "0x1",
+                    "transactions": txs,
+                }
+            if method == "eth_getBlockReceipts":
+                return block_receipts(receipts)
+            if method == "eth_getTransactionReceipt":
+                return next(r for r in receipts if r["transactionHash"] == params[0])
+            if method == "eth_call" and params[0]["to"] == MULTICALL3_ADDRESS:
+                svc = svc_ref[0]
+                return aggregate3_result(
+                    svc, [(True, abi_string(svc, "USDC")), (True, abi_uint(6)), (True, abi_string(svc, "USD Coin"))]
+                )
+            raise AssertionError(method)
+
+        return handler
+
+    def test_summarizes_block_from_block_receipts(self) -> None:
+        svc_ref: List[ContractService] = []
+        rpc = FakeRpc(self._block_handler(svc_ref, lambda receipts: receipts))
+        svc = make_service(rpc)
+        svc_ref.append(svc)
+
+        result = svc.get_block_summary(16)
+
+        self.assertEqual([r[1] for r in rpc.requests], ["eth_getBlockByNumber", "eth_getBlockReceipts", "eth_call"])
+        self.assertEqual(result["counts"]["transactions"], 3)
+        self.assertEqual(result["fees"]["execution_fee_wei"], 3 * 21000 * 3)
+        self.assertEqual(result["fees"]["burnt_fee_wei"], 3 * 21000)
+        self.assertEqual(result["fees"]["priority_fee_wei"], 3 * 21000 * 2)
+        self.assertEqual(
+            [(r["address"], r["amount"]) for r in result["net_token_flow_by_address"]],
+            [("0x" + "cc" * 20, "+3")],
+        )
+        self.assertEqual(result["counts"]["flow_rows_total"], 2)
+
+    def test_falls_back_to_batched_receipts(self) -> None:
+        def unsupported(receipts: Any) -> Any:
+            raise ValueError("RPC error: code -32601: the method eth_getBlockReceipts does not exist.")
+
+        svc_ref: List[ContractService] = []
+        rpc = FakeRpc(self._block_handler(svc_ref, unsupported))
+        svc = make_service(rpc)
+        svc_ref.append(svc)
+
+        result = svc.get_block_summary("0x10", include_transactions=False)
+
+        self.assertIsNone(result["transactions"])
+        self.assertEqual(result["counts"]["erc20_transfers"], 3)
+        self.assertIn(("batch", "eth_getTransactionReceipt"), [(r[0], r[1]) for r in rpc.requests])
+        self.assertIn("1", svc._block_receipts_unsupported)
+
+    def test_transient_block_receipts_error_keeps_method_enabled(self) -> None:
+        def lagging(receipts: Any) -> Any:
+            raise ValueError("RPC error: code -32000: header not found.")
+
+        svc_ref: List[ContractService] = []
+        rpc = FakeRpc(self._block_handler(svc_ref, lagging))
+        svc = make_service(rpc)
+        svc_ref.append(svc)
+
+        result = svc.get_block_summary("0x10", include_transactions=False)
+
+        self.assertEqual(result["counts"]["erc20_transfers"], 3)
+        self.assertNotIn("1", svc._block_receipts_unsupported)
+
+
+class ContractCreationRpcSearchTest(unittest.TestCase):
+    def _rpc(self, deployed_at: int, head: int) -> FakeRpc:
+        creator = "0x" + "cc" * 20
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return hex(head)
+            if method == "eth_getCode":
+                block = head if params[1] == "latest" else int(params[1], 16)
+                return "0x6001" if block >= deployed_at else "0x"
+            if method == "eth_getBlockByNumber":
+                return {
+                    "timestamp": "0x64",
+                    "transactions": [
+                        {"hash": "0x" + "01" * 32, "from": TOKEN_B, "to": TOKEN_B},
+                        {"hash": "0x" + "02" * 32, "from": TOKEN_B, "to": None},
+                        {"hash": "0x" + "03" * 32, "from": creator, "to": None},
+                    ],
+                }
+            if method == "eth_getTransactionReceipt":
+                created = TOKEN_A if params[0] == "0x" + "03" * 32 else "0x" + "ee" * 20
+                return {"contractAddress": created}
+            raise AssertionError(method)
+
+        return FakeRpc(handler)
+
+    def test_finds_deployment_block_in_few_batched_rounds(self) -> None:
+        head = 20_000_000
+        for deployed_at in (0, 1, 12_345_678, head - 1, head):
+            with self.subTest(deployed_at=deployed_at):
+                rpc = self._rpc(deployed_at, head)
+                svc = make_service(rpc)
+
+                data, finalized = svc._get_contract_creation_via_rpc(TOKEN_A, "mainnet", "1", rpc)
+
+                self.assertEqual(data["block_number"], str(deployed_at))
+                self.assertEqual(finalized, head - deployed_at >= 64)
+                self.assertEqual(data["creator"], "0x" + "cc" * 20)
+                self.assertEqual(data["tx_hash"], "0x" + "03" * 32)
+                search_rounds = [r for r in rpc.requests if r[1] == "eth_getCode"]
+                self.assertLessEqual(len(search_rounds), 9)
+                receipt_calls = [r for r in rpc.requests if r[1] == "eth_getTransactionReceipt"]
+                self.assertEqual([len(r[2]) for r in receipt_calls], [2])
+
+    def test_persists_only_finalized_creation_info(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for deployed_at, head, persisted in ((100, 10_000, True), (9_990, 10_000, False)):
+                with self.subTest(deployed_at=deployed_at):
+                    rpc = self._rpc(deployed_at, head)
+                    config = Config(
+                        api_key="test",
+                        chain_id_override="1",
+                        rpc_urls={"1": RPC_URL},
+                        cache_dir=Path(tmp) / str(deployed_at),
+                    )
+                    svc = ContractService(config)
+                    svc._rpc_clients[RPC_URL] = rpc
+                    svc.client.get_contract_creation = lambda address: {"status": "0", "message": "NOTOK", "result": []}
+
+                    data = svc.get_contract_creation(TOKEN_A)
+
+                    self.assertEqual(data["block_number"], str(deployed_at))
+                    restarted = ContractService(config)
+                    self.assertEqual(restarted.creation_cache.get(TOKEN_A, "1") is not None, persisted)
+
+
+class ContractCreationsBatchTest(unittest.TestCase):
+    def test_chunks_by_five_and_falls_back_per_address(self) -> None:
+        addresses = ["0x" + f"{i:040x}" for i in range(1, 13)]
+        unknown = addresses[7]
+        requests: List[List[str]] = []
+
+        def get_contract_creations(chunk: List[str]) -> Dict[str, Any]:
+            requests.append(list(chunk))
+            rows = [
+                {"contractAddress": a, "contractCreator": TOKEN_B, "txHash": "0x" + "11" * 32, "blockNumber": "7"}
+                for a in chunk
+                if a != unknown
+            ]
+            return {"status": "1", "message": "OK", "result": rows}
+
+        svc = make_service()
+        svc.client.get_contract_creations = get_contract_creations
+        svc.creation_cache.set(addresses[0], "1", {"address": addresses[0], "source": "cache"})
+
+        result = svc.get_contract_creations(addresses + addresses[:2])
+
+        self.assertEqual([len(c) for c in requests], [5, 5, 1])
+        self.assertEqual(result["count"], 11)
+        self.assertEqual(result["creations"][0]["source"], "cache")
+        self.assertEqual([c["address"] for c in result["creations"]], [a for a in addresses if a != unknown])
+        self.assertEqual([e["address"] for e in result["errors"]], [unknown])
+        self.assertIn("RPC fallback unavailable", result["errors"][0]["error"])
+
+        svc.get_contract_creations(addresses[1:5])
+        self.assertEqual(len(requests), 3)
+
+    def test_retries_failed_chunk_per_address(self) -> None:
+        addresses = ["0x" + f"{i:040x}" for i in range(1, 6)]
+        bad = addresses[2]
+        requests: List[List[str]] = []
+
+        def get_contract_creations(chunk: List[str]) -> Dict[str, Any]:
+            requests.append(list(chunk))
+            if bad in chunk:
+                raise ValueError("Etherscan error: invalid address")
+            rows = [
+                {"contractAddress": a, "contractCreator": TOKEN_B, "txHash": "0x" + "11" * 32, "blockNumber": "7"}
+                for a in chunk
+            ]
+            return {"status": "1", "message": "OK", "result": rows}
+
+        svc = make_service()
+        svc.client.get_contract_creations = get_contract_creations
+
+        result = svc.get_contract_creations(addresses)
+
+        self.assertEqual(requests, [addresses] + [[a] for a in addresses])
+        self.assertEqual([c["address"] for c in result["creations"]], [a for a in addresses if a != bad])
+        self.assertEqual([e["address"] for e in result["errors"]], [bad])
+
+
+class DetectProxiesTest(unittest.TestCase):
+    def test_classifies_all_proxy_kinds_in_two_batches(self) -> None:
+        impl = "0x" + "12" * 20
+        beacon = "0x" + "34" * 20
+        transparent, beacon_proxy, uups, clone, plain = ("0x" + c * 20 for c in ("a1", "a2", "a3", "a4", "a5"))
+
+        def word(addr: str) -> str:
+            return "0x" + addr[2:].rjust(64, "0")
+
+        slots = {
+            (transparent, EIP1967_IMPLEMENTATION_SLOT): word(impl),
+            (beacon_proxy, EIP1967_BEACON_SLOT): word(beacon),
+            (uups, EIP1822_PROXIABLE_SLOT): word(impl),
+        }
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_getStorageAt":
+                return slots.get((params[0], params[1]), "0x" + "0" * 64)
+            if method == "eth_blockNumber":
+                return "0x100"
+            if method == "eth_getCode":
+                if params[0] == clone:
+                    return "0x363d3d373d3d3d363d73" + impl[2:] + "5af43d82803e903d91602b57fd5bf3"
+                return "0x6080"
+            if method == "eth_call":
+                self.assertEqual(params[0], {"to": beacon, "data": "0x5c60da1b"})
+                return word(impl)
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+
+        result = svc.detect_proxies([transparent, beacon_proxy, uups, clone, plain])
+
+        self.assertEqual(len(rpc.requests), 2)
+        by_addr = {p["address"]: p for p in result["proxies"]}
+        self.assertEqual(
+            {a: (p["proxy_type"], p["implementation"]) for a, p in by_addr.items()},
+            {
+                transparent: ("eip1967", impl),
+                beacon_proxy: ("eip1967_beacon", impl),
+                uups: ("eip1822", impl),
+                clone: ("eip1167", impl),
+                plain: (None, None),
+            },
+        )
+        self.assertEqual(by_addr[beacon_proxy]["beacon"], beacon)
+        self.assertEqual(by_addr[uups]["verified_block"], 0x100)
+        self.assertEqual(svc.proxy_cache.get(clone, "1")["proxy_type"], "eip1167")
+        self.assertFalse(svc.detect_proxy(plain)["is_proxy"])
+
+    def test_reverting_beacon_leaves_other_beacons_resolved(self) -> None:
+        impl, good_beacon, bad_beacon = ("0x" + c * 20 for c in ("12", "34", "56"))
+        good_proxy, bad_proxy = ("0x" + c * 20 for c in ("c1", "c2"))
+        beacon_of = {good_proxy: good_beacon, bad_proxy: bad_beacon}
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_getStorageAt":
+                if params[1] == EIP1967_BEACON_SLOT:
+                    return "0x" + beacon_of[params[0]][2:].rjust(64, "0")
+                return "0x" + "0" * 64
+            if method == "eth_blockNumber":
+                return "0x100"
+            if method == "eth_getCode":
+                return "0x6080"
+            if method == "eth_call":
+                if params[0]["to"] == bad_beacon:
+                    raise ValueError("RPC error: execution reverted")
+                return "0x" + impl[2:].rjust(64, "0")
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        result = make_service(rpc).detect_proxies([good_proxy, bad_proxy])
+
+        self.assertEqual([p["implementation"] for p in result["proxies"]], [impl, None])
+        self.assertEqual(result["proxies"][1]["beacon"], bad_beacon)
+
+    def test_etherscan_path_reads_fallback_slots_only_when_needed(self) -> None:
+        impl = "0x" + "12" * 20
+        transparent, uups, plain = ("0x" + c * 20 for c in ("b1", "b2", "b3"))
+        slots = {
+            (transparent, EIP1967_IMPLEMENTATION_SLOT): "0x" + impl[2:].rjust(64, "0"),
+            (uups, EIP1822_PROXIABLE_SLOT): "0x" + impl[2:].rjust(64, "0"),
+        }
+        reads: List[Tuple[str, str]] = []
+        svc = make_service()
+
+        def get_storage_at(address: str, slot: str, tag: str = "latest") -> Dict[str, Any]:
+            reads.append((address, slot))
+            return {"result": slots.get((address, slot), "0x" + "0" * 64)}
+
+        def get_code(address: str, tag: str = "latest") -> Dict[str, Any]:
+            reads.append((address, "code"))
+            return {"result": "0x6080"}
+
+        svc.client.get_storage_at = get_storage_at  # type: ignore[assignment]
+        svc.client.get_code = get_code  # type: ignore[assignment]
+        svc.client.get_block_number = lambda: self.fail("head read")  # type: ignore[assignment]
+
+        result = svc.detect_proxies([transparent, uups, plain])
+
+        per_address = {addr: sum(1 for a, _ in reads if a == addr) for addr in (transparent, uups, plain)}
+        self.assertEqual(per_address, {transparent: 3, uups: 6, plain: 6})
+        self.assertEqual(
+            [(p["proxy_type"], p["implementation"]) for p in result["proxies"]],
+            [("eip1967", impl), ("eip1822", impl), (None, None)],
+        )
+
+
+class ProxyCacheRevalidationTest(unittest.TestCase):
+    def _service(self, upgrade_logs: List[Dict[str, Any]]) -> tuple:
+        new_impl = "0x" + "56" * 20
+        new_admin = "0x" + "78" * 20
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return "0x200"
+            if method == "eth_getLogs":
+                self.assertEqual(params[0]["fromBlock"], "0x101")
+                self.assertEqual(params[0]["address"], [TOKEN_A])
+                self.assertIn(ADMIN_CHANGED_TOPIC, params[0]["topics"][0])
+                return upgrade_logs
+            if method == "eth_getStorageAt":
+                if params[1] == EIP1967_IMPLEMENTATION_SLOT:
+                    return "0x" + new_impl[2:].rjust(64, "0")
+                if params[1] == EIP1967_ADMIN_SLOT:
+                    return "0x" + new_admin[2:].rjust(64, "0")
+                return "0x" + "0" * 64
+            if method == "eth_getCode":
+                return "0x6080"
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+        svc.proxy_cache.set(
+            TOKEN_A,
+            "1",
+            {"address": TOKEN_A, "is_proxy": True, "implementation": TOKEN_B, "proxy_type": "eip1967", "verified_block": 0x100},
+        )
+        return svc, rpc, new_impl
+
+    def test_no_upgrade_logs_advances_verified_block(self) -> None:
+        svc, rpc, _ = self._service([])
+
+        info = svc._cached_proxy_info(TOKEN_A, "1", "mainnet")
+        svc._cached_proxy_info(TOKEN_A, "1", "mainnet")
+
+        self.assertEqual(info["implementation"], TOKEN_B)
+        self.assertEqual(svc.proxy_cache.get(TOKEN_A, "1")["verified_block"], 0x200)
+        self.assertEqual(len(rpc.requests), 1)
+
+    def test_upgrade_log_triggers_redetection(self) -> None:
+        svc, rpc, new_impl = self._service([{"topics": ["0xbc7cd75a20ee27fd9adebab32041f755214dbc6bffa90cc0225b39da2e5c2d3b"]}])
+
+        info = svc._cached_proxy_info(TOKEN_A, "1", "mainnet")
+
+        self.assertEqual(info["implementation"], new_impl)
+        self.assertEqual(svc.proxy_cache.get(TOKEN_A, "1")["implementation"], new_impl)
+        self.assertEqual(len(rpc.requests), 2)
+
+    def test_keeps_unverified_and_non_proxy_entries_off_disk(self) -> None:
+        impl = "0x" + "12" * 20
+        proxy, plain = TOKEN_A, TOKEN_B
+        with tempfile.TemporaryDirectory() as tmp:
+            svc = ContractService(Config(api_key="test", chain_id_override="1", rpc_urls={}, cache_dir=Path(tmp)))
+            svc.chains.resolve = lambda network: (str(network).lower(), resolve_chain_id(str(network)), {})
+            svc.client.get_storage_at = lambda address, slot, tag="latest": {  # type: ignore[assignment]
+                "result": "0x" + impl[2:].rjust(64, "0")
+                if (address, slot) == (proxy, EIP1967_IMPLEMENTATION_SLOT)
+                else "0x" + "0" * 64
+            }
+            svc.client.get_code = lambda address, tag="latest": {"result": "0x6080"}  # type: ignore[assignment]
+
+            # Etherscan path, no known head: verified_block is None.
+            svc.detect_proxies([proxy, plain])
+            self.assertEqual(svc._cached_proxy_info(proxy, "1", "mainnet")["implementation"], impl)
+            self.assertFalse(svc._cached_proxy_info(plain, "1", "mainnet")["is_proxy"])
+            on_disk = Path(tmp) / "proxies.json"
+            self.assertFalse(on_disk.exists() and json.loads(on_disk.read_text()))
+
+            # Non-proxy entries expire; unverified proxies are re-detected once RPC exists.
+            svc._proxy_checked_at[f"1:{plain}"] -= PROXY_REVALIDATE_INTERVAL
+            self.assertIsNone(svc._cached_proxy_info(plain, "1", "mainnet"))
+            svc._rpc_clients[RPC_URL] = FakeRpc(lambda method, params: self.fail(method))
+            svc.config.rpc_urls["1"] = RPC_URL
+            self.assertIsNone(svc._cached_proxy_info(proxy, "1", "mainnet"))
+
+    def test_admin_change_log_triggers_redetection(self) -> None:
+        svc, _, _ = self._service([{"topics": [ADMIN_CHANGED_TOPIC]}])
+
+        info = svc._cached_proxy_info(TOKEN_A, "1", "mainnet")
+
+        self.assertEqual(info["admin"], "0x" + "78" * 20)
+
+
+class CallFunctionConcurrencyTest(unittest.TestCase):
+    def test_overlaps_eth_call_proxy_detection_and_abi_fetches(self) -> None:
+        for default_rpc_only in (False, True):
+            with self.subTest(default_rpc_only=default_rpc_only):
+                self._check_overlap(default_rpc_only)
+
+    def _check_overlap(self, default_rpc_only: bool) -> None:
+        proxy, impl = TOKEN_A, TOKEN_B
+        call_sent = threading.Event()
+        impl_fetch_started = threading.Event()
+        observed: Dict[str, bool] = {}
+
+        def handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_call":
+                call_sent.set()
+                return abi_uint(42)
+            if method == "eth_getStorageAt":
+                if params[1] == EIP1967_IMPLEMENTATION_SLOT:
+                    return "0x" + impl[2:].rjust(64, "0")
+                return "0x" + "0" * 64
+            if method == "eth_getCode":
+                return "0x6080"
+            if method == "eth_blockNumber":
+                return "0x100"
+            raise AssertionError(method)
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+        if default_rpc_only:
+            # RPC_URL only: the call and proxy detection must both use it.
+            svc.config.rpc_urls.clear()
+            svc.config.rpc_url_default = RPC_URL
+            svc.client.get_storage_at = lambda *a, **k: self.fail("detection left the default RPC")  # type: ignore[assignment]
+        balance_of = {
+            "type": "function",
+            "name": "balanceOf",
+            "inputs": [{"name": "owner", "type": "address"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+        }
+
+        def fetch_contract(address: str, network: Optional[str] = None) -> Dict[str, Any]:
+            if address == impl:
+                impl_fetch_started.set()
+                return {"address": impl, "abi": [balance_of]}
+            # The proxy's own (slow) Etherscan fetch: by the time it returns,
+            # the eth_call and the implementation fetch are already in flight.
+            observed["call"] = call_sent.wait(2)
+            observed["impl"] = impl_fetch_started.wait(2)
+            return {"address": proxy, "abi": []}
+
+        svc.fetch_contract = fetch_contract
+
+        result = svc.call_function(proxy, function="balanceOf(address)", args=[TOKEN_B])
+
+        self.assertEqual(observed, {"call": True, "impl": True})
+        self.assertTrue(result["decoded"]["ok"])
+        self.assertEqual(result["decoded"]["source"], "implementation")
+        self.assertEqual(result["decoded"]["outputs"][0]["value"], 42)
+        self.assertIn("eth_getStorageAt", [call[0] for r in rpc.requests if r[1] is None for call in r[2]])
+
+
+class SyntheticChain:
+    """Mainnet-shaped block timestamps for block-by-time tests."""
+
+    GENESIS_TS = 1_438_269_973
+    MERGE = 15_537_394
+    HEAD = 21_000_000
+
+    def _ts(self, number: int) -> int:
+        # ~13s irregular blocks before the merge, exact 12s slots after it.
+        if number < self.MERGE:
+            return self.GENESIS_TS + number * 13 + (number * 7919) % 11
+        return self._ts(self.MERGE - 1) + 12 * (number - self.MERGE + 1)
+
+    def _rpc(self, extra: Optional[Callable[[str, List[Any]], Any]] = None) -> FakeRpc:
+        def handler(method: str, params: List[Any]) -> Any:
+            if method != "eth_getBlockByNumber" and extra:
+                return extra(method, params)
+            assert method == "eth_getBlockByNumber", method
+            number = self.HEAD if params[0] == "latest" else int(params[0], 16)
+            return {"number": hex(number), "timestamp": hex(self._ts(number)), "transactions": ["0x01"] * (number % 3)}
+
+        return FakeRpc(handler)
+
+
+class BlockByTimeTest(SyntheticChain, unittest.TestCase):
+
+    def _expected(self, target: int, closest: str) -> int:
+        # Brute-force reference: first block failing the predicate.
+        lo, hi = 0, self.HEAD + 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            holds = self._ts(mid) <= target if closest == "before" else self._ts(mid) < target
+            if holds:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1 if closest == "before" else lo
+
+    def test_interpolation_search_and_repeat_lookups_from_index(self) -> None:
+        targets = [
+            self._ts(1_000_000) + 5,
+            self._ts(14_000_000),
+            self._ts(20_123_456),
+            self._ts(20_123_456) + 7,
+            "2024-01-01T00:00:00Z",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            config = Config(api_key="test", chain_id_override="1", rpc_urls={"1": RPC_URL}, cache_dir=Path(tmp))
+            for target in targets:
+                for closest in ("before", "after"):
+                    with self.subTest(target=target, closest=closest):
+                        rpc = self._rpc()
+                        svc = ContractService(config)
+                        svc._rpc_clients[RPC_URL] = rpc
+
+                        result = svc.get_block_by_time(target, closest=closest)
+
+                        expected = self._expected(result["timestamp"], closest)
+                        self.assertEqual(result["block_number"], expected)
+                        self.assertEqual(result["block_timestamp"], self._ts(expected))
+                        self.assertLessEqual(len(rpc.requests), 5)
+                        self.assertEqual(result["rpc_batches"], len(rpc.requests))
+
+                        # Same lookup again (fresh process): answered from the index.
+                        rpc = self._rpc()
+                        restarted = ContractService(config)
+                        restarted._rpc_clients[RPC_URL] = rpc
+                        again = restarted.get_block_by_time(target, closest=closest)
+                        self.assertEqual(again["block_number"], expected)
+                        self.assertEqual((again["source"], rpc.requests), ("index", []))
+
+    def test_bounds(self) -> None:
+        svc = make_service(self._rpc())
+        latest = svc.get_block_by_time(self._ts(self.HEAD) + 100)
+        self.assertEqual(latest["block_number"], self.HEAD)
+        with self.assertRaises(ValueError):
+            svc.get_block_by_time(self._ts(self.HEAD) + 100, closest="after")
+        with self.assertRaises(ValueError):
+            svc.get_block_by_time(self.GENESIS_TS - 1)
+        self.assertEqual(svc.get_block_by_time(self.GENESIS_TS - 1, closest="after")["block_number"], 0)
+
+    def test_null_probes_fail_instead_of_looping(self) -> None:
+        def handler(method: str, params: List[Any]) -> Any:
+            if params[0] in ("latest", "0x0"):
+                number = self.HEAD if params[0] == "latest" else 0
+                return {"number": hex(number), "timestamp": hex(self._ts(number))}
+            return None  # lagging / pruned node
+
+        rpc = FakeRpc(handler)
+        svc = make_service(rpc)
+        with self.assertRaisesRegex(ValueError, "no progress"):
+            svc.get_block_by_time(self._ts(14_000_000))
+        self.assertLessEqual(len(rpc.requests), 2)
+
+
+class TimeRangeQueriesTest(SyntheticChain, unittest.TestCase):
+    def test_daily_series_resolves_all_points_in_shared_batches(self) -> None:
+        def eth_call(method: str, params: List[Any]) -> Any:
+            self.assertEqual(method, "eth_call")
+            return abi_uint(int(params[1], 16))
+
+        rpc = self._rpc(eth_call)
+        svc = make_service(rpc)
+        svc.fetch_contract = lambda address, network=None: {"address": address, "abi": []}
+
+        result = svc.call_function_series(
+            TOKEN_A, data="0x18160ddd", from_time="2023-11-01", to_time="2023-12-01", interval="daily"
+        )
+
+        self.assertEqual(result["count"], 31)
+        self.assertEqual(result["interval"], 86400)
+        for point in result["series"]:
+            self.assertLessEqual(point["block_timestamp"], point["timestamp"])
+            self.assertGreater(self._ts(point["block_number"] + 1), point["timestamp"])
+            self.assertEqual(point["data"], abi_uint(point["block_number"]))
+        block_batches = [r for r in rpc.requests if r[1] is None and r[2][0][0] == "eth_getBlockByNumber"]
+        self.assertLessEqual(len(block_batches), 5)
+
+    def test_query_logs_time_bounds(self) -> None:
+        filters: List[Dict[str, Any]] = []
+
+        def get_logs(method: str, params: List[Any]) -> Any:
+            self.assertEqual(method, "eth_getLogs")
+            filters.append(params[0])
+            return []
+
+        svc = make_service(self._rpc(get_logs))
+        start, end = self._ts(20_000_000), self._ts(20_000_100) + 5
+
+        result = svc.query_logs(TOKEN_A, from_time=start, to_time=end)
+
+        self.assertEqual((result["from_block"], result["to_block"]), (20_000_000, 20_000_100))
+        self.assertEqual((filters[0]["fromBlock"], filters[-1]["toBlock"]), (hex(20_000_000), hex(20_000_100)))
+
+
+class ColumnarSeriesTest(unittest.TestCase):
+    ABI = [
+        {
+            "type": "function",
+            "name": "getReserves",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [
+                {"name": "reserve0", "type": "uint112"},
+                {"name": "reserve1", "type": "uint112"},
+                {"name": "blockTimestampLast", "type": "uint32"},
+            ],
+        },
+        {
+            "type": "function",
+            "name": "slot0",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "", "type": "tuple", "components": [{"name": "tick", "type": "int24"}, {"name": "fees", "type": "uint16[2]"}]}],
+        },
+        {"type": "function", "name": "name", "stateMutability": "view", "inputs": [], "outputs": [{"name": "", "type": "string"}]},
+    ]
+
+    def _service(self, handler: Callable[[int, str], str]) -> ContractService:
+        def rpc_handler(method: str, params: List[Any]) -> Any:
+            if method == "eth_blockNumber":
+                return hex(1_000)
+            return handler(int(params[1], 16), params[0]["data"])
+
+        svc = make_service(FakeRpc(rpc_handler))
+        svc.fetch_contract = lambda address, network=None: {"address": address, "abi": self.ABI}
+        return svc
+
+    def test_reserves_columns_match_row_decoding(self) -> None:
+        def reserves(block: int, data: str) -> str:
+            if block == 120:
+                return "0x"  # reverted point
+            return abi_uint(block * 10**18) + abi_uint(block)[2:] + abi_uint(1_700_000_000 + block)[2:]
+
+        svc = self._service(reserves)
+        kwargs = dict(function="getReserves()", from_block=100, to_block=140, stride=10, decimals={"reserve0": 18})
+        rows = svc.call_function_series(TOKEN_A, **kwargs)
+        result = svc.call_function_series(TOKEN_A, columnar=True, **kwargs)
+
+        self.assertNotIn("series", result)
+        self.assertEqual(result["count"], 5)
+        columns = result["columns"]
+        self.assertEqual(list(columns), ["block_number", "reserve0", "reserve1", "blockTimestampLast"])
+        self.assertEqual(columns["block_number"], [100, 110, 120, 130, 140])
+        for i, point in enumerate(rows["series"]):
+            outputs = point["decoded"]["outputs"]
+            if not point["decoded"]["ok"]:
+                self.assertEqual([columns[k][i] for k in list(columns)[1:]], [None, None, None])
+                continue
+            self.assertEqual([columns[o["name"]][i] for o in outputs], [o["value"] for o in outputs])
+            self.assertEqual(result["scaled"]["reserve0"][i], outputs[0]["value_scaled"])
+        self.assertEqual(result["decimals"], {"reserve0": 18})
+        self.assertEqual(result["invalid_points"], [{"block_number": 120, "data": "0x"}])
+
+    def test_nested_static_leaves_and_rejects_dynamic_outputs(self) -> None:
+        svc = self._service(lambda block, data: abi_uint((1 << 256) - block) + abi_uint(5)[2:] + abi_uint(30)[2:])
+
+        result = svc.call_function_series(TOKEN_A, function="slot0()", from_block=7, to_block=8, columnar=True)
+
+        self.assertEqual(
+            result["columns"],
+            {"block_number": [7, 8], "output0.tick": [-7, -8], "output0.fees[0]": [5, 5], "output0.fees[1]": [30, 30]},
+        )
+        with self.assertRaises(ValueError):
+            svc.call_function_series(TOKEN_A, function="name()", from_block=7, to_block=8, columnar=True)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_to_numpy(self) -> None:
+        from app.columnar import to_numpy
+
+        result = {
+            "columnar": True,
+            "columns": {"block_number": [1, 2], "reserve0": [10**30, None]},
+            "scaled": {"reserve0": ["1000000000000", None]},
+        }
+        arrays = to_numpy(result)
+        self.assertEqual(arrays["block_number"].dtype.name, "int64")
+        self.assertEqual(arrays["reserve0"].dtype.name, "object")
+        self.assertEqual(arrays["reserve0_scaled"][0], 1e12)
+
+
+class GetBlocksTest(SyntheticChain, unittest.TestCase):
+    def test_fetches_range_in_batches_and_feeds_time_index(self) -> None:
+        rpc = self._rpc(lambda method, params: hex(self.HEAD))
+        svc = make_service(rpc)
+        offered: List[Tuple[int, int]] = []
+        add_many = svc.block_time_index.add_many
+
+        def record(chain_id: str, samples: List[Tuple[int, int]], pinned: bool = False) -> None:
+            offered.extend(samples)
+            add_many(chain_id, samples, pinned)
+
+        svc.block_time_index.add_many = record  # type: ignore[method-assign]
+
+        result = svc.get_blocks(20_000_000, 20_000_120, header_only=True)
+
+        self.assertEqual(result["count"], 121)
+        self.assertEqual(
+            [svc._hex_to_int(b.number, "number") for b in result["blocks"]], list(range(20_000_000, 20_000_121))
+        )
+        row = result["blocks"][0].to_dict()
+        self.assertNotIn("transactions", row)
+        self.assertEqual(list(row)[-1], "transaction_count")
+        self.assertEqual([b.transaction_count for b in result["blocks"][:3]], [20_000_000 % 3, 20_000_001 % 3, 20_000_002 % 3])
+        # Batches are pipelined, so they may reach the node in any order.
+        self.assertEqual(sorted(len(r[2]) for r in rpc.requests if r[0] == "batch"), [21, 50, 50])
+        # Batch endpoints only; 121 twelve-second blocks fit in one sample spacing.
+        self.assertEqual(
+            sorted(n for n, _ in offered), [20_000_000, 20_000_049, 20_000_050, 20_000_099, 20_000_100, 20_000_120]
+        )
+        self.assertEqual(svc.block_time_index.size("1"), 1)
+
+    def test_to_block_is_clamped_to_head(self) -> None:
+        svc = make_service(self._rpc(lambda method, params: hex(self.HEAD)))
+        blocks = list(svc.iter_blocks(self.HEAD - 2, "latest"))
+        self.assertEqual([b.number for b in blocks], [hex(n) for n in range(self.HEAD - 2, self.HEAD + 1)])
+        self.assertEqual(svc.get_blocks(self.HEAD - 1, self.HEAD + 50)["to_block"], self.HEAD)
+
+
+class RecordsTest(unittest.TestCase):
+    def test_log_rows_are_slotted_and_materialize_to_the_public_shape(self) -> None:
+        raw = {
+            "address": TOKEN_A,
+            "topics": ["0x" + "00" * 32],
+            "data": "0x",
+            "blockNumber": "0x10",
+            "blockHash": "0x" + "ab" * 32,
+            "transactionHash": TX_HASH,
+            "transactionIndex": "0x0",
+            "logIndex": "0x1",
+            "removed": False,
+        }
+        svc = make_service(FakeRpc(lambda m, p: [raw] if m == "eth_getLogs" else hex(100)))
+
+        result = svc.query_logs(TOKEN_A, from_block=0, to_block=10)
+
+        self.assertIsInstance(result["logs"][0], LogRecord)
+        self.assertFalse(hasattr(result["logs"][0], "__dict__"))
+        self.assertEqual(
+            materialize(result)["logs"][0],
+            {
+                "address": TOKEN_A,
+                "topics": raw["topics"],
+                "data": "0x",
+                "block_number": "0x10",
+                "tx_hash": TX_HASH,
+                "log_index": "0x1",
+                "time_stamp": None,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()